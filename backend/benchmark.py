@@ -0,0 +1,224 @@
+"""
+In-process load test for the scoring API in main.py.
+
+Drives the FastAPI app through httpx's ASGI transport (no sockets, no uvicorn) with
+synthetic payloads built from each model's feature list, and reports throughput and
+p50 / p95 / p99 latency per model for three scenarios:
+
+    single      one request at a time                       POST /predict/{model}
+    concurrent  --concurrency requests in flight             POST /predict/{model}
+    batch       --batch-size rows per request, sequential    POST /predict/{model}/batch
+
+Every payload is distinct, so the prediction cache never short-circuits a request.
+
+Needs the dev requirements (httpx): pip install -r requirements-dev.txt
+
+Usage (run from backend/, next to the .pkl files):
+    python benchmark.py                                 # all models, writes benchmark_results.json
+    python benchmark.py --save-baseline                 # ... and copies it to benchmark_baseline.json
+    python benchmark.py --compare benchmark_baseline.json --fail-on-regression
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import sys
+import time
+import numpy as np
+import httpx
+
+import main
+
+SCENARIOS = ("single", "concurrent", "batch")
+
+# Compared against a baseline: latency may grow / throughput may drop by this fraction
+DEFAULT_THRESHOLD = 0.20
+LATENCY_KEYS = ("p50_ms", "p95_ms", "p99_ms")
+
+
+# ---------------------------------------------------------
+# ✅ Synthetic payloads
+# ---------------------------------------------------------
+def synthetic_rows(features: list, n: int, seed: int) -> list:
+    """n feature dicts with distinct values in [0, 100) for every model feature."""
+    values = np.random.default_rng(seed).random((n, len(features))) * 100
+    return [dict(zip(features, map(float, row))) for row in values]
+
+
+def summarize(latencies: list, elapsed: float, requests: int, rows: int, errors: int) -> dict:
+    ms = np.asarray(latencies, dtype=np.float64) * 1000
+    p50, p95, p99 = np.percentile(ms, [50, 95, 99]) if ms.size else (0.0, 0.0, 0.0)
+    return {
+        "requests": requests,
+        "rows": rows,
+        "errors": errors,
+        "elapsed_s": round(elapsed, 4),
+        "requests_per_s": round(requests / elapsed, 2) if elapsed else 0.0,
+        "rows_per_s": round(rows / elapsed, 2) if elapsed else 0.0,
+        "mean_ms": round(float(ms.mean()), 3) if ms.size else 0.0,
+        "p50_ms": round(float(p50), 3),
+        "p95_ms": round(float(p95), 3),
+        "p99_ms": round(float(p99), 3),
+        "max_ms": round(float(ms.max()), 3) if ms.size else 0.0,
+    }
+
+
+# ---------------------------------------------------------
+# ✅ Scenarios
+# ---------------------------------------------------------
+async def _timed_post(client: httpx.AsyncClient, url: str, payload, latencies: list) -> bool:
+    started = time.perf_counter()
+    response = await client.post(url, json=payload)
+    latencies.append(time.perf_counter() - started)
+    return response.status_code == 200
+
+
+async def run_single(client, model: str, payloads: list) -> dict:
+    latencies, errors = [], 0
+    started = time.perf_counter()
+    for payload in payloads:
+        errors += not await _timed_post(client, f"/predict/{model}", payload, latencies)
+    return summarize(latencies, time.perf_counter() - started, len(payloads), len(payloads), errors)
+
+
+async def run_concurrent(client, model: str, payloads: list, concurrency: int) -> dict:
+    latencies, errors = [], 0
+    pending = iter(payloads)
+
+    async def worker():
+        nonlocal errors
+        for payload in pending:   # shared iterator: each payload is sent exactly once
+            errors += not await _timed_post(client, f"/predict/{model}", payload, latencies)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return summarize(latencies, time.perf_counter() - started, len(payloads), len(payloads), errors)
+
+
+async def run_batch(client, model: str, payloads: list, batch_size: int) -> dict:
+    latencies, errors = [], 0
+    batches = [payloads[i:i + batch_size] for i in range(0, len(payloads), batch_size)]
+    started = time.perf_counter()
+    for batch in batches:
+        errors += not await _timed_post(client, f"/predict/{model}/batch", {"rows": batch}, latencies)
+    return summarize(latencies, time.perf_counter() - started, len(batches), len(payloads), errors)
+
+
+async def benchmark(models: list, requests: int, concurrency: int, batch_size: int, warmup: int) -> dict:
+    results = {}
+    # ASGITransport does not send lifespan events; run them so warm-up / executors behave as in production
+    async with main.app.router.lifespan_context(main.app):
+        transport = httpx.ASGITransport(app=main.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://benchmark") as client:
+            for seed, model in enumerate(models):
+                try:
+                    entry = await main.registry.aget(model)
+                except Exception as e:
+                    print(f"⚠️ Skipping '{model}': {e}", file=sys.stderr)
+                    continue
+
+                features = entry.layout.features
+                for payload in synthetic_rows(features, warmup, seed=10_000 + seed):
+                    await client.post(f"/predict/{model}", json=payload)
+
+                rows = lambda scenario: synthetic_rows(features, requests, seed=seed * 10 + scenario)
+                results[model] = {
+                    "version": entry.version,
+                    "single": await run_single(client, model, rows(0)),
+                    "concurrent": await run_concurrent(client, model, rows(1), concurrency),
+                    "batch": await run_batch(client, model, rows(2), batch_size),
+                }
+    return results
+
+
+# ---------------------------------------------------------
+# ✅ Baseline comparison
+# ---------------------------------------------------------
+def compare(current: dict, baseline: dict, threshold: float) -> list:
+    """Regressions as (model, scenario, metric, baseline value, current value)."""
+    regressions = []
+    for model, scenarios in current["results"].items():
+        for scenario in SCENARIOS:
+            now = scenarios.get(scenario)
+            before = baseline.get("results", {}).get(model, {}).get(scenario)
+            if not now or not before:
+                continue
+            for key in LATENCY_KEYS:
+                if before[key] and now[key] > before[key] * (1 + threshold):
+                    regressions.append((model, scenario, key, before[key], now[key]))
+            if before["rows_per_s"] and now["rows_per_s"] < before["rows_per_s"] * (1 - threshold):
+                regressions.append((model, scenario, "rows_per_s", before["rows_per_s"], now["rows_per_s"]))
+            if now["errors"] > before["errors"]:
+                regressions.append((model, scenario, "errors", before["errors"], now["errors"]))
+    return regressions
+
+
+def print_report(report: dict):
+    print(f"{'model':<12} {'scenario':<11} {'req/s':>9} {'rows/s':>10} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'errors':>6}")
+    for model, scenarios in report["results"].items():
+        for scenario in SCENARIOS:
+            r = scenarios[scenario]
+            print(f"{model:<12} {scenario:<11} {r['requests_per_s']:>9.1f} {r['rows_per_s']:>10.1f} "
+                  f"{r['p50_ms']:>8.2f} {r['p95_ms']:>8.2f} {r['p99_ms']:>8.2f} {r['errors']:>6}")
+
+
+def main_cli(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="In-process latency / throughput benchmark for main.py")
+    parser.add_argument("--models", nargs="+", default=list(main.MODEL_ARTIFACTS))
+    parser.add_argument("--requests", type=int, default=300, help="payloads per scenario and model")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--batch-size", type=int, default=50)
+    parser.add_argument("--warmup", type=int, default=20)
+    parser.add_argument("--out", default="benchmark_results.json")
+    parser.add_argument("--save-baseline", nargs="?", const="benchmark_baseline.json", default=None,
+                        help="also write the results as the new baseline")
+    parser.add_argument("--compare", metavar="BASELINE", help="baseline JSON to compare against")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="allowed relative slowdown before a metric counts as a regression")
+    parser.add_argument("--fail-on-regression", action="store_true")
+    args = parser.parse_args(argv)
+
+    unknown = [m for m in args.models if m not in main.registry]
+    if unknown:
+        parser.error(f"unknown model(s): {unknown}. Available: {main.registry.names()}")
+
+    results = asyncio.run(benchmark(args.models, args.requests, args.concurrency, args.batch_size, args.warmup))
+    report = {
+        "created_at": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpus": os.cpu_count(),
+        "config": {
+            "requests": args.requests,
+            "concurrency": args.concurrency,
+            "batch_size": args.batch_size,
+            "warmup": args.warmup,
+        },
+        "results": results,
+    }
+    print_report(report)
+
+    for path in filter(None, (args.out, args.save_baseline)):
+        with open(path, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"💾 Results written to {path}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        if baseline.get("config") != report["config"]:
+            print("⚠️ Baseline was recorded with a different configuration; comparison is approximate.")
+        regressions = compare(report, baseline, args.threshold)
+        for model, scenario, metric, before, now in regressions:
+            print(f"❌ REGRESSION {model}/{scenario} {metric}: {before} → {now}")
+        if not regressions:
+            print(f"✅ No regressions beyond {args.threshold:.0%} against {args.compare}")
+        if regressions and args.fail_on_regression:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main_cli())
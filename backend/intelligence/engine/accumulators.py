@@ -0,0 +1,478 @@
+# backend/intelligence/engine/accumulators.py
+
+"""
+Single-pass, per-player accumulators for every batting and bowling metric.
+
+Each accumulator consumes innings one at a time and keeps only sufficient statistics
+(sums, counts, band counts, exact moments, pressure-bucket aggregates), so players
+can be scored straight from a generator without materializing innings lists.
+The scores come from the same *_from_totals / *_from_stats functions the list-based
+metrics use, so the two paths cannot drift apart.
+
+Parity check against the list-based metrics (run from the repo root):
+    python3 -m backend.intelligence.engine.accumulators
+"""
+
+import math
+from typing import Dict, Iterable, Tuple
+
+from backend.intelligence.engine.batting_scores import (
+    OPPOSITION_TIER_WEIGHTS,
+    base_skill_from_totals,
+    consistency_from_stats,
+    opposition_quality_from_totals
+)
+from backend.intelligence.engine.pressure_score_engine import compute_total_pressure_score
+from backend.intelligence.metrics.base_bowling import base_bowling_skill_from_totals
+from backend.intelligence.metrics.consistency_bowling import consistency_bowling_from_stats
+from backend.intelligence.metrics.opposition_bowling import (
+    TIER_WEIGHTS as BOWLING_TIER_WEIGHTS,
+    opposition_quality_bowling_from_totals,
+    opposition_spell_score
+)
+from backend.intelligence.metrics.pressure_bowling import (
+    pressure_bowling_from_totals,
+    pressure_spell_score
+)
+from backend.intelligence.models.bowling_innings import BowlingInnings
+from backend.intelligence.models.innings import Innings
+from backend.intelligence.rules.pressure_bits import BUCKETS, bucket_mask
+
+
+class Moments:
+    """
+    Running count / sum / sum of squares, kept exact.
+
+    Float running variance (e.g. Welford) lands an ulp off on exact band edges: wickets
+    [1, 1, 0, 4] give 1.4999999999999998 instead of 1.5. Every float is an integer over
+    a power of two, so the sums are kept as integers scaled by 2**shift (shift = the
+    largest exponent seen so far), and the stdevs reproduce statistics.pstdev / stdev
+    bit for bit: the band a player falls in never differs from the list-based metrics.
+    """
+
+    __slots__ = ("n", "shift", "total", "total_sq")
+
+    def __init__(self):
+        self.n = 0
+        self.shift = 0
+        self.total = 0          # sum(x)   * 2**shift
+        self.total_sq = 0       # sum(x^2) * 2**(2 * shift)
+
+    def add(self, x):
+        numerator, denominator = x.as_integer_ratio()
+        shift = denominator.bit_length() - 1
+        if shift > self.shift:
+            self.total <<= shift - self.shift
+            self.total_sq <<= 2 * (shift - self.shift)
+            self.shift = shift
+        self.n += 1
+        self.total += numerator << (self.shift - shift)
+        self.total_sq += (numerator * numerator) << 2 * (self.shift - shift)
+
+    def _sqrt_variance(self, divisor: int) -> float:
+        # sum of squared deviations = (n * sum(x^2) - sum(x)^2) / (n * 4**shift)
+        ss = self.n * self.total_sq - self.total * self.total
+        return _sqrt_of_fraction(ss, self.n * divisor << 2 * self.shift)
+
+    def pstdev(self) -> float:
+        """Population standard deviation (statistics.pstdev)."""
+        return self._sqrt_variance(self.n) if self.n else 0.0
+
+    def stdev(self) -> float:
+        """Sample standard deviation (statistics.stdev); needs n >= 2."""
+        return self._sqrt_variance(self.n - 1)
+
+    def to_state(self) -> list:
+        return [self.n, self.shift, self.total, self.total_sq]
+
+    @classmethod
+    def from_state(cls, state: list) -> "Moments":
+        moments = cls()
+        moments.n, moments.shift, moments.total, moments.total_sq = state
+        return moments
+
+
+# Bits of precision for the square root: enough to round correctly to a double
+_SQRT_BITS = 2 * 53 + 3
+
+
+def _sqrt_of_fraction(n: int, m: int) -> float:
+    """Correctly rounded sqrt(n / m) for integers n >= 0, m > 0 (as statistics.pstdev does it)."""
+    if n == 0:
+        return 0.0
+    q = (n.bit_length() - m.bit_length() - _SQRT_BITS) // 2
+    if q >= 0:
+        return float(_isqrt_round_to_odd(n, m << 2 * q) << q)
+    return _isqrt_round_to_odd(n << -2 * q, m) / (1 << -q)
+
+
+def _isqrt_round_to_odd(n: int, m: int) -> int:
+    a = math.isqrt(n // m)
+    return a | (a * a * m != n)
+
+
+class PressureBucket:
+    """Runs / balls / innings for one batting pressure situation."""
+
+    __slots__ = ("runs", "balls", "innings")
+
+    def __init__(self):
+        self.runs = 0
+        self.balls = 0
+        self.innings = 0
+
+    def add(self, inn: Innings):
+        self.runs += inn.runs
+        self.balls += inn.balls
+        self.innings += 1
+
+    def metrics(self) -> dict:
+        if not self.innings:
+            return {"avg": 0, "sr": 0, "bpd": 0}
+        return {
+            "avg": self.runs / self.innings,
+            "sr": (self.runs / self.balls) * 100 if self.balls else 0,
+            "bpd": self.balls / self.innings
+        }
+
+    def to_state(self) -> list:
+        return [self.runs, self.balls, self.innings]
+
+    @classmethod
+    def from_state(cls, state: list) -> "PressureBucket":
+        bucket = cls()
+        bucket.runs, bucket.balls, bucket.innings = state
+        return bucket
+
+
+# ---------------------------------------------------------
+# 🏏 Batting
+# ---------------------------------------------------------
+class BattingAccumulator:
+    """All batting metrics for ONE player, fed one innings at a time (in match order)."""
+
+    __slots__ = (
+        "innings", "runs", "balls", "dismissals", "fours", "sixes",
+        "count_30", "count_50", "runs_var", "recoveries", "last_runs",
+        "weighted_runs", "weighted_balls", "weight_sum", "win_contrib", "win_weight",
+        "buckets",
+    )
+
+    def __init__(self):
+        # Base skill
+        self.innings = 0
+        self.runs = 0
+        self.balls = 0
+        self.dismissals = 0
+        self.fours = 0
+        self.sixes = 0
+
+        # Consistency
+        self.count_30 = 0
+        self.count_50 = 0
+        self.runs_var = Moments()
+        self.recoveries = 0
+        self.last_runs = None
+
+        # Opposition quality
+        self.weighted_runs = 0
+        self.weighted_balls = 0
+        self.weight_sum = 0
+        self.win_contrib = 0
+        self.win_weight = 0
+
+        # Pressure
+        self.buckets = {name: PressureBucket() for name in BUCKETS}
+
+    def add(self, inn: Innings):
+        runs = inn.runs
+
+        self.innings += 1
+        self.runs += runs
+        self.balls += inn.balls
+        if inn.dismissed:
+            self.dismissals += 1
+        self.fours += getattr(inn, "fours", 0)
+        self.sixes += getattr(inn, "sixes", 0)
+
+        if runs >= 30:
+            self.count_30 += 1
+        if runs >= 50:
+            self.count_50 += 1
+        self.runs_var.add(runs)
+        if self.last_runs is not None and self.last_runs < 10 and runs >= 30:
+            self.recoveries += 1
+        self.last_runs = runs
+
+        weight = OPPOSITION_TIER_WEIGHTS.get(inn.opposition_tier, 0.3)
+        self.weighted_runs += runs * weight
+        self.weighted_balls += inn.balls * weight
+        self.weight_sum += weight
+        if getattr(inn, "result", "Loss") == "Win":
+            self.win_contrib += runs * weight
+            self.win_weight += weight
+
+        mask = bucket_mask(inn)
+        if mask:
+            for name, bit in BUCKETS.items():
+                if mask & bit:
+                    self.buckets[name].add(inn)
+
+    # -------------------------
+    # Scores
+    # -------------------------
+
+    def base_skill_score(self):
+        if not self.innings:
+            return 0
+        return base_skill_from_totals(self.runs, self.balls, self.dismissals, self.fours, self.sixes)
+
+    def consistency_score(self):
+        if not self.innings:
+            return 0
+        runs_stdev = self.runs_var.stdev() if self.innings >= 3 else None
+        return consistency_from_stats(self.innings, self.count_30, self.count_50, runs_stdev, self.recoveries)
+
+    def opposition_quality_score(self):
+        if not self.innings:
+            return 0
+        return opposition_quality_from_totals(
+            self.weighted_runs, self.weighted_balls, self.weight_sum, self.win_contrib, self.win_weight
+        )
+
+    def pressure_metrics(self) -> dict:
+        return {name: bucket.metrics() for name, bucket in self.buckets.items()}
+
+    def pressure_score(self) -> float:
+        return compute_total_pressure_score(self.pressure_metrics())
+
+    def stats(self) -> dict:
+        """The exporters' selector-ready "stats" object."""
+        pressure = self.pressure_score()
+        base = self.base_skill_score()
+        consistency = self.consistency_score()
+        opposition = self.opposition_quality_score()
+
+        final_score = round(
+            0.35 * pressure +
+            0.30 * base +
+            0.20 * consistency +
+            0.15 * opposition,
+            2
+        )
+
+        return {
+            "matches": self.innings,
+            "runs": self.runs,
+            "average": round(self.runs / self.innings, 2),
+            "strikeRate": round((self.runs / self.balls) * 100, 2),
+
+            "pressureScore": pressure,
+            "baseSkillScore": base,
+            "consistencyScore": consistency,
+            "oppositionQualityScore": opposition,
+            "finalScore": final_score
+        }
+
+
+# ---------------------------------------------------------
+# 🎯 Bowling
+# ---------------------------------------------------------
+class BowlingAccumulator:
+    """All bowling metrics for ONE bowler, fed one spell at a time."""
+
+    __slots__ = (
+        "team", "spells", "overs", "runs_conceded", "wickets",
+        "economy_var", "wickets_var",
+        "weighted_score_sum", "total_weight",
+        "pressure_score_sum", "pressure_spells",
+    )
+
+    def __init__(self):
+        self.team = ""
+
+        # Base skill
+        self.spells = 0
+        self.overs = 0
+        self.runs_conceded = 0
+        self.wickets = 0
+
+        # Consistency
+        self.economy_var = Moments()
+        self.wickets_var = Moments()
+
+        # Opposition quality
+        self.weighted_score_sum = 0
+        self.total_weight = 0.0
+
+        # Pressure
+        self.pressure_score_sum = 0
+        self.pressure_spells = 0
+
+    def add(self, inn: BowlingInnings):
+        self.team = inn.team
+
+        self.spells += 1
+        self.overs += inn.overs
+        self.runs_conceded += inn.runs_conceded
+        self.wickets += inn.wickets
+
+        self.economy_var.add(inn.economy)
+        self.wickets_var.add(inn.wickets)
+
+        weight = BOWLING_TIER_WEIGHTS.get(inn.opposition_tier, 1.0)
+        self.weighted_score_sum += opposition_spell_score(inn) * weight
+        self.total_weight += weight
+
+        if inn.is_pressure_spell:
+            self.pressure_score_sum += pressure_spell_score(inn)
+            self.pressure_spells += 1
+
+    # -------------------------
+    # Scores
+    # -------------------------
+
+    def pressure_score(self) -> float:
+        return pressure_bowling_from_totals(self.pressure_score_sum, self.pressure_spells)
+
+    def base_skill_score(self) -> float:
+        return base_bowling_skill_from_totals(self.overs, self.runs_conceded, self.wickets, self.spells)
+
+    def consistency_score(self) -> float:
+        return consistency_bowling_from_stats(
+            self.spells, self.economy_var.pstdev(), self.wickets_var.pstdev()
+        )
+
+    def opposition_quality_score(self) -> float:
+        if not self.spells:
+            return 45.0
+        return opposition_quality_bowling_from_totals(self.weighted_score_sum, self.total_weight, self.spells)
+
+    def stats(self) -> dict:
+        """The "stats" object of compute_bowling_scores."""
+        pressure_score = self.pressure_score()
+        base_skill_score = self.base_skill_score()
+        consistency_score = self.consistency_score()
+        opposition_quality_score = self.opposition_quality_score()
+
+        final_score = (
+            0.35 * pressure_score
+            + 0.30 * base_skill_score
+            + 0.20 * consistency_score
+            + 0.15 * opposition_quality_score
+        )
+
+        return {
+            "pressureScore": round(pressure_score, 2),
+            "baseSkillScore": round(base_skill_score, 2),
+            "consistencyScore": round(consistency_score, 2),
+            "oppositionQualityScore": round(opposition_quality_score, 2),
+            "finalScore": round(final_score, 2),
+        }
+
+
+# ---------------------------------------------------------
+# 💾 JSON-safe state (for incremental scoring)
+# ---------------------------------------------------------
+def accumulator_state(acc) -> dict:
+    """Plain-JSON snapshot of a Batting/BowlingAccumulator; floats round-trip exactly."""
+    state = {}
+    for name in acc.__slots__:
+        value = getattr(acc, name)
+        if isinstance(value, Moments):
+            value = value.to_state()
+        elif name == "buckets":
+            value = {bucket: b.to_state() for bucket, b in value.items()}
+        state[name] = value
+    return state
+
+
+def accumulator_from_state(cls, state: dict):
+    acc = cls()
+    for name in cls.__slots__:
+        value = state[name]
+        if isinstance(getattr(acc, name), Moments):
+            value = Moments.from_state(value)
+        elif name == "buckets":
+            value = {bucket: PressureBucket.from_state(b) for bucket, b in value.items()}
+        setattr(acc, name, value)
+    return acc
+
+
+# ---------------------------------------------------------
+# ✅ Streaming helpers
+# ---------------------------------------------------------
+def accumulate_batters(pairs: Iterable[Tuple[str, Innings]]) -> Dict[str, BattingAccumulator]:
+    """(player_name, Innings) stream → one accumulator per player, first-appearance order."""
+    players = {}
+    for name, inn in pairs:
+        acc = players.get(name)
+        if acc is None:
+            acc = players[name] = BattingAccumulator()
+        acc.add(inn)
+    return players
+
+
+def accumulate_bowlers(spells: Iterable[BowlingInnings]) -> Dict[str, BowlingAccumulator]:
+    """BowlingInnings stream → one accumulator per bowler, first-appearance order."""
+    bowlers = {}
+    for inn in spells:
+        acc = bowlers.get(inn.bowler_name)
+        if acc is None:
+            acc = bowlers[inn.bowler_name] = BowlingAccumulator()
+        acc.add(inn)
+    return bowlers
+
+
+def bowling_records(bowlers: Dict[str, BowlingAccumulator]):
+    """Accumulators → compute_bowling_scores-style list (sorted by finalScore, descending)."""
+    results = [
+        {"name": name, "team": acc.team, "role": "Bowler", "stats": acc.stats()}
+        for name, acc in bowlers.items()
+    ]
+    results.sort(key=lambda x: x["stats"]["finalScore"], reverse=True)
+    return results
+
+
+def main():
+    from backend.intelligence.engine.batting_scores import (
+        compute_base_skill_score,
+        compute_consistency_score,
+        compute_opposition_quality_score
+    )
+    from backend.intelligence.engine.bowling_scores import compute_bowling_scores
+    from backend.intelligence.engine.vectorized_batting import load_smat_players, synthetic_players
+    from backend.intelligence.engine.vectorized_bowling import (
+        band_edge_bowling_innings,
+        load_smat_bowling_innings,
+        synthetic_bowling_innings
+    )
+
+    failures = 0
+    for label, players_map in (("SMAT", load_smat_players()), ("synthetic", synthetic_players(50000, 2000))):
+        accs = accumulate_batters((name, inn) for name, innings in players_map.items() for inn in innings)
+        diffs = 0
+        for name, innings in players_map.items():
+            acc = accs[name]
+            expected = (compute_base_skill_score(innings), compute_consistency_score(innings),
+                        compute_opposition_quality_score(innings))
+            actual = (acc.base_skill_score(), acc.consistency_score(), acc.opposition_quality_score())
+            if expected != actual:
+                diffs += 1
+                print(f"❌ {name}: list {expected} vs accumulator {actual}")
+        print(f"{'✅' if not diffs else '❌'} batting {label}: {len(players_map)} players, {diffs} differ")
+        failures += diffs
+
+    for label, spells in (("SMAT", load_smat_bowling_innings()), ("synthetic", synthetic_bowling_innings(50000, 2000)),
+                          ("band edges", band_edge_bowling_innings(20000))):
+        expected = compute_bowling_scores(spells)
+        actual = bowling_records(accumulate_bowlers(iter(spells)))
+        diffs = sum(1 for e, a in zip(expected, actual) if e != a)
+        print(f"{'✅' if not diffs else '❌'} bowling {label}: {len(expected)} bowlers, {diffs} differ")
+        failures += diffs
+
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
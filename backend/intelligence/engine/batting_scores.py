@@ -36,6 +36,14 @@ def compute_base_skill_score(innings_list):
     fours = sum(getattr(i, "fours", 0) for i in innings_list)
     sixes = sum(getattr(i, "sixes", 0) for i in innings_list)
 
+    return base_skill_from_totals(total_runs, total_balls, dismissals, fours, sixes)
+
+
+def base_skill_from_totals(total_runs, total_balls, dismissals, fours, sixes):
+    """
+    Base skill score from career totals (shared by the list and streaming paths).
+    """
+
     batting_avg = total_runs / dismissals if dismissals > 0 else total_runs
     strike_rate = (total_runs / total_balls) * 100 if total_balls > 0 else 0
     balls_per_dismissal = total_balls / dismissals if dismissals > 0 else total_balls
@@ -79,21 +87,35 @@ def compute_consistency_score(innings_list):
     scores = [i.runs for i in innings_list]
     total = len(scores)
 
-    contrib_30 = len([s for s in scores if s >= 30]) / total
-    contrib_50 = len([s for s in scores if s >= 50]) / total
-
-    variance_penalty = 0
-    if total >= 3:
-        variance = stdev(scores)
-        variance_penalty = normalize_linear(variance, 5, 35)
-        variance_penalty = 100 - variance_penalty  # lower variance = better
-
     # Failure recovery
     recovery_count = 0
     for i in range(1, total):
         if scores[i - 1] < 10 and scores[i] >= 30:
             recovery_count += 1
 
+    return consistency_from_stats(
+        total,
+        len([s for s in scores if s >= 30]),
+        len([s for s in scores if s >= 50]),
+        stdev(scores) if total >= 3 else None,
+        recovery_count,
+    )
+
+
+def consistency_from_stats(total, count_30, count_50, runs_stdev, recovery_count):
+    """
+    Consistency score from innings count, 30+ / 50+ counts, sample stdev of runs
+    (None below 3 innings) and failure-recovery count.
+    """
+
+    contrib_30 = count_30 / total
+    contrib_50 = count_50 / total
+
+    variance_penalty = 0
+    if runs_stdev is not None:
+        variance_penalty = normalize_linear(runs_stdev, 5, 35)
+        variance_penalty = 100 - variance_penalty  # lower variance = better
+
     recovery_score = (
         (recovery_count / total) * 100 if total > 0 else 0
     )
@@ -112,11 +134,14 @@ def compute_consistency_score(innings_list):
 # 3️⃣ OPPOSITION QUALITY SCORE
 # --------------------------------------------------
 
+OPPOSITION_TIER_WEIGHTS = {"A": 1.0, "B": 0.6, "C": 0.3}
+
+
 def compute_opposition_quality_score(innings_list):
     if not innings_list:
         return 0
 
-    tier_weights = {"A": 1.0, "B": 0.6, "C": 0.3}
+    tier_weights = OPPOSITION_TIER_WEIGHTS
 
     weighted_runs = 0
     weighted_balls = 0
@@ -136,6 +161,16 @@ def compute_opposition_quality_score(innings_list):
             win_contrib += i.runs * weight
             win_weight += weight
 
+    return opposition_quality_from_totals(
+        weighted_runs, weighted_balls, weight_sum, win_contrib, win_weight
+    )
+
+
+def opposition_quality_from_totals(weighted_runs, weighted_balls, weight_sum, win_contrib, win_weight):
+    """
+    Opposition quality score from tier-weighted run / ball / win totals.
+    """
+
     avg_vs_quality = (
         weighted_runs / weight_sum if weight_sum > 0 else 0
     )
@@ -0,0 +1,432 @@
+# backend/intelligence/engine/export_pipeline.py
+
+"""
+Manifest-driven export pipeline for every selector-ready *_ready.json file.
+
+Each dataset in export_manifest.json (team, tournament, season, role, raw input files,
+output file) is an independent job on a process pool. Jobs stream their raw inputs
+(JSON arrays or JSONL, see raw_loader.py) straight into the single-pass accumulators;
+an input shared by several datasets is parsed once in the parent instead. With the
+columnar cache on (default, see raw_cache.py) unchanged raw files are not re-parsed,
+and players are scored from frames built from the cached columns: batters with
+vectorized_batting.py plus one PressureIndex per job, bowlers with vectorized_bowling.py.
+Per-player fingerprints (fingerprints.py) limit re-scoring to players whose innings
+changed; --full re-scores everyone. --check re-scores every output with the list-based
+metrics (compute_bowling_scores, compute_*_score) and fails on any difference.
+Adding a state means adding manifest entries, not a script.
+
+Usage (run from the repo root):
+    python3 -m backend.intelligence.engine.export_pipeline
+    python3 -m backend.intelligence.engine.export_pipeline --only tn_smat_batters kl_smat_bowlers
+    python3 -m backend.intelligence.engine.export_pipeline --workers 1
+    python3 -m backend.intelligence.engine.export_pipeline --no-cache
+    python3 -m backend.intelligence.engine.export_pipeline --check
+"""
+
+import argparse
+import json
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from itertools import chain
+from typing import Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple, Union
+
+from backend.intelligence.engine.accumulators import (
+    BattingAccumulator,
+    accumulate_batters,
+    accumulate_bowlers,
+    bowling_records
+)
+from backend.intelligence.engine.batting_scores import (
+    compute_base_skill_score,
+    compute_consistency_score,
+    compute_opposition_quality_score
+)
+from backend.intelligence.engine.bowling_scores import compute_bowling_scores
+from backend.intelligence.engine.fingerprints import (
+    load_fingerprints,
+    player_fingerprints,
+    save_fingerprints,
+    scoring_code_hash
+)
+from backend.intelligence.engine.pressure_index import PressureIndex, list_pressure_metrics
+from backend.intelligence.engine.pressure_score_engine import compute_total_pressure_score
+from backend.intelligence.engine.vectorized_batting import score_frame
+from backend.intelligence.engine.vectorized_bowling import compute_bowling_scores_vectorized
+from backend.intelligence.engine.raw_cache import Entry, batting_frame, bowling_frame, entry_innings, load_columns
+from backend.intelligence.engine.raw_loader import count_records, iter_records
+from backend.intelligence.models.bowling_frame import BowlingFrame, bowling_innings_from_record
+from backend.intelligence.models.bowling_innings import BowlingInnings
+from backend.intelligence.models.compact_innings import CompactBowlingInnings, CompactInnings
+from backend.intelligence.models.innings import Innings
+from backend.intelligence.models.innings_frame import InningsFrame, innings_from_record
+
+MANIFEST_PATH = Path(__file__).with_name("export_manifest.json")
+
+
+@dataclass(frozen=True)
+class Dataset:
+    name: str
+    state: str
+    team: str
+    tournament: str
+    season: str
+    role: str                   # "batting" | "bowling"
+    inputs: Tuple[str, ...]     # raw .json / .jsonl files, relative to data_dir, in match order
+    output: str
+
+
+def load_manifest(path: Path = MANIFEST_PATH) -> Tuple[Path, List[Dataset]]:
+    with open(path, "r", encoding="utf-8") as f:
+        manifest = json.load(f)
+
+    datasets = []
+    for entry in manifest["datasets"]:
+        if entry["role"] not in ROLES:
+            raise ValueError(f"{entry['name']}: unknown role {entry['role']!r}")
+        datasets.append(Dataset(**{**entry, "inputs": tuple(entry["inputs"])}))
+    return Path(manifest["data_dir"]), datasets
+
+
+def find_dataset(datasets: Iterable[Dataset], state: str, role: str) -> Dataset:
+    for dataset in datasets:
+        if dataset.state == state and dataset.role == role:
+            return dataset
+    raise KeyError(f"no {role} dataset for {state!r} in the manifest")
+
+
+def read_records(path: Path) -> List[dict]:
+    """Raw or ready JSON list (older batter exports were wrapped as {"players": [...]})."""
+    if not path.exists():
+        return []
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    return data["players"] if isinstance(data, dict) else data
+
+
+def ready_text(records: List[dict]) -> str:
+    """Selector-ready files are bare JSON lists, indented like the original exports."""
+    return json.dumps(records, indent=2) + "\n"
+
+
+def write_ready(path: Path, records: List[dict]):
+    path.write_text(ready_text(records), encoding="utf-8")
+
+
+# ---------------------------------------------------------
+# 🏏 / 🎯 Scoring per role
+# ---------------------------------------------------------
+def batter_record(name: str, team: str, acc: BattingAccumulator) -> dict:
+    return {
+        "id": name.lower().replace(" ", "-"),
+        "name": name,
+        "team": team,
+        "role": "Batter",
+        "stats": acc.stats()
+    }
+
+
+def parse_batting(dataset: Dataset, records: Iterable[dict]) -> Iterator[Tuple[str, CompactInnings]]:
+    return ((row["player_name"], innings_from_record(row, compact=True)) for row in records)
+
+
+def parse_bowling(dataset: Dataset, records: Iterable[dict]) -> Iterator[CompactBowlingInnings]:
+    return (bowling_innings_from_record(row, dataset.team, compact=True) for row in records)
+
+
+def score_batting(dataset: Dataset, innings: Iterable[Tuple[str, Innings]]) -> List[dict]:
+    players = accumulate_batters(innings)
+    return [batter_record(name, dataset.team, acc) for name, acc in players.items()]
+
+
+def frame_batting(dataset: Dataset, entries: List[Entry]) -> InningsFrame:
+    return batting_frame(entries)
+
+
+def score_batting_frame(dataset: Dataset, frame: InningsFrame) -> List[dict]:
+    """score_batting over a frame: vectorized metrics, pressure buckets from one PressureIndex."""
+    metrics = score_frame(frame)
+    pressure_scores = PressureIndex(frame).pressure_scores()
+    matches = frame.counts().tolist()
+    runs = frame.group_sum(frame.runs).tolist()
+    balls = frame.group_sum(frame.balls).tolist()
+
+    results = []
+    for code, name in enumerate(frame.players):
+        pressure = pressure_scores[name]
+        base = metrics[name]["baseSkillScore"]
+        consistency = metrics[name]["consistencyScore"]
+        opposition = metrics[name]["oppositionQualityScore"]
+        total_runs = int(runs[code])
+        results.append({
+            "id": name.lower().replace(" ", "-"),
+            "name": name,
+            "team": dataset.team,
+            "role": "Batter",
+            "stats": {
+                "matches": matches[code],
+                "runs": total_runs,
+                "average": round(total_runs / matches[code], 2),
+                "strikeRate": round((total_runs / int(balls[code])) * 100, 2),
+                "pressureScore": pressure,
+                "baseSkillScore": base,
+                "consistencyScore": consistency,
+                "oppositionQualityScore": opposition,
+                "finalScore": round(0.35 * pressure + 0.30 * base + 0.20 * consistency + 0.15 * opposition, 2)
+            }
+        })
+    return results
+
+
+def score_bowling(dataset: Dataset, spells: Iterable[BowlingInnings]) -> List[dict]:
+    return bowling_records(accumulate_bowlers(spells))
+
+
+def frame_bowling(dataset: Dataset, entries: List[Entry]) -> BowlingFrame:
+    return bowling_frame(entries, dataset.team)
+
+
+def score_bowling_frame(dataset: Dataset, frame: BowlingFrame) -> List[dict]:
+    return compute_bowling_scores_vectorized(frame)
+
+
+def reference_batting(dataset: Dataset, innings: Iterable[Tuple[str, Innings]]) -> List[dict]:
+    """score_batting through the list-based metrics, as the original export scripts did."""
+    players: Dict[str, List[Innings]] = {}
+    for name, inn in innings:
+        players.setdefault(name, []).append(inn)
+
+    results = []
+    for name, player_innings in players.items():
+        pressure = compute_total_pressure_score(list_pressure_metrics(player_innings))
+        base = compute_base_skill_score(player_innings)
+        consistency = compute_consistency_score(player_innings)
+        opposition = compute_opposition_quality_score(player_innings)
+        total_runs = sum(i.runs for i in player_innings)
+        total_balls = sum(i.balls for i in player_innings)
+        results.append({
+            "id": name.lower().replace(" ", "-"),
+            "name": name,
+            "team": dataset.team,
+            "role": "Batter",
+            "stats": {
+                "matches": len(player_innings),
+                "runs": total_runs,
+                "average": round(total_runs / len(player_innings), 2),
+                "strikeRate": round((total_runs / total_balls) * 100, 2),
+                "pressureScore": pressure,
+                "baseSkillScore": base,
+                "consistencyScore": consistency,
+                "oppositionQualityScore": opposition,
+                "finalScore": round(0.35 * pressure + 0.30 * base + 0.20 * consistency + 0.15 * opposition, 2)
+            }
+        })
+    return results
+
+
+def reference_bowling(dataset: Dataset, spells: Iterable[BowlingInnings]) -> List[dict]:
+    return compute_bowling_scores(list(spells))
+
+
+def order_bowlers(records: List[dict]) -> List[dict]:
+    # Same ordering as compute_bowling_scores: stable sort over first appearance
+    return sorted(records, key=lambda x: x["stats"]["finalScore"], reverse=True)
+
+
+class Role(NamedTuple):
+    parse: Callable     # (dataset, raw records) → innings stream
+    score: Callable     # (dataset, innings stream) → ready records
+    player: Callable    # innings stream item → (player name, innings)
+    order: Callable     # ready records in first-appearance order → output order
+    reference: Callable # score, through the list-based metrics (for --check)
+    frame: Optional[Callable] = None        # (dataset, cache entries) → frame; None scores the stream
+    score_frame: Optional[Callable] = None  # (dataset, frame of the players to re-score) → ready records
+
+
+ROLES = {
+    "batting": Role(parse_batting, score_batting, lambda item: item, list, reference_batting,
+                    frame_batting, score_batting_frame),
+    "bowling": Role(parse_bowling, score_bowling, lambda inn: (inn.bowler_name, inn), order_bowlers,
+                    reference_bowling, frame_bowling, score_bowling_frame),
+}
+
+
+# ---------------------------------------------------------
+# ⚙️ Jobs
+# ---------------------------------------------------------
+def job_innings(dataset: Dataset, source: Union[Path, List[dict]]) -> Iterator:
+    """Innings stream of one source without the cache: streamed raw file or parent-parsed rows."""
+    records = iter_records(source) if isinstance(source, Path) else source
+    return ROLES[dataset.role].parse(dataset, records)
+
+
+def fingerprint_seed(dataset: Dataset) -> str:
+    """Fingerprint seed of a dataset: the scoring code plus which team/role it is."""
+    return f"{scoring_code_hash()}|{dataset.team}|{dataset.role}"
+
+
+def run_job(dataset: Dataset, sources: List[Union[Path, List[dict]]], output_path: Path,
+            use_cache: bool = True, incremental: bool = True) -> dict:
+    """
+    One dataset → one ready file. Runs in a worker process.
+    Each source is a raw file path (cache or streamed JSON) or rows already parsed by the parent.
+
+    A first pass fingerprints every player; only players whose fingerprint changed (or who
+    are missing from the existing output) are re-scored in a second pass, and everyone else
+    keeps their existing record. incremental=False ignores the stored fingerprints.
+    With the cache, roles that have a frame re-score from it instead of the innings stream.
+    """
+    role = ROLES[dataset.role]
+    rows = [0]
+    # Cache entries are read once, for both the fingerprint pass and the frame
+    entries = (
+        [load_columns(source, dataset.role) for source in sources]
+        if use_cache and all(isinstance(source, Path) for source in sources) else None
+    )
+
+    def innings():
+        if entries is not None:
+            return chain.from_iterable(entry_innings(entry, dataset.role, dataset.team) for entry in entries)
+        return chain.from_iterable(job_innings(dataset, source) for source in sources)
+
+    started = time.perf_counter()
+    current = player_fingerprints(count_records(innings(), rows), role.player, fingerprint_seed(dataset))
+    previous = load_fingerprints(output_path) if incremental else {}
+    existing = {record["name"]: record for record in read_records(output_path)} if previous else {}
+
+    changed = {
+        name for name, fingerprint in current.items()
+        if previous.get(name) != fingerprint or name not in existing
+    }
+    if entries is not None and role.frame is not None:
+        scored = role.score_frame(dataset, role.frame(dataset, entries).select(changed)) if changed else []
+    else:
+        scored = role.score(dataset, (item for item in innings() if role.player(item)[0] in changed))
+    rescored = {record["name"]: record for record in scored}
+    results = role.order([rescored[name] if name in changed else existing[name] for name in current])
+    removed = len(set(existing) - set(current))
+    score_s = time.perf_counter() - started
+
+    started = time.perf_counter()
+    if changed or removed or not output_path.exists():
+        write_ready(output_path, results)
+    save_fingerprints(output_path, current)
+    write_s = time.perf_counter() - started
+
+    return {
+        "name": dataset.name,
+        "rows": rows[0],
+        "players": len(results),
+        "rescored": len(changed),
+        "skipped": len(results) - len(changed),
+        "removed": removed,
+        "score_s": score_s,
+        "write_s": write_s,
+        "output": str(output_path),
+    }
+
+
+def run_pipeline(only: Optional[List[str]] = None, workers: Optional[int] = None,
+                 manifest_path: Path = MANIFEST_PATH, use_cache: bool = True,
+                 incremental: bool = True) -> List[dict]:
+    data_dir, datasets = load_manifest(manifest_path)
+    if only:
+        unknown = set(only) - {d.name for d in datasets}
+        if unknown:
+            raise KeyError(f"not in the manifest: {', '.join(sorted(unknown))}")
+        datasets = [d for d in datasets if d.name in only]
+
+    # Inputs used by more than one dataset are parsed once here; the rest are streamed by the job.
+    # With the cache, "parsed once" means the parent refreshes the shared entry and jobs read it.
+    started = time.perf_counter()
+    uses: Dict[str, Tuple[int, str]] = {}
+    for dataset in datasets:
+        for name in dataset.inputs:
+            uses[name] = (uses.get(name, (0, ""))[0] + 1, dataset.role)
+    shared = {}
+    for name, (n, role) in uses.items():
+        if n > 1:
+            if use_cache:
+                load_columns(data_dir / name, role)
+            else:
+                shared[name] = list(iter_records(data_dir / name))
+    load_s = time.perf_counter() - started
+
+    started = time.perf_counter()
+    jobs = [
+        (dataset, [shared.get(name, data_dir / name) for name in dataset.inputs], data_dir / dataset.output,
+         use_cache, incremental)
+        for dataset in datasets
+    ]
+    if workers == 1:
+        reports = [run_job(*job) for job in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            reports = list(pool.map(run_job, *zip(*jobs)))
+    total_s = time.perf_counter() - started
+
+    for report in reports:
+        print(
+            f"✅ {report['name']:<18} {report['rows']:>6} rows → {report['players']:>4} players "
+            f"({report['rescored']} re-scored, {report['skipped']} skipped, {report['removed']} removed) "
+            f"| score {report['score_s'] * 1000:7.1f} ms | write {report['write_s'] * 1000:6.1f} ms "
+            f"→ {report['output']}"
+        )
+    print(
+        f"📦 {len(reports)} datasets from {len(uses)} input files "
+        f"({sum(n > 1 for n, _ in uses.values())} shared, cache {'on' if use_cache else 'off'}) | "
+        f"re-scored {sum(r['rescored'] for r in reports)}, skipped {sum(r['skipped'] for r in reports)} | "
+        f"shared load {load_s * 1000:.1f} ms | jobs {total_s * 1000:.1f} ms"
+    )
+    return reports
+
+
+def check_outputs(only: Optional[List[str]] = None, manifest_path: Path = MANIFEST_PATH) -> List[str]:
+    """
+    Names of datasets whose ready file differs from the list-based reference scores.
+    Files are compared as written, so an int 0 against a float 0.0 is a difference too.
+    """
+    data_dir, datasets = load_manifest(manifest_path)
+    failures = []
+    for dataset in datasets:
+        if only and dataset.name not in only:
+            continue
+        role = ROLES[dataset.role]
+        innings = chain.from_iterable(
+            role.parse(dataset, iter_records(data_dir / name)) for name in dataset.inputs
+        )
+        expected = role.order(role.reference(dataset, innings))
+        output = data_dir / dataset.output
+        if output.exists() and output.read_text(encoding="utf-8") == ready_text(expected):
+            print(f"✅ {dataset.name:<18} matches the list-based scores")
+        else:
+            failures.append(dataset.name)
+            print(f"❌ {dataset.name:<18} differs from the list-based scores")
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Export every selector-ready dataset in the manifest")
+    parser.add_argument("--only", nargs="+", metavar="DATASET", help="dataset names to export")
+    parser.add_argument("--workers", type=int, help="process pool size (1 = run in-process)")
+    parser.add_argument("--manifest", type=Path, default=MANIFEST_PATH)
+    parser.add_argument("--no-cache", action="store_true", help="parse the raw JSON even if cached")
+    parser.add_argument("--full", action="store_true", help="re-score every player, ignoring fingerprints")
+    parser.add_argument("--check", action="store_true",
+                        help="after exporting, compare every output with the list-based metrics")
+    args = parser.parse_args()
+
+    try:
+        run_pipeline(args.only, args.workers, args.manifest,
+                     use_cache=not args.no_cache, incremental=not args.full)
+    except KeyError as e:
+        parser.error(e.args[0])
+
+    if args.check and check_outputs(args.only, args.manifest):
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,119 @@
+# backend/intelligence/engine/fingerprints.py
+
+"""
+Per-player content fingerprints for incremental exports.
+
+A player's fingerprint is a sha256 chain over their innings, in match order, starting
+from a seed that covers the dataset (team, role) and the scoring code itself — so a
+corrected match re-scores only the players in it, and a change to any metric re-scores
+everyone. Being a chain, a stored fingerprint can be extended with new innings
+(incremental_scoring does this after an ingest) and equals a full recomputation.
+Innings are hashed from their model fields (not raw JSON), so the streamed-JSON and
+columnar-cache paths, and the dataclass and compact classes, produce the same fingerprints.
+
+Fingerprints live next to each output: <name>_ready.json → <name>_ready.fingerprints.json
+"""
+
+import dataclasses
+import hashlib
+import json
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Tuple
+
+INTELLIGENCE_DIR = Path(__file__).resolve().parent.parent
+
+# Everything an exported score depends on
+SCORING_SOURCES = (
+    "engine/accumulators.py",
+    "engine/batting_scores.py",
+    "engine/export_pipeline.py",
+    "engine/pressure_index.py",
+    "engine/pressure_score_engine.py",
+    "engine/raw_cache.py",
+    "engine/vectorized_batting.py",
+    "engine/vectorized_bowling.py",
+    "metrics/*.py",
+    "models/*.py",
+    "rules/*.py",
+)
+
+_code_hash = None
+
+
+def scoring_code_hash() -> str:
+    global _code_hash
+    if _code_hash is None:
+        digest = hashlib.sha256()
+        for pattern in SCORING_SOURCES:
+            for path in sorted(INTELLIGENCE_DIR.glob(pattern)):
+                digest.update(path.relative_to(INTELLIGENCE_DIR).as_posix().encode())
+                digest.update(path.read_bytes())
+        _code_hash = digest.hexdigest()
+    return _code_hash
+
+
+def _canonical(value):
+    """Numbers as floats (raw 4 and cached 4.0 overs hash alike), dicts key-sorted by json.dumps."""
+    if isinstance(value, bool) or value is None or isinstance(value, str):
+        return value
+    if isinstance(value, (int, float)):
+        return float(value)
+    if isinstance(value, dict):
+        return {k: _canonical(v) for k, v in value.items()}
+    return value
+
+
+_fields: Dict[type, Tuple[str, ...]] = {}
+
+
+def innings_fields(inn) -> Tuple[str, ...]:
+    """Model field names: the dataclass fields, or FIELDS of the slotted compact classes."""
+    cls = type(inn)
+    fields = _fields.get(cls)
+    if fields is None:
+        fields = _fields[cls] = getattr(cls, "FIELDS", None) or tuple(f.name for f in dataclasses.fields(cls))
+    return fields
+
+
+def innings_digest_text(inn) -> str:
+    return json.dumps(_canonical({name: getattr(inn, name) for name in innings_fields(inn)}), sort_keys=True)
+
+
+def seed_fingerprint(seed: str) -> str:
+    """Fingerprint of a player with no innings yet."""
+    return hashlib.sha256(seed.encode()).hexdigest()
+
+
+def extend_fingerprint(fingerprint: str, inn) -> str:
+    """The fingerprint after one more innings."""
+    return hashlib.sha256(f"{fingerprint}\n{innings_digest_text(inn)}".encode()).hexdigest()
+
+
+def player_fingerprints(innings: Iterable, player: Callable, seed: str) -> Dict[str, str]:
+    """
+    {player: fingerprint} in first-appearance order, streaming: one running chain per player.
+    `player(item)` gives (name, innings) for one item of the role's innings stream.
+    """
+    start = seed_fingerprint(seed)
+    fingerprints = {}
+    for item in innings:
+        name, inn = player(item)
+        fingerprints[name] = extend_fingerprint(fingerprints.get(name, start), inn)
+    return fingerprints
+
+
+def fingerprints_path(output_path: Path) -> Path:
+    output_path = Path(output_path)
+    return output_path.with_name(f"{output_path.stem}.fingerprints.json")
+
+
+def load_fingerprints(output_path: Path) -> Dict[str, str]:
+    path = fingerprints_path(output_path)
+    if not path.exists():
+        return {}
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_fingerprints(output_path: Path, fingerprints: Dict[str, str]):
+    fingerprints_path(output_path).write_text(json.dumps(fingerprints, indent=2) + "\n", encoding="utf-8")
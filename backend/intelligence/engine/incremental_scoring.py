@@ -0,0 +1,359 @@
+# backend/intelligence/engine/incremental_scoring.py
+
+"""
+Incremental (online) scoring: ingest a new match without re-reading the season.
+
+Per-player BattingAccumulator / BowlingAccumulator state is persisted as JSON next to
+the ready files. Ingesting a match feeds each new innings to its player's accumulator
+(O(1) per innings: running sums, exact moments for the stdevs, last-score recovery state) and only the
+affected players' output records are rebuilt; every other record is written back as-is.
+The affected players' fingerprints are extended with their new innings, so a later
+export_pipeline run (with the rows appended to the raw files) skips them too.
+
+Innings must be ingested in match order (the recovery rule compares consecutive scores).
+Matches already ingested (by match_id) are skipped, so re-running a match is safe; rows
+without a match_id cannot be de-duplicated and are rejected.
+
+Usage (run from the repo root):
+    python3 -m backend.intelligence.engine.incremental_scoring tn --bootstrap
+    python3 -m backend.intelligence.engine.incremental_scoring tn --batting new_bat.json --bowling new_bowl.json
+    python3 -m backend.intelligence.engine.incremental_scoring tn --verify
+
+New raw records should also be appended to the raw SMAT files so full re-exports agree.
+"""
+
+import argparse
+import json
+from itertools import chain
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from backend.intelligence.engine.accumulators import (
+    BattingAccumulator,
+    BowlingAccumulator,
+    accumulator_from_state,
+    accumulator_state
+)
+from backend.intelligence.engine.export_pipeline import (
+    batter_record,
+    find_dataset,
+    fingerprint_seed,
+    load_manifest,
+    read_records,
+    write_ready
+)
+from backend.intelligence.engine.bowling_scores import compute_bowling_scores
+from backend.intelligence.engine.fingerprints import (
+    extend_fingerprint,
+    load_fingerprints,
+    save_fingerprints,
+    seed_fingerprint
+)
+from backend.intelligence.engine.raw_loader import iter_records
+from backend.intelligence.engine.vectorized_bowling import compute_bowling_scores_vectorized
+from backend.intelligence.models.bowling_frame import BowlingFrame, bowling_innings_from_record
+from backend.intelligence.models.innings_frame import innings_from_record
+
+DATA_DIR, DATASETS = load_manifest()
+STATE_DIR = DATA_DIR / "state"
+TEAMS = sorted({dataset.state for dataset in DATASETS})
+
+# Bumped whenever the accumulator state layout changes; older state files need --bootstrap
+STATE_VERSION = 2
+
+
+def match_id(row: dict):
+    """A raw row's match_id. Without one a row could not be skipped on re-ingest, so it is an error."""
+    value = row.get("match_id")
+    if value is None or value == "":
+        name = row.get("player_name") or row.get("bowler_name") or "?"
+        raise ValueError(f"row for {name!r} has no match_id")
+    return value
+
+
+class IncrementalScorer:
+    """Running per-player state for one state's batters and bowlers (manifest `state` key)."""
+
+    def __init__(self, key: str):
+        self.key = key
+        self.batting = find_dataset(DATASETS, key, "batting")
+        self.bowling = find_dataset(DATASETS, key, "bowling")
+        self.team = self.batting.team
+
+        self.batters: Dict[str, BattingAccumulator] = {}
+        self.bowlers: Dict[str, BowlingAccumulator] = {}
+        # match_ids already folded into the state
+        self.seen_batting = set()
+        self.seen_bowling = set()
+
+        # Players whose output record is stale, with the innings added since the last write
+        self.dirty_batters: Dict[str, list] = {}
+        self.dirty_bowlers: Dict[str, list] = {}
+        # Bootstrap rebuilds the fingerprints from scratch instead of extending the stored ones
+        self.fresh_fingerprints = False
+
+    @property
+    def state_path(self) -> Path:
+        return STATE_DIR / f"{self.key}_smat_state.json"
+
+    # -------------------------
+    # Ingest (O(1) per innings)
+    # -------------------------
+
+    def add_batting(self, rows: Iterable[dict]) -> int:
+        added = 0
+        new_matches = set()
+        for row in rows:
+            row_match = match_id(row)
+            if row_match in self.seen_batting:
+                continue
+            new_matches.add(row_match)
+
+            name = row["player_name"]
+            acc = self.batters.get(name)
+            if acc is None:
+                acc = self.batters[name] = BattingAccumulator()
+            inn = innings_from_record(row)
+            acc.add(inn)
+            self.dirty_batters.setdefault(name, []).append(inn)
+            added += 1
+        self.seen_batting |= new_matches
+        return added
+
+    def add_bowling(self, rows: Iterable[dict]) -> int:
+        added = 0
+        new_matches = set()
+        for row in rows:
+            row_match = match_id(row)
+            if row_match in self.seen_bowling:
+                continue
+            new_matches.add(row_match)
+
+            name = row["bowler_name"]
+            acc = self.bowlers.get(name)
+            if acc is None:
+                acc = self.bowlers[name] = BowlingAccumulator()
+            inn = bowling_innings_from_record(row, self.team)
+            acc.add(inn)
+            self.dirty_bowlers.setdefault(name, []).append(inn)
+            added += 1
+        self.seen_bowling |= new_matches
+        return added
+
+    # -------------------------
+    # Output records
+    # -------------------------
+
+    def batter_record(self, name: str) -> dict:
+        return batter_record(name, self.team, self.batters[name])
+
+    def bowler_record(self, name: str) -> dict:
+        acc = self.bowlers[name]
+        return {"name": name, "team": acc.team, "role": "Bowler", "stats": acc.stats()}
+
+    def batter_records(self, existing: List[dict]) -> List[dict]:
+        """Existing records reused for clean players; dirty ones rebuilt. Export order."""
+        by_name = {record["name"]: record for record in existing}
+        return [
+            self.batter_record(name) if name in self.dirty_batters or name not in by_name else by_name[name]
+            for name in self.batters
+        ]
+
+    def bowler_records(self, existing: List[dict]) -> List[dict]:
+        by_name = {record["name"]: record for record in existing}
+        results = [
+            self.bowler_record(name) if name in self.dirty_bowlers or name not in by_name else by_name[name]
+            for name in self.bowlers
+        ]
+        # Same ordering as compute_bowling_scores: stable sort over first appearance
+        results.sort(key=lambda x: x["stats"]["finalScore"], reverse=True)
+        return results
+
+    def write_fingerprints(self, path: Path, dataset, dirty: Dict[str, list], names: Iterable[str]):
+        """Extend the dirty players' fingerprints with their new innings; drop players no longer scored."""
+        previous = {} if self.fresh_fingerprints else load_fingerprints(path)
+        start = seed_fingerprint(fingerprint_seed(dataset))
+        fingerprints = {}
+        for name in names:
+            fingerprint = previous.get(name, start)
+            if name in dirty:
+                for inn in dirty[name]:
+                    fingerprint = extend_fingerprint(fingerprint, inn)
+            fingerprints[name] = fingerprint
+        save_fingerprints(path, fingerprints)
+
+    def write_outputs(self) -> Tuple[int, int]:
+        """Rewrite the ready files (and fingerprints) if any player changed. Returns (batters, bowlers) rebuilt."""
+        rebuilt = (len(self.dirty_batters), len(self.dirty_bowlers))
+
+        if self.dirty_batters:
+            path = DATA_DIR / self.batting.output
+            write_ready(path, self.batter_records(read_records(path)))
+            self.write_fingerprints(path, self.batting, self.dirty_batters, self.batters)
+        if self.dirty_bowlers:
+            path = DATA_DIR / self.bowling.output
+            write_ready(path, self.bowler_records(read_records(path)))
+            self.write_fingerprints(path, self.bowling, self.dirty_bowlers, self.bowlers)
+
+        self.dirty_batters.clear()
+        self.dirty_bowlers.clear()
+        self.fresh_fingerprints = False
+        return rebuilt
+
+    # -------------------------
+    # State persistence
+    # -------------------------
+
+    def save(self):
+        state = {
+            "version": STATE_VERSION,
+            "team": self.team,
+            "batters": {name: accumulator_state(acc) for name, acc in self.batters.items()},
+            "bowlers": {name: accumulator_state(acc) for name, acc in self.bowlers.items()},
+            "seen_batting": sorted(self.seen_batting),
+            "seen_bowling": sorted(self.seen_bowling),
+        }
+        STATE_DIR.mkdir(parents=True, exist_ok=True)
+        self.state_path.write_text(json.dumps(state))
+
+    @classmethod
+    def load(cls, key: str) -> Optional["IncrementalScorer"]:
+        scorer = cls(key)
+        if not scorer.state_path.exists():
+            return None
+
+        state = json.loads(scorer.state_path.read_text())
+        if state.get("version") != STATE_VERSION:
+            return None
+        scorer.batters = {
+            name: accumulator_from_state(BattingAccumulator, s) for name, s in state["batters"].items()
+        }
+        scorer.bowlers = {
+            name: accumulator_from_state(BowlingAccumulator, s) for name, s in state["bowlers"].items()
+        }
+        scorer.seen_batting = set(state["seen_batting"])
+        scorer.seen_bowling = set(state["seen_bowling"])
+        return scorer
+
+    @classmethod
+    def bootstrap(cls, key: str) -> "IncrementalScorer":
+        """Full pass over the raw SMAT files (once); every player is marked dirty."""
+        scorer = cls(key)
+        scorer.fresh_fingerprints = True
+        # One call: a match's batters are spread over several files
+        scorer.add_batting(row for f in scorer.batting.inputs for row in iter_records(DATA_DIR / f))
+        scorer.add_bowling(row for f in scorer.bowling.inputs for row in iter_records(DATA_DIR / f))
+        return scorer
+
+    def ingest_match(self, batting_rows: Iterable[dict] = (), bowling_rows: Iterable[dict] = ()) -> Tuple[int, int]:
+        """
+        Add one match's rows, rewrite affected records, persist state. Returns records rebuilt.
+        Every row is checked for a match_id first, so a bad batch leaves the state untouched.
+        """
+        batting_rows, bowling_rows = list(batting_rows), list(bowling_rows)
+        for row in chain(batting_rows, bowling_rows):
+            match_id(row)
+        self.add_batting(batting_rows)
+        self.add_bowling(bowling_rows)
+        rebuilt = self.write_outputs()
+        self.save()
+        return rebuilt
+
+
+def verify(key: str) -> List[str]:
+    """
+    Compare the persisted state's players and scores with a fresh full pass over the raw files, the
+    bowlers with compute_bowling_scores and its BowlingFrame twin, and (band edges) state
+    round-trips with the list scores.
+    """
+    scorer = IncrementalScorer.load(key)
+    if scorer is None:
+        return [f"no state for {key} (or an older layout; run --bootstrap)"]
+    fresh = IncrementalScorer.bootstrap(key)
+
+    problems = []
+    for name, acc in fresh.batters.items():
+        if name not in scorer.batters or scorer.batters[name].stats() != acc.stats():
+            problems.append(f"batter {name}")
+    for name, acc in fresh.bowlers.items():
+        if name not in scorer.bowlers or scorer.bowlers[name].stats() != acc.stats():
+            problems.append(f"bowler {name}")
+    problems += [f"batter {name} (not in raw files)" for name in sorted(scorer.batters.keys() - fresh.batters.keys())]
+    problems += [f"bowler {name} (not in raw files)" for name in sorted(scorer.bowlers.keys() - fresh.bowlers.keys())]
+
+    spells = [
+        bowling_innings_from_record(row, scorer.team)
+        for f in scorer.bowling.inputs for row in iter_records(DATA_DIR / f)
+    ]
+    for scores, label in ((compute_bowling_scores(spells), "compute_bowling_scores"),
+                          (compute_bowling_scores_vectorized(BowlingFrame.from_innings(spells)), "BowlingFrame")):
+        for record in scores:
+            if record["name"] in scorer.bowlers and scorer.bowlers[record["name"]].stats() != record["stats"]:
+                problems.append(f"bowler {record['name']} (vs {label})")
+
+    problems += [f"band edge {name}" for name in band_edge_problems()]
+    return problems
+
+
+def band_edge_problems(n_bowlers: int = 2000) -> List[str]:
+    """
+    Bowlers whose stdevs sit exactly on consistency band edges, ingested in two halves with
+    a JSON state round-trip in between (as ingest_match does), against compute_bowling_scores.
+    """
+    from backend.intelligence.engine.vectorized_bowling import band_edge_bowling_innings
+
+    spells = band_edge_bowling_innings(n_bowlers)
+    bowlers: Dict[str, BowlingAccumulator] = {}
+    for half in (spells[:len(spells) // 2], spells[len(spells) // 2:]):
+        bowlers = {
+            name: accumulator_from_state(BowlingAccumulator, json.loads(json.dumps(accumulator_state(acc))))
+            for name, acc in bowlers.items()
+        }
+        for inn in half:
+            bowlers.setdefault(inn.bowler_name, BowlingAccumulator()).add(inn)
+
+    return [
+        record["name"] for record in compute_bowling_scores(spells)
+        if bowlers[record["name"]].stats() != record["stats"]
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Incremental SMAT score updates")
+    parser.add_argument("team", choices=TEAMS)
+    parser.add_argument("--bootstrap", action="store_true", help="rebuild state and outputs from the raw files")
+    parser.add_argument("--batting", type=Path, help="JSON list of new batting rows (raw SMAT format)")
+    parser.add_argument("--bowling", type=Path, help="JSON list of new bowling rows (raw SMAT format)")
+    parser.add_argument("--verify", action="store_true", help="check saved state against the raw files")
+    args = parser.parse_args()
+
+    if args.verify:
+        problems = verify(args.team)
+        for problem in problems:
+            print(f"❌ {problem}")
+        print("✅ State matches raw files" if not problems else f"❌ {len(problems)} mismatches")
+        return 1 if problems else 0
+
+    if args.bootstrap:
+        scorer = IncrementalScorer.bootstrap(args.team)
+        batters, bowlers = scorer.write_outputs()
+        scorer.save()
+        print(f"✅ Bootstrapped {args.team}: {batters} batters, {bowlers} bowlers")
+        return 0
+
+    scorer = IncrementalScorer.load(args.team)
+    if scorer is None:
+        parser.error(f"no saved state for {args.team} (or an older layout); run with --bootstrap first")
+
+    batting_rows = read_records(args.batting) if args.batting else []
+    bowling_rows = read_records(args.bowling) if args.bowling else []
+    try:
+        batters, bowlers = scorer.ingest_match(batting_rows, bowling_rows)
+    except ValueError as e:
+        parser.error(str(e))
+    print(f"✅ {args.team}: rewrote {batters} batter / {bowlers} bowler records")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,228 @@
+# backend/intelligence/engine/pressure_index.py
+
+"""
+Pressure-bucket index over an InningsFrame.
+
+Built once at load time from a single bucket_mask_batch pass: for every pressure
+bucket (collapse / chase / knockout / quality) a CSR-style layout of frame row
+positions grouped by player in match order, plus per-player runs / balls / innings
+sums. compute_total_pressure_score then reads avg / SR / BPD straight from the sums,
+and cross-player queries ("best chasers", "most knockout innings") are one array
+operation instead of re-filtering every player's innings.
+
+Parity check against the accumulators and the exporters' list filters (run from the repo root):
+    python3 -m backend.intelligence.engine.pressure_index
+    python3 -m backend.intelligence.engine.pressure_index --synthetic 1000000
+"""
+
+import argparse
+import time
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from backend.intelligence.engine.pressure_score_engine import compute_total_pressure_score
+from backend.intelligence.models.innings_frame import InningsFrame
+from backend.intelligence.rules.pressure_bits import BUCKETS, bucket_mask_batch
+
+METRICS = ("avg", "sr", "bpd")
+
+
+class PressureBucketIndex:
+    """One bucket: row positions per player (indptr / rows) and per-player totals."""
+
+    __slots__ = ("indptr", "rows", "innings", "runs", "balls")
+
+    def __init__(self, frame: InningsFrame, selected: np.ndarray):
+        """selected: frame rows in this bucket, already grouped by player in match order."""
+        self.innings = np.bincount(frame.player[selected], minlength=frame.n_players)
+        self.indptr = np.zeros(frame.n_players + 1, dtype=np.int64)
+        np.cumsum(self.innings, out=self.indptr[1:])
+        self.rows = selected
+
+        # Integer totals from prefix sums (exact, unlike float bincount weights)
+        self.runs = self._segment_sums(frame.runs[selected])
+        self.balls = self._segment_sums(frame.balls[selected])
+
+    def _segment_sums(self, values: np.ndarray) -> np.ndarray:
+        prefix = np.zeros(len(values) + 1, dtype=np.int64)
+        np.cumsum(values, out=prefix[1:])
+        return prefix[self.indptr[1:]] - prefix[self.indptr[:-1]]
+
+    def positions(self, code: int) -> np.ndarray:
+        return self.rows[self.indptr[code]:self.indptr[code + 1]]
+
+    def metrics(self, code: int) -> dict:
+        """Same values as PressureBucket.metrics()."""
+        innings = int(self.innings[code])
+        if not innings:
+            return {"avg": 0, "sr": 0, "bpd": 0}
+        runs = int(self.runs[code])
+        balls = int(self.balls[code])
+        return {
+            "avg": runs / innings,
+            "sr": (runs / balls) * 100 if balls else 0,
+            "bpd": balls / innings
+        }
+
+    def metric_array(self, metric: str) -> np.ndarray:
+        """One metric for every player (0 where the player has no innings in the bucket)."""
+        innings = self.innings.astype(np.float64)
+        numerator, denominator = {
+            "avg": (self.runs, innings),
+            "sr": (self.runs * 100, self.balls),
+            "bpd": (self.balls, innings),
+        }[metric]
+        out = np.zeros(len(innings), dtype=np.float64)
+        np.divide(numerator, denominator, out=out, where=denominator > 0)
+        return out
+
+
+class PressureIndex:
+    """
+    Every pressure bucket of a frame, tagged in one pass.
+
+    index = PressureIndex(frame)
+    index.pressure_score("N Jagadeesan")
+    index.top("chase", 5, by="sr", min_innings=3)
+    """
+
+    def __init__(self, frame: InningsFrame):
+        self.frame = frame
+        self.mask = bucket_mask_batch(frame)
+
+        order = frame.order()
+        grouped_mask = self.mask[order]
+        self.buckets: Dict[str, PressureBucketIndex] = {
+            name: PressureBucketIndex(frame, order[(grouped_mask & bit) != 0])
+            for name, bit in BUCKETS.items()
+        }
+
+    # -------------------------
+    # Per player
+    # -------------------------
+
+    def _code(self, player: str) -> int:
+        try:
+            return self.frame.player_index[player]
+        except KeyError:
+            raise KeyError(f"unknown player {player!r}") from None
+
+    def positions(self, bucket: str, player: str) -> np.ndarray:
+        """Frame rows of the player's innings in the bucket, in match order."""
+        return self.buckets[bucket].positions(self._code(player))
+
+    def metrics(self, player: str) -> Dict[str, dict]:
+        """{bucket: {avg, sr, bpd}} — the input of compute_total_pressure_score."""
+        code = self._code(player)
+        return {name: bucket.metrics(code) for name, bucket in self.buckets.items()}
+
+    def pressure_score(self, player: str) -> float:
+        return compute_total_pressure_score(self.metrics(player))
+
+    def pressure_scores(self) -> Dict[str, float]:
+        return {
+            name: compute_total_pressure_score(
+                {bucket_name: bucket.metrics(code) for bucket_name, bucket in self.buckets.items()}
+            )
+            for code, name in enumerate(self.frame.players)
+        }
+
+    # -------------------------
+    # Across players
+    # -------------------------
+
+    def top(self, bucket: str, k: int, by: str = "avg", min_innings: int = 1) -> List[Tuple[str, float]]:
+        """The k best players of one bucket by avg / sr / bpd (ties keep first appearance)."""
+        if by not in METRICS:
+            raise ValueError(f"by must be one of {', '.join(METRICS)}")
+        index = self.buckets[bucket]
+        values = index.metric_array(by)
+        eligible = np.flatnonzero(index.innings >= max(min_innings, 1))
+        ranked = eligible[np.argsort(-values[eligible], kind="stable")[:k]]
+        return [(self.frame.players[code], float(values[code])) for code in ranked]
+
+
+# --------------------------------------------------
+# Parity check
+# --------------------------------------------------
+
+def list_pressure_metrics(innings) -> dict:
+    """The exporters' original build_pressure_metrics filters, kept as the reference."""
+    def bucket(filtered):
+        if not filtered:
+            return {"avg": 0, "sr": 0, "bpd": 0}
+        runs = sum(i.runs for i in filtered)
+        balls = sum(i.balls for i in filtered)
+        return {
+            "avg": runs / len(filtered),
+            "sr": (runs / balls) * 100 if balls else 0,
+            "bpd": balls / len(filtered)
+        }
+
+    return {
+        "collapse": bucket([i for i in innings if i.wickets_at_entry >= 3]),
+        "chase": bucket([i for i in innings if i.chasing]),
+        "knockout": bucket([i for i in innings if i.knockout]),
+        "quality": bucket([i for i in innings if i.opposition_tier == "A"]),
+    }
+
+
+def main():
+    from backend.intelligence.engine.accumulators import accumulate_batters
+    from backend.intelligence.engine.vectorized_batting import load_smat_players, synthetic_players
+
+    parser = argparse.ArgumentParser(description="Parity check: pressure index vs accumulators and list filters")
+    parser.add_argument("--synthetic", type=int, metavar="N", help="use N random innings instead of the SMAT files")
+    parser.add_argument("--players", type=int, default=5000, help="players for --synthetic")
+    args = parser.parse_args()
+
+    players_map = synthetic_players(args.synthetic, args.players) if args.synthetic else load_smat_players()
+    if args.synthetic:
+        # synthetic_players leaves every wickets_at_entry at 0; spread them so collapse is exercised
+        rng = np.random.default_rng(1)
+        for innings in players_map.values():
+            for inn in innings:
+                inn.wickets_at_entry = int(rng.integers(0, 8))
+    frame = InningsFrame.from_players(players_map)
+
+    started = time.perf_counter()
+    index = PressureIndex(frame)
+    build_s = time.perf_counter() - started
+
+    started = time.perf_counter()
+    scores = index.pressure_scores()
+    score_s = time.perf_counter() - started
+
+    started = time.perf_counter()
+    expected = {name: compute_total_pressure_score(list_pressure_metrics(innings))
+                for name, innings in players_map.items()}
+    list_s = time.perf_counter() - started
+
+    accs = accumulate_batters((name, inn) for name, innings in players_map.items() for inn in innings)
+
+    diffs = 0
+    for name, innings in players_map.items():
+        if not (scores[name] == expected[name] == accs[name].pressure_score()
+                and index.metrics(name) == list_pressure_metrics(innings)):
+            diffs += 1
+            if diffs <= 20:
+                print(f"❌ {name}: index {scores[name]} vs list {expected[name]} "
+                      f"vs accumulator {accs[name].pressure_score()}")
+        if len(index.positions("knockout", name)) != sum(1 for i in innings if i.knockout):
+            diffs += 1
+
+    started = time.perf_counter()
+    best = index.top("chase", 5, by="sr", min_innings=3)
+    top_s = time.perf_counter() - started
+
+    print(f"{len(frame)} innings, {frame.n_players} players")
+    print(f"list filters {list_s:.3f}s | index build {build_s:.3f}s + scores {score_s:.3f}s | top-5 chase {top_s * 1000:.2f} ms")
+    for name, sr in best:
+        print(f"   chase SR {sr:7.2f}  {name}")
+    print("✅ Parity OK" if not diffs else f"❌ {diffs} players differ")
+    return 1 if diffs else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,483 @@
+# backend/intelligence/engine/raw_cache.py
+
+"""
+On-disk columnar cache of parsed raw SMAT files.
+
+Each raw file gets a binary entry (data_dir/.cache/<file>.cols) holding one array per
+innings field, with string fields dictionary-encoded and the bowling phase / pressure
+dicts packed into fixed columns (same packing as compact_innings.py).
+
+Entry layout: MAGIC, u64 header length, JSON header (meta, vocabularies, column
+dtype / offset / length), then the column buffers, 8-byte aligned. One read plus
+np.frombuffer per column, unlike .npz whose zip directory dominates for small files.
+A cache entry is valid while the source's size + mtime match; when only the mtime
+moved (e.g. a git checkout) the sha256 of the content decides, and the entry is
+re-stamped instead of rebuilt.
+
+Usage (run from the repo root):
+    python3 -m backend.intelligence.engine.raw_cache status
+    python3 -m backend.intelligence.engine.raw_cache rebuild
+    python3 -m backend.intelligence.engine.raw_cache verify
+    python3 -m backend.intelligence.engine.raw_cache bench
+"""
+
+import argparse
+import hashlib
+import json
+import math
+import os
+import time
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+import numpy as np
+
+from backend.intelligence.engine.raw_loader import iter_records
+from backend.intelligence.models.bowling_frame import BowlingFrame, bowling_innings_from_record
+from backend.intelligence.models.compact_innings import (
+    PHASE_KEYS,
+    PRESSURE_BITS,
+    CompactBowlingInnings,
+    CompactInnings
+)
+from backend.intelligence.models.innings_frame import (
+    FORMAT_CODES,
+    InningsFrame,
+    innings_from_record,
+    tier_code
+)
+
+CACHE_VERSION = 1
+CACHE_DIRNAME = ".cache"
+MAGIC = b"CRICCOLS"
+
+# (record key, column kind, default) — defaults are the exporters' (see innings_from_record)
+BATTING_COLUMNS = (
+    ("match_id", "str", ""),
+    ("player_name", "str", None),
+    ("runs", "int", None),
+    ("balls", "int", None),
+    ("fours", "int", 0),
+    ("sixes", "int", 0),
+    ("result", "str", "Loss"),
+    ("chasing", "bool", False),
+    ("knockout", "bool", False),
+    ("opposition_tier", "str", "B"),
+    ("team_runs", "int", 0),
+    ("team_wickets", "int", 0),
+)
+
+BOWLING_COLUMNS = (
+    ("match_id", "str", ""),
+    ("bowler_name", "str", None),
+    ("overs", "float", None),
+    ("maidens", "int", 0),
+    ("runs_conceded", "int", None),
+    ("wickets", "int", None),
+    ("economy", "float", None),
+    ("opposition", "str", None),
+    ("opposition_tier", "str", None),
+    ("result", "str", None),
+    ("knockout", "bool", None),
+)
+
+ROLE_COLUMNS = {
+    "batting": BATTING_COLUMNS,
+    "bowling": BOWLING_COLUMNS,
+}
+
+_DTYPES = {"int": np.int64, "float": np.float64, "bool": bool}
+
+
+def cache_path(source: Path) -> Path:
+    source = Path(source)
+    return source.parent / CACHE_DIRNAME / f"{source.name}.cols"
+
+
+def file_sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _stamp(source: Path) -> Dict:
+    stat = source.stat()
+    return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+
+# ---------------------------------------------------------
+# 🧱 Records → columns
+# ---------------------------------------------------------
+def _value(record: dict, key: str, default):
+    if default is None:
+        return record[key]
+    return record.get(key, default)
+
+
+def build_columns(records: Iterable[dict], role: str) -> Tuple[Dict[str, np.ndarray], Dict[str, List[str]]]:
+    """(columns, vocabularies); string columns hold int32 codes into their vocabulary."""
+    spec = ROLE_COLUMNS[role]
+    values = {key: [] for key, _, _ in spec}
+    phases = {key: [] for key in PHASE_KEYS}
+    pressure = []
+
+    for record in records:
+        for key, _, default in spec:
+            values[key].append(_value(record, key, default))
+
+        if role == "bowling":
+            phase = record.get("bowling_phase", {})
+            for key in PHASE_KEYS:
+                phases[key].append(phase.get(key, math.nan))
+
+            context = record.get("pressure_context", {})
+            flags = 0
+            for key, (value_bit, present_bit) in PRESSURE_BITS.items():
+                if key in context:
+                    flags |= present_bit | (value_bit if context[key] else 0)
+            pressure.append(flags)
+
+    arrays, vocab = {}, {}
+    for key, kind, _ in spec:
+        if kind == "str":
+            index = {}
+            codes = [index.setdefault(v, len(index)) for v in values[key]]
+            vocab[key] = list(index)
+            arrays[key] = np.asarray(codes, dtype=np.int32)
+        else:
+            arrays[key] = np.asarray(values[key], dtype=_DTYPES[kind])
+
+    if role == "bowling":
+        for key in PHASE_KEYS:
+            arrays[key] = np.asarray(phases[key], dtype=np.float64)
+        arrays["pressure_flags"] = np.asarray(pressure, dtype=np.uint8)
+    return arrays, vocab
+
+
+def _column_lists(arrays: Dict[str, np.ndarray], vocab: Dict[str, List[str]]) -> Dict[str, list]:
+    """
+    Decoded Python lists per column (strings looked up in their vocabulary). Opposition
+    tiers are upper-cased, like the record loaders do.
+    """
+    columns = {}
+    for key, col in arrays.items():
+        col = col.tolist()
+        if key in vocab:
+            words = vocab[key]
+            if key == "opposition_tier":
+                words = [word.upper() for word in words]
+            col = [words[code] for code in col]
+        columns[key] = col
+    return columns
+
+
+# ---------------------------------------------------------
+# 💾 Cache read / write
+# ---------------------------------------------------------
+Entry = Tuple[Dict, Dict[str, np.ndarray], Dict[str, List[str]]]    # meta, columns, vocab
+
+
+def write_cache(source: Path, role: str) -> Entry:
+    source = Path(source)
+    arrays, vocab = build_columns(iter_records(source), role)
+    meta = {"version": CACHE_VERSION, "role": role, "sha256": file_sha256(source), **_stamp(source)}
+    _save(cache_path(source), (meta, arrays, vocab))
+    return meta, arrays, vocab
+
+
+def _save(path: Path, entry: Entry):
+    meta, arrays, vocab = entry
+    columns, blobs, offset = [], [], 0
+    for key, col in arrays.items():
+        data = np.ascontiguousarray(col).tobytes()
+        columns.append({"name": key, "dtype": col.dtype.str, "offset": offset, "length": len(col)})
+        padded = -len(data) % 8
+        blobs.append(data + b"\0" * padded)
+        offset += len(data) + padded
+
+    header = json.dumps({"meta": meta, "vocab": vocab, "columns": columns}).encode("utf-8")
+    header += b" " * (-(len(MAGIC) + 8 + len(header)) % 8)
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # Atomic replace: parallel export jobs may read the same entry
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    with open(tmp, "wb") as f:
+        f.write(MAGIC + len(header).to_bytes(8, "little") + header)
+        f.writelines(blobs)
+    os.replace(tmp, path)
+
+
+def _read(path: Path) -> Entry:
+    raw = path.read_bytes()
+    if raw[:len(MAGIC)] != MAGIC:
+        raise ValueError(f"{path}: not a cache entry")
+    start = len(MAGIC) + 8
+    end = start + int.from_bytes(raw[len(MAGIC):start], "little")
+    header = json.loads(raw[start:end])
+
+    arrays = {
+        col["name"]: np.frombuffer(raw, dtype=col["dtype"], count=col["length"], offset=end + col["offset"])
+        for col in header["columns"]
+    }
+    return header["meta"], arrays, header["vocab"]
+
+
+def _lookup(source: Path, role: str) -> Tuple[str, Entry]:
+    path = cache_path(source)
+    if not path.exists():
+        return "missing", None
+    try:
+        entry = _read(path)
+    except (OSError, ValueError, KeyError):
+        return "stale", None
+    meta = entry[0]
+    if meta.get("version") != CACHE_VERSION or meta.get("role") != role:
+        return "stale", entry
+    stamp = _stamp(Path(source))
+    if stamp == {"size": meta["size"], "mtime_ns": meta["mtime_ns"]}:
+        return "fresh", entry
+    if stamp["size"] == meta["size"] and file_sha256(source) == meta["sha256"]:
+        return "restamp", entry
+    return "stale", entry
+
+
+def cache_status(source: Path, role: str) -> str:
+    """"fresh", "restamp" (same content, new mtime), "stale" or "missing"."""
+    return _lookup(source, role)[0]
+
+
+def load_columns(source: Path, role: str) -> Entry:
+    """Cache entry for a raw file: read when valid, otherwise parsed from JSON and written."""
+    source = Path(source)
+    status, entry = _lookup(source, role)
+    if status == "fresh":
+        return entry
+    if status == "restamp":
+        meta, arrays, vocab = entry
+        entry = ({**meta, **_stamp(source)}, arrays, vocab)
+        _save(cache_path(source), entry)
+        return entry
+    return write_cache(source, role)
+
+
+# ---------------------------------------------------------
+# 🏏 / 🎯 Columns → innings
+# ---------------------------------------------------------
+def iter_batting(entry: Entry) -> Iterator[Tuple[str, CompactInnings]]:
+    """(player_name, CompactInnings) pairs, equal to innings_from_record over the raw rows."""
+    c = _column_lists(entry[1], entry[2])
+    for row in zip(c["player_name"], c["runs"], c["balls"], c["fours"], c["sixes"], c["result"],
+                   c["chasing"], c["knockout"], c["opposition_tier"], c["team_runs"], c["team_wickets"]):
+        name, runs, balls, fours, sixes, result, chasing, knockout, tier, team_runs, team_wickets = row
+        yield name, CompactInnings(
+            runs=runs, balls=balls, fours=fours, sixes=sixes, dismissed=True,
+            result=result, chasing=chasing, knockout=knockout,
+            opposition_tier=tier, match_format="T20",
+            team_score_at_entry=team_runs, wickets_at_entry=team_wickets, required_run_rate=0.0,
+        )
+
+
+def iter_bowling(entry: Entry, team: str) -> Iterator[CompactBowlingInnings]:
+    """CompactBowlingInnings, equal to bowling_innings_from_record over the raw rows."""
+    c = _column_lists(entry[1], entry[2])
+
+    # At most 256 distinct flag bytes: decode each once (the compact class re-packs them)
+    contexts = {}
+    for flags in set(c["pressure_flags"]):
+        contexts[flags] = {
+            key: bool(flags & value_bit)
+            for key, (value_bit, present_bit) in PRESSURE_BITS.items()
+            if flags & present_bit
+        }
+
+    rows = zip(c["bowler_name"], c["overs"], c["maidens"], c["runs_conceded"], c["wickets"], c["economy"],
+               c["opposition"], c["opposition_tier"], c["result"], c["knockout"],
+               zip(*(c[key] for key in PHASE_KEYS)), c["pressure_flags"])
+    for name, overs, maidens, runs, wickets, economy, opposition, tier, result, knockout, phase, flags in rows:
+        yield CompactBowlingInnings(
+            bowler_name=name, team=team,
+            overs=overs, maidens=maidens, runs_conceded=runs, wickets=wickets, economy=economy,
+            opposition=opposition, opposition_tier=tier, result=result, knockout=knockout,
+            bowling_phase={key: value for key, value in zip(PHASE_KEYS, phase) if value == value},  # NaN = absent
+            pressure_context=contexts[flags],
+        )
+
+
+def entry_innings(entry: Entry, role: str, team: str) -> Iterator:
+    """Innings stream of one cache entry, in the shape the export scorers take."""
+    return iter_batting(entry) if role == "batting" else iter_bowling(entry, team)
+
+
+def cached_innings(source: Path, role: str, team: str) -> Iterator:
+    """Innings stream for one raw file via the cache."""
+    return entry_innings(load_columns(source, role), role, team)
+
+
+# ---------------------------------------------------------
+# 🧮 Columns → frames (no innings objects)
+# ---------------------------------------------------------
+def _decoded(entry: Entry, key: str, convert, dtype) -> np.ndarray:
+    """A string column converted once per vocabulary word, then gathered by code."""
+    meta, arrays, vocab = entry
+    return np.asarray([convert(word) for word in vocab[key]], dtype=dtype)[arrays[key]]
+
+
+def _concatenate(parts: List[Dict[str, np.ndarray]], dtypes: Dict[str, type]) -> Dict[str, np.ndarray]:
+    return {
+        name: np.concatenate([np.empty(0, dtype=dtype)] + [part[name] for part in parts]).astype(dtype, copy=False)
+        for name, dtype in dtypes.items()
+    }
+
+
+def batting_frame(entries: Iterable[Entry]) -> InningsFrame:
+    """
+    One InningsFrame over batting entries in order, built from the columns; equal to
+    InningsFrame.from_innings over their iter_batting streams.
+    """
+    players: Dict[str, int] = {}
+    parts = []
+    for entry in entries:
+        arrays = entry[1]
+        n = len(arrays["runs"])
+        parts.append({
+            "player": _decoded(entry, "player_name", lambda name: players.setdefault(name, len(players)), np.int32),
+            "runs": arrays["runs"],
+            "balls": arrays["balls"],
+            "fours": arrays["fours"],
+            "sixes": arrays["sixes"],
+            "dismissed": np.ones(n, dtype=bool),
+            "won": _decoded(entry, "result", lambda result: result == "Win", bool),
+            "chasing": arrays["chasing"],
+            "knockout": arrays["knockout"],
+            "tier": _decoded(entry, "opposition_tier", tier_code, np.int8),
+            "team_score_at_entry": arrays["team_runs"],
+            "wickets_at_entry": arrays["team_wickets"],
+            "required_run_rate": np.zeros(n, dtype=np.float64),
+            "match_format": np.full(n, FORMAT_CODES["T20"], dtype=np.int8),
+        })
+    return InningsFrame(list(players), _concatenate(parts, InningsFrame.COLUMNS))
+
+
+def bowling_frame(entries: Iterable[Entry], team: str) -> BowlingFrame:
+    """
+    One BowlingFrame over bowling entries in order, built from the columns (pressure
+    tags straight from the packed flag bits); equal to BowlingFrame.from_innings over
+    their iter_bowling streams.
+    """
+    bowlers: Dict[str, int] = {}
+    parts = []
+    for entry in entries:
+        arrays = entry[1]
+        flags = arrays["pressure_flags"]
+        parts.append({
+            "bowler": _decoded(entry, "bowler_name", lambda name: bowlers.setdefault(name, len(bowlers)), np.int32),
+            "overs": arrays["overs"],
+            "maidens": arrays["maidens"],
+            "runs_conceded": arrays["runs_conceded"],
+            "wickets": arrays["wickets"],
+            "economy": arrays["economy"],
+            "tier": _decoded(entry, "opposition_tier", tier_code, np.int8),
+            "won": _decoded(entry, "result", lambda result: result == "Win", bool),
+            "knockout": arrays["knockout"],
+            "match_pressure": (flags & PRESSURE_BITS["match_pressure"][0]) != 0,
+            "powerplay": (flags & PRESSURE_BITS["bowled_in_powerplay"][0]) != 0,
+            "death": (flags & PRESSURE_BITS["bowled_in_death"][0]) != 0,
+            "defending": (flags & PRESSURE_BITS["defending_target"][0]) != 0,
+        })
+    return BowlingFrame(list(bowlers), [team] * len(bowlers), _concatenate(parts, BowlingFrame.COLUMNS))
+
+
+# ---------------------------------------------------------
+# ✅ CLI: status / rebuild / verify / bench
+# ---------------------------------------------------------
+def manifest_sources() -> List[Tuple[Path, str, str]]:
+    from backend.intelligence.engine.export_pipeline import load_manifest
+
+    data_dir, datasets = load_manifest()
+    seen = {}
+    for dataset in datasets:
+        for name in dataset.inputs:
+            seen.setdefault(data_dir / name, (dataset.role, dataset.team))
+    return [(path, role, team) for path, (role, team) in seen.items()]
+
+
+def _same_frame(a, b, labels: Tuple[str, ...]) -> bool:
+    return (
+        all(getattr(a, name) == getattr(b, name) for name in labels)
+        and all(np.array_equal(getattr(a, name), getattr(b, name)) for name in a.COLUMNS)
+    )
+
+
+def verify(source: Path, role: str, team: str) -> bool:
+    """Cached innings, and the frame built from the columns, must equal a fresh parse of the raw file."""
+    if cache_status(source, role) not in ("fresh", "restamp"):
+        return False
+    entry = load_columns(source, role)
+    cached = list(cached_innings(source, role, team))
+    if role == "batting":
+        parsed = [(row["player_name"], innings_from_record(row)) for row in iter_records(source)]
+        return cached == parsed and _same_frame(batting_frame([entry]), InningsFrame.from_innings(parsed), ("players",))
+    parsed = [bowling_innings_from_record(row, team) for row in iter_records(source)]
+    return cached == parsed and _same_frame(
+        bowling_frame([entry], team), BowlingFrame.from_innings(parsed), ("bowlers", "team")
+    )
+
+
+def bench(sources: List[Tuple[Path, str, str]], repeat: int) -> Tuple[float, float]:
+    def parse_json():
+        for path, role, team in sources:
+            if role == "batting":
+                for row in iter_records(path):
+                    innings_from_record(row)
+            else:
+                for row in iter_records(path):
+                    bowling_innings_from_record(row, team)
+
+    def from_cache():
+        for path, role, team in sources:
+            for _ in cached_innings(path, role, team):
+                pass
+
+    timings = []
+    for fn in (parse_json, from_cache):
+        fn()
+        started = time.perf_counter()
+        for _ in range(repeat):
+            fn()
+        timings.append((time.perf_counter() - started) / repeat)
+    return timings[0], timings[1]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Columnar cache of the raw SMAT files")
+    parser.add_argument("command", choices=["status", "rebuild", "verify", "bench"])
+    parser.add_argument("--repeat", type=int, default=20, help="timing repetitions for bench")
+    args = parser.parse_args()
+
+    sources = manifest_sources()
+
+    if args.command == "status":
+        for path, role, _ in sources:
+            print(f"{cache_status(path, role):<8} {path}")
+    elif args.command == "rebuild":
+        for path, role, _ in sources:
+            write_cache(path, role)
+            print(f"✅ {cache_path(path)} ({cache_path(path).stat().st_size / 1024:.1f} KB)")
+    elif args.command == "verify":
+        bad = [path for path, role, team in sources if not verify(path, role, team)]
+        for path in bad:
+            print(f"❌ {path}: cache missing, stale or different from the raw file")
+        print("✅ Cache matches raw files" if not bad else f"❌ {len(bad)} bad entries")
+        return 1 if bad else 0
+    else:
+        for path, role, _ in sources:
+            load_columns(path, role)
+        json_s, cache_s = bench(sources, args.repeat)
+        print(f"JSON parse {json_s * 1000:.2f} ms | cache {cache_s * 1000:.2f} ms | {json_s / cache_s:.1f}× faster")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
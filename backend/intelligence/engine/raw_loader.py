@@ -0,0 +1,170 @@
+# backend/intelligence/engine/raw_loader.py
+
+"""
+Streaming reader for raw SMAT records.
+
+Yields one record at a time from either
+- a top-level JSON array (the committed *.json files), decoded element by element
+  from fixed-size chunks, or
+- newline-delimited JSON (*.jsonl / *.ndjson), one record per line,
+so the exporters can feed innings straight into the accumulators: peak memory tracks
+the number of players, not the number of matches in the file.
+
+Peak-memory comparison for one file (run from the repo root):
+    python3 -m backend.intelligence.engine.raw_loader backend/cricket-api/data/TN_Smat_Bowlers.json --role bowling
+"""
+
+import argparse
+import json
+import tracemalloc
+from pathlib import Path
+from typing import Iterator
+
+CHUNK_SIZE = 1 << 16
+JSONL_SUFFIXES = {".jsonl", ".ndjson"}
+
+_decoder = json.JSONDecoder()
+_WHITESPACE = " \t\r\n"
+_DELIMITERS = ",]" + _WHITESPACE
+
+
+def iter_records(path: Path) -> Iterator[dict]:
+    """Records of one raw file, in file order."""
+    path = Path(path)
+    if path.suffix in JSONL_SUFFIXES:
+        return iter_jsonl(path)
+    return iter_json_array(path)
+
+
+def iter_jsonl(path: Path) -> Iterator[dict]:
+    with open(path, "r", encoding="utf-8") as f:
+        for line_no, line in enumerate(f, 1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError as e:
+                raise ValueError(f"{path}:{line_no}: {e.msg}") from None
+
+
+def iter_json_array(path: Path, chunk_size: int = CHUNK_SIZE) -> Iterator[dict]:
+    """Elements of a top-level JSON array, without holding the whole document."""
+    with open(path, "r", encoding="utf-8") as f:
+        buf = ""
+        pos = 0
+        eof = False
+
+        def fill() -> bool:
+            nonlocal buf, pos, eof
+            chunk = f.read(chunk_size)
+            if not chunk:
+                eof = True
+                return False
+            buf = buf[pos:] + chunk
+            pos = 0
+            return True
+
+        def skip_whitespace():
+            nonlocal pos
+            while True:
+                while pos < len(buf) and buf[pos] in _WHITESPACE:
+                    pos += 1
+                if pos < len(buf) or not fill():
+                    return
+
+        skip_whitespace()
+        if pos >= len(buf) or buf[pos] != "[":
+            raise ValueError(f"{path}: expected a top-level JSON array")
+        pos += 1
+
+        first = True
+        expect_value = True     # right after "[" or ","
+        while True:
+            skip_whitespace()
+            if pos >= len(buf):
+                raise ValueError(f"{path}: unterminated JSON array")
+
+            ch = buf[pos]
+            if ch == "]":
+                if expect_value and not first:
+                    raise ValueError(f"{path}: trailing ',' before ']'")
+                return
+            if ch == ",":
+                if expect_value:
+                    raise ValueError(f"{path}: unexpected ','")
+                expect_value = True
+                pos += 1
+                continue
+            if not expect_value:
+                raise ValueError(f"{path}: expected ',' or ']'")
+
+            while True:
+                try:
+                    value, end = _decoder.raw_decode(buf, pos)
+                except json.JSONDecodeError as e:
+                    if eof or not fill():
+                        raise ValueError(f"{path}: {e.msg}") from None
+                    continue
+                # A bare number cut by the chunk boundary ("-1." | "5e3") is only complete
+                # once a delimiter follows it
+                if (not isinstance(value, (dict, list)) and not eof
+                        and (end == len(buf) or buf[end] not in _DELIMITERS) and fill()):
+                    continue
+                break
+
+            pos = end
+            first = expect_value = False
+            yield value
+
+
+def count_records(records, counter: list) -> Iterator[dict]:
+    """Pass-through that counts rows into counter[0] (for job reports)."""
+    for record in records:
+        counter[0] += 1
+        yield record
+
+
+# ---------------------------------------------------------
+# 📏 Peak memory: json.load + lists vs streaming
+# ---------------------------------------------------------
+def peak_kb(fn) -> float:
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak / 1024
+
+
+def main():
+    from backend.intelligence.engine.accumulators import accumulate_batters, accumulate_bowlers
+    from backend.intelligence.models.bowling_frame import bowling_innings_from_record
+    from backend.intelligence.models.innings_frame import innings_from_record
+
+    parser = argparse.ArgumentParser(description="Compare peak memory of eager vs streaming loads")
+    parser.add_argument("path", type=Path)
+    parser.add_argument("--role", choices=["batting", "bowling"], default="batting")
+    args = parser.parse_args()
+
+    def score(records):
+        if args.role == "batting":
+            return accumulate_batters((row["player_name"], innings_from_record(row)) for row in records)
+        return accumulate_bowlers(bowling_innings_from_record(row, "") for row in records)
+
+    def eager():
+        with open(args.path, "r", encoding="utf-8") as f:
+            records = [json.loads(line) for line in f if line.strip()] \
+                if args.path.suffix in JSONL_SUFFIXES else json.load(f)
+        return score(records)
+
+    def streaming():
+        return score(iter_records(args.path))
+
+    assert {k: v.stats() for k, v in eager().items()} == {k: v.stats() for k, v in streaming().items()}
+    eager_kb = peak_kb(eager)
+    stream_kb = peak_kb(streaming)
+    print(f"eager json.load {eager_kb:10.1f} KB peak | streaming {stream_kb:10.1f} KB peak")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,326 @@
+# backend/intelligence/engine/vectorized_batting.py
+
+"""
+Vectorized batting metrics over an InningsFrame.
+
+Same formulas as engine/batting_scores.py, but every player is scored in one grouped
+pass over the columns instead of one Python loop per player and metric.
+
+Parity check against the scalar functions (run from the repo root):
+    python3 -m backend.intelligence.engine.vectorized_batting
+    python3 -m backend.intelligence.engine.vectorized_batting --synthetic 1000000
+"""
+
+import argparse
+import json
+import time
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from backend.intelligence.engine.batting_scores import (
+    clamp,
+    compute_base_skill_score,
+    compute_consistency_score,
+    compute_opposition_quality_score
+)
+from backend.intelligence.models.innings import Innings
+from backend.intelligence.models.innings_frame import InningsFrame, TIER_CODES, TIER_OTHER, innings_from_record
+from backend.intelligence.rules.pressure_bits import bucket_mask, bucket_mask_batch, pressure_mask, tag_pressure_batch
+
+DATA_DIR = Path("backend/cricket-api/data")
+
+BATTING_FILES = [
+    "TN_Smat_TopOrder.json",
+    "TN_Smat_MiddleOrder.json",
+    "TN_Smat_Finisher.json",
+    "Ker_Smat_TopOrder.json",
+    "Ker_Smat_MiddleOrder.json",
+    "Ker_Smat_Finisher.json",
+]
+
+# Opposition weights by tier code (same table as compute_opposition_quality_score)
+OPPOSITION_TIER_WEIGHTS = np.array([1.0, 0.6, 0.3, 0.3])
+assert TIER_CODES == {"A": 0, "B": 1, "C": 2} and TIER_OTHER == 3
+
+
+# --------------------------------------------------
+# Helpers
+# --------------------------------------------------
+
+def normalize_linear(values: np.ndarray, low, high) -> np.ndarray:
+    """Element-wise normalize_linear from batting_scores.py."""
+    scaled = ((values - low) / (high - low)) * 100
+    return np.where(values <= low, 0.0, np.where(values >= high, 100.0, scaled))
+
+
+def _divide(numerator, denominator, fallback) -> np.ndarray:
+    """numerator / denominator where denominator > 0, else fallback."""
+    numerator = np.asarray(numerator, dtype=np.float64)
+    denominator = np.asarray(denominator, dtype=np.float64)
+    out = np.broadcast_to(np.asarray(fallback, dtype=np.float64), numerator.shape).copy()
+    np.divide(numerator, denominator, out=out, where=denominator > 0)
+    return out
+
+
+def round_scores(values: np.ndarray) -> np.ndarray:
+    """
+    Python round(x, 2) per player (not np.round, which rounds some halves differently),
+    then clamp to 0–100 like clamp(round(...)).
+    """
+    rounded = np.array([round(v, 2) for v in values.tolist()], dtype=np.float64)
+    return np.clip(rounded, 0, 100)
+
+
+# --------------------------------------------------
+# 1️⃣ BASE SKILL SCORE
+# --------------------------------------------------
+
+def compute_base_skill_scores(frame: InningsFrame) -> np.ndarray:
+    """compute_base_skill_score for every player in the frame → array indexed by player code."""
+    total_runs = frame.group_sum(frame.runs)
+    total_balls = frame.group_sum(frame.balls)
+    dismissals = frame.group_count(frame.dismissed)
+
+    fours = frame.group_sum(frame.fours)
+    sixes = frame.group_sum(frame.sixes)
+
+    batting_avg = _divide(total_runs, dismissals, total_runs)
+    strike_rate = _divide(total_runs, total_balls, 0.0) * 100
+    balls_per_dismissal = _divide(total_balls, dismissals, total_balls)
+
+    boundary_runs = (fours * 4) + (sixes * 6)
+    boundary_pct = _divide(boundary_runs, total_runs, 0.0) * 100
+
+    avg_score = normalize_linear(batting_avg, 20, 40)
+    sr_score = normalize_linear(strike_rate, 110, 150)
+    bpd_score = normalize_linear(balls_per_dismissal, 15, 30)
+
+    # Boundary balance (penalize over-dependence)
+    boundary_score = np.select(
+        [boundary_pct < 40, boundary_pct <= 55, boundary_pct <= 65],
+        [60, 100, 70],
+        40,
+    )
+
+    base_skill = (
+        0.35 * avg_score
+        + 0.30 * sr_score
+        + 0.20 * bpd_score
+        + 0.15 * boundary_score
+    )
+
+    return round_scores(base_skill)
+
+
+# --------------------------------------------------
+# 2️⃣ CONSISTENCY SCORE
+# --------------------------------------------------
+
+def compute_consistency_scores(frame: InningsFrame) -> np.ndarray:
+    """compute_consistency_score for every player; innings are taken in frame (match) order."""
+    total = frame.counts()
+
+    contrib_30 = frame.group_count(frame.runs >= 30) / total
+    contrib_50 = frame.group_count(frame.runs >= 50) / total
+
+    # Sample stdev from exact integer sums: var = (n·Σx² − (Σx)²) / (n·(n − 1))
+    sum_x = frame.group_sum(frame.runs)
+    sum_x2 = frame.group_sum(frame.runs * frame.runs)
+    enough = total >= 3
+    variance = _divide(total * sum_x2 - sum_x * sum_x, total * (total - 1) * enough, 0.0)
+    variance_penalty = np.where(enough, 100 - normalize_linear(np.sqrt(variance), 5, 35), 0)
+
+    # Failure recovery: a <10 innings followed by a 30+ innings of the same player
+    order = frame.order()
+    player = frame.player[order]
+    runs = frame.runs[order]
+    recovered = (player[1:] == player[:-1]) & (runs[:-1] < 10) & (runs[1:] >= 30)
+    recovery_count = np.bincount(player[1:][recovered], minlength=frame.n_players)
+    recovery_score = (recovery_count / total) * 100
+
+    consistency = (
+        0.40 * (contrib_30 * 100)
+        + 0.25 * (contrib_50 * 100)
+        + 0.20 * variance_penalty
+        + 0.15 * recovery_score
+    )
+
+    return round_scores(consistency)
+
+
+# --------------------------------------------------
+# 3️⃣ OPPOSITION QUALITY SCORE
+# --------------------------------------------------
+
+def compute_opposition_quality_scores(frame: InningsFrame) -> np.ndarray:
+    """compute_opposition_quality_score for every player in the frame."""
+    weight = OPPOSITION_TIER_WEIGHTS[frame.tier]
+    weighted = frame.runs * weight
+
+    weighted_runs = frame.group_sum(weighted)
+    weighted_balls = frame.group_sum(frame.balls * weight)
+    weight_sum = frame.group_sum(weight)
+
+    win_contrib = frame.group_sum(np.where(frame.won, weighted, 0.0))
+    win_weight = frame.group_sum(np.where(frame.won, weight, 0.0))
+
+    avg_vs_quality = _divide(weighted_runs, weight_sum, 0.0)
+    sr_vs_quality = _divide(weighted_runs, weighted_balls, 0.0) * 100
+
+    avg_score = normalize_linear(avg_vs_quality, 20, 40)
+    sr_score = normalize_linear(sr_vs_quality, 110, 150)
+
+    win_impact = _divide(win_contrib, win_weight, 0.0)
+    win_score = normalize_linear(win_impact, 15, 40)
+
+    opposition_quality = (
+        0.50 * avg_score
+        + 0.30 * win_score
+        + 0.20 * sr_score
+    )
+
+    return round_scores(opposition_quality)
+
+
+# --------------------------------------------------
+# Frame-wide scoring + parity check
+# --------------------------------------------------
+
+def score_frame(frame: InningsFrame) -> Dict[str, Dict[str, float]]:
+    """
+    {player_name: {baseSkillScore, consistencyScore, oppositionQualityScore}} for every player.
+    Values go through clamp() once more: like the scalar scores, a score floored at 0 is the
+    int 0, which the exported JSON writes differently from 0.0.
+    """
+    base = compute_base_skill_scores(frame)
+    consistency = compute_consistency_scores(frame)
+    opposition = compute_opposition_quality_scores(frame)
+
+    return {
+        name: {
+            "baseSkillScore": clamp(float(base[code])),
+            "consistencyScore": clamp(float(consistency[code])),
+            "oppositionQualityScore": clamp(float(opposition[code])),
+        }
+        for code, name in enumerate(frame.players)
+    }
+
+
+SCALAR_METRICS = {
+    "baseSkillScore": compute_base_skill_score,
+    "consistencyScore": compute_consistency_score,
+    "oppositionQualityScore": compute_opposition_quality_score,
+}
+
+
+def check_parity(players_map: Dict[str, List[Innings]]) -> List[Tuple[str, str, float, float]]:
+    """
+    Score players_map with the scalar functions and the vectorized ones.
+    Returns every (player, metric, scalar, vectorized) that differs — empty means identical.
+    Values are compared by repr, so an int 0 against a float 0.0 counts as a difference.
+    The per-innings pressure / bucket bits are compared too (metric "pressure_mask" /
+    "bucket_mask").
+    """
+    frame = InningsFrame.from_players(players_map)
+    vectorized = score_frame(frame)
+
+    mismatches = []
+    for name, innings in players_map.items():
+        for metric, scalar_fn in SCALAR_METRICS.items():
+            expected = scalar_fn(innings)
+            actual = vectorized[name][metric]
+            if repr(expected) != repr(actual):
+                mismatches.append((name, metric, expected, actual))
+
+    rows = [(name, inn) for name, innings in players_map.items() for inn in innings]
+    for metric, scalar_fn, batch in (("pressure_mask", pressure_mask, tag_pressure_batch(frame)),
+                                     ("bucket_mask", bucket_mask, bucket_mask_batch(frame))):
+        for (name, inn), actual in zip(rows, batch.tolist()):
+            expected = scalar_fn(inn)
+            if expected != actual:
+                mismatches.append((name, metric, expected, actual))
+    return mismatches
+
+
+def synthetic_players(n_innings: int, n_players: int, seed: int = 0) -> Dict[str, List[Innings]]:
+    """Random T20 innings for scale / parity runs (not real data, never exported)."""
+    rng = np.random.default_rng(seed)
+    players_map = {}
+    owners = rng.integers(n_players, size=n_innings)
+    runs = rng.integers(0, 120, size=n_innings)
+    balls = np.maximum(runs // 2 + rng.integers(-5, 30, size=n_innings), 1)
+    tiers = rng.choice(["A", "B", "C", "D"], size=n_innings)
+    flags = rng.random((n_innings, 4)) < 0.5
+
+    for k in range(n_innings):
+        players_map.setdefault(f"Player {owners[k]}", []).append(Innings(
+            runs=int(runs[k]), balls=int(balls[k]),
+            fours=int(runs[k] // 12), sixes=int(runs[k] // 25),
+            dismissed=bool(flags[k, 0]),
+            result="Win" if flags[k, 1] else "Loss",
+            chasing=bool(flags[k, 2]), knockout=bool(flags[k, 3]),
+            opposition_tier=str(tiers[k]), match_format="T20",
+            team_score_at_entry=0, wickets_at_entry=0, required_run_rate=0.0,
+        ))
+    return players_map
+
+
+def mixed_case_players() -> Dict[str, List[Innings]]:
+    """
+    One player's raw records with lower- and upper-case tiers, through innings_from_record
+    (the raw files only carry "A" / "B").
+    """
+    rows = [
+        {"runs": runs, "balls": balls, "fours": 1, "result": "Win", "chasing": chasing,
+         "opposition_tier": tier, "team_runs": 40, "team_wickets": 3}
+        for runs, balls, tier, chasing in ((34, 22, "a", True), (12, 15, "A", False),
+                                           (50, 31, "b", True), (7, 9, "c", False))
+    ]
+    return {"Mixed Case": [innings_from_record(row) for row in rows]}
+
+
+def load_smat_players() -> Dict[str, List[Innings]]:
+    players_map = {}
+    for f in BATTING_FILES:
+        with open(DATA_DIR / f, "r") as file:
+            for row in json.load(file):
+                players_map.setdefault(row["player_name"], []).append(innings_from_record(row))
+    return players_map
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Parity check: vectorized vs scalar batting metrics")
+    parser.add_argument("--synthetic", type=int, metavar="N", help="use N random innings instead of the SMAT files")
+    parser.add_argument("--players", type=int, default=5000, help="players for --synthetic")
+    args = parser.parse_args()
+
+    players_map = synthetic_players(args.synthetic, args.players) if args.synthetic else load_smat_players()
+    players_map.update(mixed_case_players())
+    n_innings = sum(len(v) for v in players_map.values())
+
+    started = time.perf_counter()
+    for innings in players_map.values():
+        for scalar_fn in SCALAR_METRICS.values():
+            scalar_fn(innings)
+    scalar_s = time.perf_counter() - started
+
+    started = time.perf_counter()
+    frame = InningsFrame.from_players(players_map)
+    build_s = time.perf_counter() - started
+    started = time.perf_counter()
+    score_frame(frame)
+    vector_s = time.perf_counter() - started
+
+    mismatches = check_parity(players_map)
+    print(f"{n_innings} innings, {len(players_map)} players, frame {frame.nbytes() / 2**20:.1f} MB")
+    print(f"scalar {scalar_s:.3f}s | frame build {build_s:.3f}s + vectorized {vector_s:.3f}s")
+    for name, metric, expected, actual in mismatches[:20]:
+        print(f"❌ {name} {metric}: scalar {expected} vs vectorized {actual}")
+    print("✅ Parity OK" if not mismatches else f"❌ {len(mismatches)} mismatches")
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
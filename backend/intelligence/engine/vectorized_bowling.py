@@ -0,0 +1,373 @@
+# backend/intelligence/engine/vectorized_bowling.py
+
+"""
+Array-backed twin of compute_bowling_scores.
+
+All four bowling metrics are computed for every bowler at once from a BowlingFrame:
+per-bowler totals and population stdevs are grouped reductions, and the T20 economy /
+wicket bands are searchsorted lookups into small band tables. The output is the same
+list of selector-ready dicts, in the same order.
+
+Parity check against compute_bowling_scores (run from the repo root):
+    python3 -m backend.intelligence.engine.vectorized_bowling
+    python3 -m backend.intelligence.engine.vectorized_bowling --synthetic 1000000
+    python3 -m backend.intelligence.engine.vectorized_bowling --band-edges 100000
+"""
+
+import argparse
+import json
+import time
+from typing import Dict, List
+
+import numpy as np
+
+from backend.intelligence.engine.accumulators import Moments
+from backend.intelligence.engine.bowling_scores import compute_bowling_scores
+from backend.intelligence.models.bowling_frame import BowlingFrame, bowling_innings_from_record
+from backend.intelligence.models.bowling_innings import BowlingInnings
+from backend.intelligence.rules.pressure_bits import (
+    BOWLING_KNOCKOUT,
+    DEATH,
+    MATCH,
+    POWERPLAY,
+    QUALITY_OPPOSITION,
+    bowling_pressure_mask,
+    has,
+    tag_bowling_pressure_batch
+)
+
+RAW_DATA_FILES = {
+    "Tamil Nadu": "backend/cricket-api/data/TN_Smat_Bowlers.json",
+    "Kerala": "backend/cricket-api/data/Kerala_Smat_Bowlers.json",
+}
+
+# Stdevs this close to a band edge are recomputed exactly (same result as statistics.pstdev)
+BAND_EDGE_EPSILON = 1e-9
+
+
+# --------------------------------------------------
+# Band tables
+# --------------------------------------------------
+
+class Band:
+    """
+    Piecewise-constant band: `edges` ascending, `values` has len(edges) + 1 entries.
+    upper=True  → value[i] applies to edges[i-1] <  x <= edges[i]   (x <= 6.5, x <= 7.5, ...)
+    upper=False → value[i] applies to edges[i-1] <= x <  edges[i]   (x >= 0.5, x >= 1.0, ...)
+    """
+
+    def __init__(self, edges, values, upper: bool):
+        self.edges = np.asarray(edges, dtype=np.float64)
+        self.values = np.asarray(values, dtype=np.float64)
+        self.side = "left" if upper else "right"
+
+    def __call__(self, x: np.ndarray) -> np.ndarray:
+        return self.values[np.searchsorted(self.edges, x, side=self.side)]
+
+    def near_edge(self, x: np.ndarray) -> np.ndarray:
+        return (np.abs(x[:, None] - self.edges[None, :]) <= BAND_EDGE_EPSILON).any(axis=1)
+
+
+# base_bowling: economy, wickets per match
+BASE_ECONOMY = Band([6.5, 7.5, 8.5, 9.5], [20, 12, 5, -5, -15], upper=True)
+BASE_WICKETS = Band([0.5, 1.0, 2.0], [-5, 2, 8, 15], upper=False)
+
+# consistency_bowling: stdev of economy, stdev of wickets
+CONSISTENCY_ECONOMY_STD = Band([0.75, 1.25, 2.0, 3.0], [25, 15, 5, -10, -20], upper=True)
+CONSISTENCY_WICKET_STD_LOW = Band([0.5], [5, 0], upper=True)       # <= 0.5 → +5
+CONSISTENCY_WICKET_STD_HIGH = Band([1.5], [0, -5], upper=False)    # >= 1.5 → −5
+
+# opposition_bowling: per-spell economy, wickets
+OPPOSITION_ECONOMY = Band([7.0, 8.0, 9.0], [15, 8, -5, -12], upper=True)
+OPPOSITION_WICKETS = Band([1, 2], [-4, 6, 12], upper=False)
+OPPOSITION_TIER_WEIGHTS = np.array([1.2, 1.0, 0.8, 1.0])   # A, B, C, other
+
+# pressure_bowling: per-spell economy, wickets
+PRESSURE_ECONOMY = Band([7.5, 8.5, 9.5], [15, 5, -5, -15], upper=True)
+PRESSURE_WICKETS = Band([1, 2], [-5, 7, 15], upper=False)
+
+
+# --------------------------------------------------
+# Helpers
+# --------------------------------------------------
+
+def dampen(score: np.ndarray, small_sample: np.ndarray) -> np.ndarray:
+    """(score * 0.7) + (50.0 * 0.3) where the sample is too small."""
+    return np.where(small_sample, (score * 0.7) + (50.0 * 0.3), score)
+
+
+def round2(values: np.ndarray) -> np.ndarray:
+    """Python round(x, 2) per bowler, exactly like the scalar metrics."""
+    return np.array([round(v, 2) for v in values.tolist()], dtype=np.float64)
+
+
+def _exact_pstdev(frame: BowlingFrame, values: np.ndarray, std: np.ndarray, bands) -> np.ndarray:
+    """
+    Recompute stdevs that sit on a band edge exactly (accumulators.Moments, bit-identical to
+    statistics.pstdev), for those bowlers only. Each bowler's spells are one contiguous slice
+    of the frame's grouped order, so the cost follows the suspects' spells, not the frame size.
+    """
+    suspect = np.zeros(len(std), dtype=bool)
+    for band in bands:
+        suspect |= band.near_edge(std)
+    if suspect.any():
+        std = std.copy()
+        for code in np.flatnonzero(suspect).tolist():
+            moments = Moments()
+            for x in values[frame.rows_of(code)].tolist():
+                moments.add(x)
+            std[code] = moments.pstdev()
+    return std
+
+
+# --------------------------------------------------
+# Metrics (arrays indexed by bowler code)
+# --------------------------------------------------
+
+def compute_base_bowling_skill_scores(frame: BowlingFrame) -> np.ndarray:
+    matches = frame.counts()
+    total_overs = frame.group_sum(frame.overs)
+    total_runs = frame.group_sum(frame.runs_conceded)
+    total_wickets = frame.group_sum(frame.wickets)
+
+    avg_economy = np.full(frame.n_bowlers, 10.0)   # Neutral fallback
+    np.divide(total_runs, total_overs, out=avg_economy, where=total_overs > 0)
+    wickets_per_match = total_wickets / matches
+
+    score = 50.0 + BASE_ECONOMY(avg_economy) + BASE_WICKETS(wickets_per_match)
+    score = dampen(score, matches < 3)
+    return round2(np.clip(score, 0.0, 100.0))
+
+
+def compute_consistency_bowling_scores(frame: BowlingFrame) -> np.ndarray:
+    matches = frame.counts()
+
+    econ_std = _exact_pstdev(
+        frame, frame.economy, frame.group_pstdev(frame.economy), [CONSISTENCY_ECONOMY_STD]
+    )
+    wicket_std = _exact_pstdev(
+        frame, frame.wickets, frame.group_pstdev(frame.wickets.astype(np.float64)),
+        [CONSISTENCY_WICKET_STD_LOW, CONSISTENCY_WICKET_STD_HIGH],
+    )
+
+    score = (
+        50.0
+        + CONSISTENCY_ECONOMY_STD(econ_std)
+        + CONSISTENCY_WICKET_STD_LOW(wicket_std)
+        + CONSISTENCY_WICKET_STD_HIGH(wicket_std)
+    )
+    score = dampen(score, matches < 4)
+    score = round2(np.clip(score, 0.0, 100.0))
+
+    # Not enough data to judge consistency
+    return np.where(matches < 2, 45.0, score)
+
+
+def compute_opposition_quality_bowling_scores(frame: BowlingFrame) -> np.ndarray:
+    weight = OPPOSITION_TIER_WEIGHTS[frame.tier]
+
+    spell_score = 50.0 + OPPOSITION_ECONOMY(frame.economy) + OPPOSITION_WICKETS(frame.wickets)
+    spell_score = np.clip(spell_score, 0.0, 100.0)
+
+    weighted = frame.group_sum(spell_score * weight)
+    total_weight = frame.group_sum(weight)
+
+    final_score = weighted / total_weight
+    final_score = dampen(final_score, frame.counts() < 3)
+    return round2(final_score)
+
+
+def compute_pressure_bowling_scores(frame: BowlingFrame) -> np.ndarray:
+    tags = tag_bowling_pressure_batch(frame)
+    pressure = has(tags, MATCH)
+
+    spell_score = (
+        50.0
+        + PRESSURE_ECONOMY(frame.economy)
+        + PRESSURE_WICKETS(frame.wickets)
+        + 5.0 * has(tags, POWERPLAY)
+        + 10.0 * has(tags, DEATH)
+        + 5.0 * has(tags, QUALITY_OPPOSITION)
+        + 5.0 * has(tags, BOWLING_KNOCKOUT)
+    )
+    spell_score = np.clip(spell_score, 0.0, 100.0)
+
+    n_pressure = np.bincount(frame.bowler[pressure], minlength=frame.n_bowlers)
+    total = np.bincount(frame.bowler[pressure], weights=spell_score[pressure], minlength=frame.n_bowlers)
+
+    avg_score = total / np.maximum(n_pressure, 1)
+    avg_score = dampen(avg_score, n_pressure < 3)
+    avg_score = round2(avg_score)
+
+    # No pressure data → neutral-low score
+    return np.where(n_pressure == 0, 40.0, avg_score)
+
+
+# --------------------------------------------------
+# Selector-ready output
+# --------------------------------------------------
+
+def compute_bowling_scores_vectorized(frame: BowlingFrame) -> List[Dict]:
+    """
+    Same output as compute_bowling_scores(innings_list) for BowlingFrame.from_innings(innings_list).
+    """
+    pressure_score = compute_pressure_bowling_scores(frame)
+    base_skill_score = compute_base_bowling_skill_scores(frame)
+    consistency_score = compute_consistency_bowling_scores(frame)
+    opposition_quality_score = compute_opposition_quality_bowling_scores(frame)
+
+    final_score = round2(
+        0.35 * pressure_score
+        + 0.30 * base_skill_score
+        + 0.20 * consistency_score
+        + 0.15 * opposition_quality_score
+    )
+
+    # Bowlers are in first-appearance order; a stable descending sort keeps ties in that order
+    order = np.argsort(-final_score, kind="stable")
+
+    return [
+        {
+            "name": frame.bowlers[code],
+            "team": frame.team[code],
+            "role": "Bowler",
+            "stats": {
+                "pressureScore": float(pressure_score[code]),
+                "baseSkillScore": float(base_skill_score[code]),
+                "consistencyScore": float(consistency_score[code]),
+                "oppositionQualityScore": float(opposition_quality_score[code]),
+                "finalScore": float(final_score[code]),
+            },
+        }
+        for code in order.tolist()
+    ]
+
+
+# --------------------------------------------------
+# Parity check
+# --------------------------------------------------
+
+def load_smat_bowling_innings() -> List[BowlingInnings]:
+    innings_list = []
+    for team, path in RAW_DATA_FILES.items():
+        with open(path, "r", encoding="utf-8") as f:
+            innings_list.extend(bowling_innings_from_record(record, team) for record in json.load(f))
+    return innings_list
+
+
+def synthetic_bowling_innings(n_spells: int, n_bowlers: int, seed: int = 0) -> List[BowlingInnings]:
+    """Random spells for scale / parity runs (not real data, never exported)."""
+    rng = np.random.default_rng(seed)
+    owners = rng.integers(n_bowlers, size=n_spells)
+    overs = rng.integers(1, 5, size=n_spells).astype(float)
+    runs = rng.integers(0, 60, size=n_spells)
+    wickets = rng.integers(0, 5, size=n_spells)
+    tiers = rng.choice(["A", "B", "C"], size=n_spells)
+    flags = rng.random((n_spells, 6)) < 0.4
+
+    return [
+        BowlingInnings(
+            bowler_name=f"Bowler {owners[k]}", team=f"Team {owners[k] % 38}",
+            overs=float(overs[k]), maidens=0, runs_conceded=int(runs[k]), wickets=int(wickets[k]),
+            economy=round(runs[k] / overs[k], 2),
+            opposition="X", opposition_tier=str(tiers[k]),
+            result="Win" if flags[k, 0] else "Loss", knockout=bool(flags[k, 1]),
+            bowling_phase={},
+            pressure_context={
+                "match_pressure": bool(flags[k, 2]),
+                "bowled_in_powerplay": bool(flags[k, 3]),
+                "bowled_in_death": bool(flags[k, 4]),
+                "defending_target": bool(flags[k, 5]),
+            },
+        )
+        for k in range(n_spells)
+    ]
+
+
+def band_edge_bowling_innings(n_bowlers: int, seed: int = 0) -> List[BowlingInnings]:
+    """
+    Spells whose economy / wicket stdevs often land exactly on a consistency band edge
+    (economies on a 0.25 grid, 0–4 wickets, 2–5 spells per bowler), led by the known
+    case: wickets [1, 1, 0, 4] → pstdev exactly 1.5, economies [7.5, 8, 7.5, 6] → 0.75.
+    """
+    rng = np.random.default_rng(seed)
+    bowlers = [([1, 1, 0, 4], [7.5, 7.5, 7.5, 7.5]), ([1, 1, 1, 1], [7.5, 8.0, 7.5, 6.0])]
+    for _ in range(n_bowlers - len(bowlers)):
+        spells = int(rng.integers(2, 6))
+        bowlers.append((rng.integers(0, 5, size=spells).tolist(), (rng.integers(20, 37, size=spells) / 4).tolist()))
+
+    return [
+        BowlingInnings(
+            bowler_name=f"Edge {b}", team="Team", overs=4.0, maidens=0,
+            runs_conceded=int(economy * 4), wickets=int(wickets), economy=float(economy),
+            opposition="X", opposition_tier="B", result="Loss", knockout=False,
+            bowling_phase={}, pressure_context={},
+        )
+        for b, (wicket_counts, economies) in enumerate(bowlers)
+        for wickets, economy in zip(wicket_counts, economies)
+    ]
+
+
+def mixed_case_bowling_innings() -> List[BowlingInnings]:
+    """
+    One bowler's raw records with lower- and upper-case tiers, through bowling_innings_from_record
+    (the raw files only carry "A" / "B").
+    """
+    rows = [
+        {"bowler_name": "Mixed Case", "overs": 4.0, "runs_conceded": runs, "wickets": wickets,
+         "economy": runs / 4, "opposition": "X", "opposition_tier": tier, "result": "Win",
+         "knockout": False, "pressure_context": {"match_pressure": True}}
+        for runs, wickets, tier in ((24, 2, "a"), (30, 1, "A"), (41, 0, "b"), (19, 3, "c"))
+    ]
+    return [bowling_innings_from_record(row, "Team") for row in rows]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Parity check: vectorized vs scalar bowling scores")
+    parser.add_argument("--synthetic", type=int, metavar="N", help="use N random spells instead of the SMAT files")
+    parser.add_argument("--bowlers", type=int, default=5000, help="bowlers for --synthetic")
+    parser.add_argument("--band-edges", type=int, metavar="N",
+                        help="use N bowlers whose stdevs sit on consistency band edges")
+    args = parser.parse_args()
+
+    innings_list = (
+        band_edge_bowling_innings(args.band_edges) if args.band_edges
+        else synthetic_bowling_innings(args.synthetic, args.bowlers) if args.synthetic
+        else load_smat_bowling_innings()
+    ) + mixed_case_bowling_innings()
+
+    started = time.perf_counter()
+    expected = compute_bowling_scores(innings_list)
+    scalar_s = time.perf_counter() - started
+
+    started = time.perf_counter()
+    frame = BowlingFrame.from_innings(innings_list)
+    build_s = time.perf_counter() - started
+    started = time.perf_counter()
+    actual = compute_bowling_scores_vectorized(frame)
+    vector_s = time.perf_counter() - started
+
+    print(f"{len(innings_list)} spells, {frame.n_bowlers} bowlers, frame {frame.nbytes() / 2**20:.1f} MB")
+    print(f"scalar {scalar_s:.3f}s | frame build {build_s:.3f}s + vectorized {vector_s:.3f}s")
+
+    masks = tag_bowling_pressure_batch(frame).tolist()
+    mask_diffs = [(inn, m) for inn, m in zip(innings_list, masks) if bowling_pressure_mask(inn) != m]
+    for inn, m in mask_diffs[:10]:
+        print(f"❌ {inn.bowler_name} (tier {inn.opposition_tier!r}): mask {bowling_pressure_mask(inn)} vs batch {m}")
+    if mask_diffs:
+        print(f"❌ {len(mask_diffs)} spells tagged differently")
+        return 1
+
+    if actual == expected:
+        print("✅ Parity OK")
+        return 0
+
+    diffs = [(e, a) for e, a in zip(expected, actual) if e != a]
+    for e, a in diffs[:10]:
+        print(f"❌ scalar {e}\n   vectorized {a}")
+    print(f"❌ {len(diffs)} records differ")
+    return 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -25,6 +25,23 @@ def compute_base_bowling_skill_score(
     total_wickets = sum(inn.wickets for inn in innings_list)
     matches = len(innings_list)
 
+    return base_bowling_skill_from_totals(total_overs, total_runs, total_wickets, matches)
+
+
+def base_bowling_skill_from_totals(
+    total_overs: float,
+    total_runs: int,
+    total_wickets: int,
+    matches: int
+) -> float:
+    """
+    Base Bowling Skill Score from career totals
+    (shared by the list and streaming paths).
+    """
+
+    if matches == 0:
+        return 40.0
+
     # ---- Economy calculation ----
     if total_overs > 0:
         avg_economy = total_runs / total_overs
@@ -24,9 +24,26 @@ def compute_consistency_bowling_score(
         return 45.0
 
     economies = [inn.economy for inn in innings_list]
+    wicket_counts = [inn.wickets for inn in innings_list]
+
+    # Population standard deviations of economy and wickets
+    return consistency_bowling_from_stats(
+        matches, pstdev(economies), pstdev(wicket_counts)
+    )
+
 
-    # Population standard deviation of economy
-    econ_std = pstdev(economies)
+def consistency_bowling_from_stats(
+    matches: int,
+    econ_std: float,
+    wicket_std: float
+) -> float:
+    """
+    Consistency Score for bowling from the spell count and the population
+    standard deviations of economy and wickets.
+    """
+
+    if matches < 2:
+        return 45.0
 
     # ---- Base consistency score ----
     score = 50.0
@@ -44,9 +61,6 @@ def compute_consistency_bowling_score(
         score -= 20
 
     # ---- Wicket stability bonus ----
-    wicket_counts = [inn.wickets for inn in innings_list]
-    wicket_std = pstdev(wicket_counts)
-
     if wicket_std <= 0.5:
         score += 5
     elif wicket_std >= 1.5:
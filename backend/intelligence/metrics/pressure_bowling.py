@@ -2,7 +2,13 @@
 
 from typing import List
 from backend.intelligence.models.bowling_innings import BowlingInnings
-from backend.intelligence.rules.bowling_pressure_rules import tag_bowling_pressure
+from backend.intelligence.rules.pressure_bits import (
+    BOWLING_KNOCKOUT,
+    DEATH,
+    POWERPLAY,
+    QUALITY_OPPOSITION,
+    bowling_pressure_mask
+)
 
 
 def compute_pressure_bowling_score(
@@ -27,57 +33,76 @@ def compute_pressure_bowling_score(
     if not pressure_spells:
         return 40.0
 
-    scores = []
+    scores = [pressure_spell_score(inn) for inn in pressure_spells]
 
-    for inn in pressure_spells:
-        tags = tag_bowling_pressure(inn)
+    return pressure_bowling_from_totals(sum(scores), len(scores))
 
-        # ---- Base score for a pressure spell ----
-        spell_score = 50.0
 
-        # ---- Economy impact (T20 reference) ----
-        # Ideal T20 economy under pressure ≈ 7.5
-        if inn.economy <= 7.5:
-            spell_score += 15
-        elif inn.economy <= 8.5:
-            spell_score += 5
-        elif inn.economy <= 9.5:
-            spell_score -= 5
-        else:
-            spell_score -= 15
+def pressure_spell_score(inn: BowlingInnings) -> float:
+    """
+    Score (0–100) of ONE pressure spell.
+    """
+
+    tags = bowling_pressure_mask(inn)
+
+    # ---- Base score for a pressure spell ----
+    spell_score = 50.0
+
+    # ---- Economy impact (T20 reference) ----
+    # Ideal T20 economy under pressure ≈ 7.5
+    if inn.economy <= 7.5:
+        spell_score += 15
+    elif inn.economy <= 8.5:
+        spell_score += 5
+    elif inn.economy <= 9.5:
+        spell_score -= 5
+    else:
+        spell_score -= 15
+
+    # ---- Wicket impact ----
+    if inn.wickets >= 2:
+        spell_score += 15
+    elif inn.wickets == 1:
+        spell_score += 7
+    else:
+        spell_score -= 5
+
+    # ---- Phase bonuses ----
+    if tags & POWERPLAY:
+        spell_score += 5
 
-        # ---- Wicket impact ----
-        if inn.wickets >= 2:
-            spell_score += 15
-        elif inn.wickets == 1:
-            spell_score += 7
-        else:
-            spell_score -= 5
+    if tags & DEATH:
+        spell_score += 10
 
-        # ---- Phase bonuses ----
-        if tags["powerplay_pressure"]:
-            spell_score += 5
+    # ---- Opposition quality ----
+    if tags & QUALITY_OPPOSITION:
+        spell_score += 5
 
-        if tags["death_pressure"]:
-            spell_score += 10
+    # ---- Knockout match ----
+    if tags & BOWLING_KNOCKOUT:
+        spell_score += 5
 
-        # ---- Opposition quality ----
-        if tags["quality_opposition_pressure"]:
-            spell_score += 5
+    # Clamp per-spell score
+    return max(0.0, min(100.0, spell_score))
 
-        # ---- Knockout match ----
-        if tags["knockout_pressure"]:
-            spell_score += 5
 
-        # Clamp per-spell score
-        spell_score = max(0.0, min(100.0, spell_score))
-        scores.append(spell_score)
+def pressure_bowling_from_totals(
+    score_sum: float,
+    pressure_spells: int
+) -> float:
+    """
+    Pressure Bowling Score from the sum and count of pressure-spell scores.
+    """
+
+    # If no pressure data, return neutral-low score
+    if pressure_spells == 0:
+        return 40.0
 
     # ---- Aggregate with sample-size awareness ----
-    avg_score = sum(scores) / len(scores)
+    avg_score = score_sum / pressure_spells
 
     # Sample dampening: fewer pressure spells → slight pull to neutral
-    if len(scores) < 3:
+    if pressure_spells < 3:
         avg_score = (avg_score * 0.7) + (50.0 * 0.3)
 
     return round(avg_score, 2)
@@ -0,0 +1,152 @@
+# backend/intelligence/models/bowling_frame.py
+
+from typing import Dict, Iterable, List, Union
+
+import numpy as np
+
+from backend.intelligence.models.bowling_innings import BowlingInnings
+from backend.intelligence.models.compact_innings import CompactBowlingInnings
+from backend.intelligence.models.innings_frame import tier_code
+
+
+def bowling_innings_from_record(record: dict, team: str,
+                                compact: bool = False) -> Union[BowlingInnings, CompactBowlingInnings]:
+    """
+    Raw SMAT bowling record → BowlingInnings (CompactBowlingInnings if compact), with the
+    same defaults the export scripts use. The opposition tier is upper-cased, as in innings_from_record.
+    """
+    cls = CompactBowlingInnings if compact else BowlingInnings
+    return cls(
+        bowler_name=record["bowler_name"],
+        team=team,
+
+        overs=record["overs"],
+        maidens=record.get("maidens", 0),
+        runs_conceded=record["runs_conceded"],
+        wickets=record["wickets"],
+        economy=record["economy"],
+
+        opposition=record["opposition"],
+        opposition_tier=record["opposition_tier"].upper(),
+
+        result=record["result"],
+        knockout=record["knockout"],
+
+        bowling_phase=record.get("bowling_phase", {}),
+        pressure_context=record.get("pressure_context", {}),
+    )
+
+
+class BowlingFrame:
+    """
+    Columnar store for many bowlers' spells (the array-backed twin of List[BowlingInnings]).
+
+    `bowler` is an int32 code per spell indexing into `bowlers` (first-appearance order);
+    `team` holds each bowler's team as of their last spell, like compute_bowling_scores.
+    Rows keep their input order.
+    """
+
+    COLUMNS = {
+        "bowler": np.int32,
+        "overs": np.float64,
+        "maidens": np.int64,
+        "runs_conceded": np.int64,
+        "wickets": np.int64,
+        "economy": np.float64,
+        "tier": np.int8,
+        "won": bool,
+        "knockout": bool,
+        "match_pressure": bool,
+        "powerplay": bool,
+        "death": bool,
+        "defending": bool,
+    }
+
+    def __init__(self, bowlers: List[str], team: List[str], columns: Dict[str, np.ndarray]):
+        self.bowlers = bowlers
+        self.team = team
+        self.bowler_index = {name: code for code, name in enumerate(bowlers)}
+        for name in self.COLUMNS:
+            setattr(self, name, columns[name])
+
+        self._order = None
+        self._indptr = None
+
+    @classmethod
+    def from_innings(cls, innings_list: Iterable[BowlingInnings]) -> "BowlingFrame":
+        bowler_index = {}
+        team_map = {}
+        cols = {name: [] for name in cls.COLUMNS}
+
+        for inn in innings_list:
+            cols["bowler"].append(bowler_index.setdefault(inn.bowler_name, len(bowler_index)))
+            team_map[inn.bowler_name] = inn.team
+            cols["overs"].append(inn.overs)
+            cols["maidens"].append(inn.maidens)
+            cols["runs_conceded"].append(inn.runs_conceded)
+            cols["wickets"].append(inn.wickets)
+            cols["economy"].append(inn.economy)
+            cols["tier"].append(tier_code(inn.opposition_tier))
+            cols["won"].append(inn.result == "Win")
+            cols["knockout"].append(bool(inn.knockout))
+            cols["match_pressure"].append(inn.is_pressure_spell)
+            cols["powerplay"].append(inn.bowled_in_powerplay)
+            cols["death"].append(inn.bowled_in_death)
+            cols["defending"].append(inn.defending_target)
+
+        bowlers = list(bowler_index)
+        columns = {name: np.asarray(values, dtype=cls.COLUMNS[name]) for name, values in cols.items()}
+        return cls(bowlers, [team_map[name] for name in bowlers], columns)
+
+    def select(self, bowlers: Iterable[str]) -> "BowlingFrame":
+        """
+        Sub-frame with only these bowlers' spells. Rows keep their order and the kept
+        bowlers keep their relative first-appearance order.
+        """
+        keep = np.zeros(self.n_bowlers, dtype=bool)
+        keep[[self.bowler_index[name] for name in bowlers]] = True
+        codes = (np.cumsum(keep) - 1).astype(np.int32)
+        rows = keep[self.bowler]
+
+        columns = {name: getattr(self, name)[rows] for name in self.COLUMNS}
+        columns["bowler"] = codes[columns["bowler"]]
+        kept = np.flatnonzero(keep).tolist()
+        return BowlingFrame([self.bowlers[code] for code in kept], [self.team[code] for code in kept], columns)
+
+    def __len__(self) -> int:
+        return len(self.bowler)
+
+    @property
+    def n_bowlers(self) -> int:
+        return len(self.bowlers)
+
+    def counts(self) -> np.ndarray:
+        """Spells per bowler."""
+        return np.bincount(self.bowler, minlength=self.n_bowlers)
+
+    def order(self) -> np.ndarray:
+        """Row permutation grouping spells by bowler, keeping match order within each bowler."""
+        if self._order is None:
+            self._order = np.argsort(self.bowler, kind="stable")
+        return self._order
+
+    def rows_of(self, code: int) -> np.ndarray:
+        """One bowler's rows in match order: a slice of order(), no scan of the whole frame."""
+        if self._indptr is None:
+            self._indptr = np.zeros(self.n_bowlers + 1, dtype=np.int64)
+            np.cumsum(self.counts(), out=self._indptr[1:])
+        return self.order()[self._indptr[code]:self._indptr[code + 1]]
+
+    def group_sum(self, values: np.ndarray) -> np.ndarray:
+        """Per-bowler sum, accumulated in input order (same as a Python sum over the bowler's spells)."""
+        return np.bincount(self.bowler, weights=values, minlength=self.n_bowlers)
+
+    def group_pstdev(self, values: np.ndarray) -> np.ndarray:
+        """Per-bowler population standard deviation (two-pass: group mean, then squared deviations)."""
+        n = self.counts()
+        mean = self.group_sum(values) / np.maximum(n, 1)
+        deviation = values - mean[self.bowler]
+        return np.sqrt(self.group_sum(deviation * deviation) / np.maximum(n, 1))
+
+    def nbytes(self) -> int:
+        return sum(getattr(self, name).nbytes for name in self.COLUMNS)
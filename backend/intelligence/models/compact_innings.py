@@ -0,0 +1,282 @@
+# backend/intelligence/models/compact_innings.py
+
+"""
+Memory-compact, slotted variants of Innings and BowlingInnings for multi-season loads.
+
+Same attribute / property API as the dataclasses, so every metric, rule and frame
+builder accepts them unchanged:
+- no per-instance __dict__ (__slots__)
+- boolean fields and the pressure_context flags packed into one int bitfield
+- bowling_phase overs stored as three fixed fields instead of a nested dict
+
+Per-object memory report (run from the repo root):
+    python3 -m backend.intelligence.models.compact_innings
+"""
+
+import json
+import sys
+import tracemalloc
+from typing import Dict, Optional
+
+from backend.intelligence.models.bowling_innings import BowlingInnings
+from backend.intelligence.models.innings import Innings
+
+
+# ---------------------------------------------------------
+# 🏏 Batting
+# ---------------------------------------------------------
+_DISMISSED = 1 << 0
+_CHASING = 1 << 1
+_KNOCKOUT = 1 << 2
+
+
+class CompactInnings:
+    """Slotted Innings; dismissed / chasing / knockout live in `flags`."""
+
+    __slots__ = (
+        "runs", "balls", "fours", "sixes", "flags",
+        "result", "opposition_tier", "match_format",
+        "team_score_at_entry", "wickets_at_entry", "required_run_rate",
+    )
+
+    FIELDS = (
+        "runs", "balls", "fours", "sixes", "dismissed", "result", "chasing", "knockout",
+        "opposition_tier", "match_format", "team_score_at_entry", "wickets_at_entry", "required_run_rate",
+    )
+
+    def __init__(self, runs: int, balls: int, fours: int, sixes: int, dismissed: bool,
+                 result: str, chasing: bool, knockout: bool, opposition_tier: str, match_format: str,
+                 team_score_at_entry: int, wickets_at_entry: int, required_run_rate: float):
+        self.runs = runs
+        self.balls = balls
+        self.fours = fours
+        self.sixes = sixes
+        self.flags = (
+            (_DISMISSED if dismissed else 0)
+            | (_CHASING if chasing else 0)
+            | (_KNOCKOUT if knockout else 0)
+        )
+        # Interned: thousands of innings share the same few strings
+        self.result = sys.intern(result)
+        self.opposition_tier = sys.intern(opposition_tier)
+        self.match_format = sys.intern(match_format)
+        self.team_score_at_entry = team_score_at_entry
+        self.wickets_at_entry = wickets_at_entry
+        self.required_run_rate = required_run_rate
+
+    @classmethod
+    def from_innings(cls, inn: Innings) -> "CompactInnings":
+        return cls(*(getattr(inn, name) for name in cls.FIELDS))
+
+    def to_innings(self) -> Innings:
+        return Innings(**{name: getattr(self, name) for name in self.FIELDS})
+
+    @property
+    def dismissed(self) -> bool:
+        return bool(self.flags & _DISMISSED)
+
+    @property
+    def chasing(self) -> bool:
+        return bool(self.flags & _CHASING)
+
+    @property
+    def knockout(self) -> bool:
+        return bool(self.flags & _KNOCKOUT)
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, (CompactInnings, Innings)):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.FIELDS)
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.FIELDS)
+        return f"CompactInnings({fields})"
+
+
+# ---------------------------------------------------------
+# 🎯 Bowling
+# ---------------------------------------------------------
+# pressure_context key → (value bit, "key was present" bit); presence bits let
+# pressure_context round-trip exactly, including keys missing from the raw record.
+_MATCH_PRESSURE = 1 << 0
+_POWERPLAY = 1 << 1
+_DEATH = 1 << 2
+_DEFENDING = 1 << 3
+PRESSURE_BITS = {
+    "match_pressure": (_MATCH_PRESSURE, _MATCH_PRESSURE << 4),
+    "bowled_in_powerplay": (_POWERPLAY, _POWERPLAY << 4),
+    "bowled_in_death": (_DEATH, _DEATH << 4),
+    "defending_target": (_DEFENDING, _DEFENDING << 4),
+}
+_BOWLING_KNOCKOUT = 1 << 8
+
+PHASE_KEYS = ("powerplay_overs", "middle_overs", "death_overs")
+
+
+class CompactBowlingInnings:
+    """
+    Slotted BowlingInnings. pressure_context flags (and knockout) are bits of `flags`;
+    bowling_phase is three fields (None = key absent). Both dicts are rebuilt on access.
+    """
+
+    __slots__ = (
+        "bowler_name", "team",
+        "overs", "maidens", "runs_conceded", "wickets", "economy",
+        "opposition", "opposition_tier", "result", "flags",
+        "powerplay_overs", "middle_overs", "death_overs",
+    )
+
+    FIELDS = (
+        "bowler_name", "team", "overs", "maidens", "runs_conceded", "wickets", "economy",
+        "opposition", "opposition_tier", "result", "knockout", "bowling_phase", "pressure_context",
+    )
+
+    def __init__(self, bowler_name: str, team: str, overs: float, maidens: int, runs_conceded: int,
+                 wickets: int, economy: float, opposition: str, opposition_tier: str, result: str,
+                 knockout: bool, bowling_phase: Dict[str, float], pressure_context: Dict[str, bool]):
+        self.bowler_name = sys.intern(bowler_name)
+        self.team = sys.intern(team)
+        self.overs = overs
+        self.maidens = maidens
+        self.runs_conceded = runs_conceded
+        self.wickets = wickets
+        self.economy = economy
+        self.opposition = sys.intern(opposition)
+        self.opposition_tier = sys.intern(opposition_tier)
+        self.result = sys.intern(result)
+
+        flags = _BOWLING_KNOCKOUT if knockout else 0
+        for key, (value_bit, present_bit) in PRESSURE_BITS.items():
+            if key in pressure_context:
+                flags |= present_bit
+                if pressure_context[key]:
+                    flags |= value_bit
+        self.flags = flags
+
+        self.powerplay_overs: Optional[float] = bowling_phase.get("powerplay_overs")
+        self.middle_overs: Optional[float] = bowling_phase.get("middle_overs")
+        self.death_overs: Optional[float] = bowling_phase.get("death_overs")
+
+    @classmethod
+    def from_innings(cls, inn: BowlingInnings) -> "CompactBowlingInnings":
+        return cls(*(getattr(inn, name) for name in cls.FIELDS))
+
+    def to_innings(self) -> BowlingInnings:
+        return BowlingInnings(**{name: getattr(self, name) for name in self.FIELDS})
+
+    # -------------------------
+    # BowlingInnings fields rebuilt from the packed form
+    # -------------------------
+
+    @property
+    def knockout(self) -> bool:
+        return bool(self.flags & _BOWLING_KNOCKOUT)
+
+    @property
+    def bowling_phase(self) -> Dict[str, float]:
+        phase = {}
+        for key in PHASE_KEYS:
+            overs = getattr(self, key)
+            if overs is not None:
+                phase[key] = overs
+        return phase
+
+    @property
+    def pressure_context(self) -> Dict[str, bool]:
+        return {
+            key: bool(self.flags & value_bit)
+            for key, (value_bit, present_bit) in PRESSURE_BITS.items()
+            if self.flags & present_bit
+        }
+
+    # -------------------------
+    # Derived helpers (v1) — bit tests instead of dict lookups
+    # -------------------------
+
+    @property
+    def is_pressure_spell(self) -> bool:
+        return bool(self.flags & _MATCH_PRESSURE)
+
+    @property
+    def bowled_in_powerplay(self) -> bool:
+        return bool(self.flags & _POWERPLAY)
+
+    @property
+    def bowled_in_death(self) -> bool:
+        return bool(self.flags & _DEATH)
+
+    @property
+    def defending_target(self) -> bool:
+        return bool(self.flags & _DEFENDING)
+
+    @property
+    def wickets_per_over(self) -> float:
+        if self.overs == 0:
+            return 0.0
+        return round(self.wickets / self.overs, 2)
+
+    @property
+    def runs_per_over(self) -> float:
+        if self.overs == 0:
+            return 0.0
+        return round(self.runs_conceded / self.overs, 2)
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, (CompactBowlingInnings, BowlingInnings)):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.FIELDS)
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.FIELDS)
+        return f"CompactBowlingInnings({fields})"
+
+
+# ---------------------------------------------------------
+# 📏 Memory report
+# ---------------------------------------------------------
+def bytes_per_object(factory, records: list, copies: int) -> float:
+    """
+    Average memory retained per object after building copies × len(records) objects
+    from freshly parsed JSON and dropping the raw records, as in a real multi-season load.
+    """
+    payload = json.dumps(records)
+
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    raw = [json.loads(payload) for _ in range(copies)]
+    objects = [factory(record) for batch in raw for record in batch]
+    del raw
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+
+    retained = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    retained -= sys.getsizeof(objects)   # the holding list is not per-object cost
+    return retained / len(objects)
+
+
+def main(copies: int = 500):
+    from backend.intelligence.models.bowling_frame import bowling_innings_from_record
+    from backend.intelligence.models.innings_frame import innings_from_record
+
+    with open("backend/cricket-api/data/TN_Smat_TopOrder.json") as f:
+        batting = json.load(f)
+    with open("backend/cricket-api/data/TN_Smat_Bowlers.json") as f:
+        bowling = json.load(f)
+
+    rows = [
+        ("Innings", lambda r: innings_from_record(r),
+         lambda r: innings_from_record(r, compact=True), batting),
+        ("BowlingInnings", lambda r: bowling_innings_from_record(r, "Tamil Nadu"),
+         lambda r: bowling_innings_from_record(r, "Tamil Nadu", compact=True), bowling),
+    ]
+    for name, plain, compact, records in rows:
+        plain_bytes = bytes_per_object(plain, records, copies)
+        compact_bytes = bytes_per_object(compact, records, copies)
+        print(
+            f"{name:<15} dataclass {plain_bytes:7.0f} B/object | compact {compact_bytes:7.0f} B/object"
+            f" | −{(1 - compact_bytes / plain_bytes) * 100:.0f}%"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,220 @@
+# backend/intelligence/models/innings_frame.py
+
+from typing import Dict, Iterable, List, Tuple, Union
+
+import numpy as np
+
+from backend.intelligence.models.compact_innings import CompactInnings
+from backend.intelligence.models.innings import Innings
+
+
+# Opposition tiers as codes; unknown → "other". The record loaders already upper-case
+# tiers, the frames do too so hand-built innings tag like tag_pressure.
+TIERS = ("A", "B", "C")
+TIER_OTHER = len(TIERS)
+TIER_CODES = {tier: code for code, tier in enumerate(TIERS)}
+
+
+def tier_code(tier: str) -> int:
+    return TIER_CODES.get(tier.upper(), TIER_OTHER)
+
+
+# Match formats as codes (upper-cased first, like tag_pressure); unknown → "other"
+FORMATS = ("T20", "ODI", "TEST")
+FORMAT_OTHER = len(FORMATS)
+FORMAT_CODES = {fmt: code for code, fmt in enumerate(FORMATS)}
+
+
+def innings_from_record(row: dict, compact: bool = False) -> Union[Innings, CompactInnings]:
+    """
+    Raw SMAT batting record → Innings (CompactInnings if compact), with the same defaults
+    the export scripts use. The opposition tier is upper-cased here, once, so every scorer
+    sees "A" / "B" / "C".
+    """
+    cls = CompactInnings if compact else Innings
+    return cls(
+        runs=row["runs"],
+        balls=row["balls"],
+        fours=row.get("fours", 0),
+        sixes=row.get("sixes", 0),
+        dismissed=True,
+        result=row.get("result", "Loss"),
+        chasing=row.get("chasing", False),
+        knockout=row.get("knockout", False),
+        opposition_tier=row.get("opposition_tier", "B").upper(),
+        match_format="T20",
+        team_score_at_entry=row.get("team_runs", 0),
+        wickets_at_entry=row.get("team_wickets", 0),
+        required_run_rate=0.0
+    )
+
+
+class InningsFrame:
+    """
+    Columnar store for many players' innings.
+
+    One NumPy array per Innings field plus `player`, an int32 code per innings
+    indexing into `players` (player names in first-appearance order).
+    Rows keep their input order, so each player's innings stay in match order.
+
+    Philosophy:
+    - Built once, scored many times
+    - Every per-player metric becomes a grouped reduction over these columns
+    """
+
+    COLUMNS = {
+        "player": np.int32,
+        "runs": np.int64, "balls": np.int64, "fours": np.int64, "sixes": np.int64,
+        "dismissed": bool, "won": bool, "chasing": bool, "knockout": bool,
+        "tier": np.int8,
+        "team_score_at_entry": np.int64, "wickets_at_entry": np.int64,
+        "required_run_rate": np.float64,
+        "match_format": np.int8,
+    }
+
+    def __init__(self, players: List[str], columns: Dict[str, np.ndarray]):
+        self.players = players
+        self.player_index = {name: code for code, name in enumerate(players)}
+
+        self.player = columns["player"]
+        self.runs = columns["runs"]
+        self.balls = columns["balls"]
+        self.fours = columns["fours"]
+        self.sixes = columns["sixes"]
+        self.dismissed = columns["dismissed"]
+        self.won = columns["won"]
+        self.chasing = columns["chasing"]
+        self.knockout = columns["knockout"]
+        self.tier = columns["tier"]
+        self.team_score_at_entry = columns["team_score_at_entry"]
+        self.wickets_at_entry = columns["wickets_at_entry"]
+        self.required_run_rate = columns["required_run_rate"]
+        self.match_format = columns["match_format"]
+
+        self._order = None
+
+    # -------------------------
+    # Builders
+    # -------------------------
+
+    @classmethod
+    def from_innings(cls, pairs: Iterable[Tuple[str, Innings]]) -> "InningsFrame":
+        """
+        pairs: (player_name, Innings) in match order.
+        Only T20 innings are expected (the metrics use T20 benchmarks).
+        """
+        player_index = {}
+        cols = {name: [] for name in (
+            "player", "runs", "balls", "fours", "sixes", "dismissed", "won", "chasing",
+            "knockout", "tier", "team_score_at_entry", "wickets_at_entry", "required_run_rate",
+            "match_format",
+        )}
+
+        for name, inn in pairs:
+            cols["player"].append(player_index.setdefault(name, len(player_index)))
+            cols["runs"].append(inn.runs)
+            cols["balls"].append(inn.balls)
+            cols["fours"].append(getattr(inn, "fours", 0))
+            cols["sixes"].append(getattr(inn, "sixes", 0))
+            cols["dismissed"].append(inn.dismissed)
+            cols["won"].append(getattr(inn, "result", "Loss") == "Win")
+            cols["chasing"].append(inn.chasing)
+            cols["knockout"].append(inn.knockout)
+            cols["tier"].append(tier_code(inn.opposition_tier))
+            cols["team_score_at_entry"].append(inn.team_score_at_entry)
+            cols["wickets_at_entry"].append(inn.wickets_at_entry)
+            cols["required_run_rate"].append(inn.required_run_rate)
+            cols["match_format"].append(FORMAT_CODES.get(inn.match_format.upper(), FORMAT_OTHER))
+
+        return cls(list(player_index), cls._to_arrays(cols))
+
+    @classmethod
+    def from_players(cls, players_map: Dict[str, List[Innings]]) -> "InningsFrame":
+        """The exporters' {player_name: [Innings, ...]} grouping → InningsFrame."""
+        return cls.from_innings(
+            (name, inn) for name, innings in players_map.items() for inn in innings
+        )
+
+    @classmethod
+    def from_records(cls, rows: Iterable[dict]) -> "InningsFrame":
+        """
+        Raw SMAT batting records straight to columns, without building Innings objects.
+        Same field defaults as innings_from_record().
+        """
+        player_index = {}
+        cols = {name: [] for name in (
+            "player", "runs", "balls", "fours", "sixes", "won", "chasing",
+            "knockout", "tier", "team_score_at_entry", "wickets_at_entry",
+        )}
+
+        for row in rows:
+            cols["player"].append(player_index.setdefault(row["player_name"], len(player_index)))
+            cols["runs"].append(row["runs"])
+            cols["balls"].append(row["balls"])
+            cols["fours"].append(row.get("fours", 0))
+            cols["sixes"].append(row.get("sixes", 0))
+            cols["won"].append(row.get("result", "Loss") == "Win")
+            cols["chasing"].append(row.get("chasing", False))
+            cols["knockout"].append(row.get("knockout", False))
+            cols["tier"].append(tier_code(row.get("opposition_tier", "B")))
+            cols["team_score_at_entry"].append(row.get("team_runs", 0))
+            cols["wickets_at_entry"].append(row.get("team_wickets", 0))
+
+        n = len(cols["player"])
+        cols["dismissed"] = np.ones(n, dtype=bool)
+        cols["required_run_rate"] = np.zeros(n, dtype=np.float64)
+        cols["match_format"] = np.full(n, FORMAT_CODES["T20"], dtype=np.int8)
+        return cls(list(player_index), cls._to_arrays(cols))
+
+    @classmethod
+    def _to_arrays(cls, cols: dict) -> Dict[str, np.ndarray]:
+        return {name: np.asarray(values, dtype=cls.COLUMNS[name]) for name, values in cols.items()}
+
+    def select(self, players: Iterable[str]) -> "InningsFrame":
+        """
+        Sub-frame with only these players' innings. Rows keep their order and the kept
+        players keep their relative first-appearance order.
+        """
+        keep = np.zeros(self.n_players, dtype=bool)
+        keep[[self.player_index[name] for name in players]] = True
+        codes = (np.cumsum(keep) - 1).astype(np.int32)
+        rows = keep[self.player]
+
+        columns = {name: getattr(self, name)[rows] for name in self.COLUMNS}
+        columns["player"] = codes[columns["player"]]
+        return InningsFrame([name for name, kept in zip(self.players, keep.tolist()) if kept], columns)
+
+    # -------------------------
+    # Grouping helpers
+    # -------------------------
+
+    def __len__(self) -> int:
+        return len(self.player)
+
+    @property
+    def n_players(self) -> int:
+        return len(self.players)
+
+    def order(self) -> np.ndarray:
+        """Row permutation grouping innings by player, keeping match order within each player."""
+        if self._order is None:
+            self._order = np.argsort(self.player, kind="stable")
+        return self._order
+
+    def counts(self) -> np.ndarray:
+        """Innings per player."""
+        return np.bincount(self.player, minlength=self.n_players)
+
+    def group_sum(self, values: np.ndarray) -> np.ndarray:
+        """
+        Per-player sum of one value per innings.
+        bincount adds rows in input order, i.e. the same order as a per-player Python loop.
+        """
+        return np.bincount(self.player, weights=values, minlength=self.n_players)
+
+    def group_count(self, mask: np.ndarray) -> np.ndarray:
+        """Per-player number of innings where mask is True."""
+        return np.bincount(self.player[mask], minlength=self.n_players)
+
+    def nbytes(self) -> int:
+        return sum(getattr(self, name).nbytes for name in self.COLUMNS)
@@ -0,0 +1,190 @@
+# backend/intelligence/rules/pressure_bits.py
+
+"""
+Pressure tags as packed bits, from one format table.
+
+Every tag is one bit of a small integer mask, so a whole batch of innings is tagged
+with a few array comparisons (tag_*_batch → one uint8 per innings) and callers test
+bits instead of allocating a tags dict per innings. tag_pressure / tag_bowling_pressure
+are dict views over the same masks.
+"""
+
+from typing import Dict, NamedTuple
+
+import numpy as np
+
+from backend.intelligence.models.bowling_frame import BowlingFrame
+from backend.intelligence.models.bowling_innings import BowlingInnings
+from backend.intelligence.models.innings import Innings
+from backend.intelligence.models.innings_frame import FORMAT_CODES, FORMATS, InningsFrame, TIER_CODES
+
+
+# -----------------------------
+# 🏏 Batting bits
+# -----------------------------
+COLLAPSE = 1 << 0
+CHASE = 1 << 1
+KNOCKOUT = 1 << 2
+QUALITY = 1 << 3
+
+BATTING_TAGS = {
+    "collapse_pressure": COLLAPSE,
+    "chase_pressure": CHASE,
+    "knockout_pressure": KNOCKOUT,
+    "quality_pressure": QUALITY,
+}
+
+
+class FormatRule(NamedTuple):
+    collapse_wickets: int         # wickets_at_entry >= this ...
+    collapse_score_below: int     # ... and team_score_at_entry < this
+    chase_rrr: float              # chasing and required_run_rate >= this
+
+
+FORMAT_RULES = {
+    "TEST": FormatRule(collapse_wickets=2, collapse_score_below=120, chase_rrr=4.0),
+    "ODI": FormatRule(collapse_wickets=2, collapse_score_below=100, chase_rrr=6.0),
+    "T20": FormatRule(collapse_wickets=2, collapse_score_below=60, chase_rrr=8.0),
+}
+
+# The same table indexed by InningsFrame format code; the "other" row never matches
+_COLLAPSE_WICKETS = np.array([FORMAT_RULES[f].collapse_wickets for f in FORMATS] + [np.iinfo(np.int64).max])
+_COLLAPSE_SCORE_BELOW = np.array([FORMAT_RULES[f].collapse_score_below for f in FORMATS] + [np.iinfo(np.int64).min])
+_CHASE_RRR = np.array([FORMAT_RULES[f].chase_rrr for f in FORMATS] + [np.inf])
+assert list(FORMAT_CODES) == list(FORMATS)
+
+
+def pressure_mask(innings: Innings) -> int:
+    """Batting pressure bits for ONE innings."""
+    mask = 0
+    rule = FORMAT_RULES.get(innings.match_format.upper())
+
+    if rule is not None:
+        if (innings.wickets_at_entry >= rule.collapse_wickets
+                and innings.team_score_at_entry < rule.collapse_score_below):
+            mask |= COLLAPSE
+        if innings.chasing and innings.required_run_rate >= rule.chase_rrr:
+            mask |= CHASE
+
+    if innings.knockout:
+        mask |= KNOCKOUT
+    if innings.opposition_tier.upper() == "A":
+        mask |= QUALITY
+    return mask
+
+
+def tag_pressure_batch(frame: InningsFrame) -> np.ndarray:
+    """Batting pressure bits for every innings of the frame (uint8, row order)."""
+    fmt = frame.match_format
+    collapse = (frame.wickets_at_entry >= _COLLAPSE_WICKETS[fmt]) & (
+        frame.team_score_at_entry < _COLLAPSE_SCORE_BELOW[fmt]
+    )
+    chase = frame.chasing & (frame.required_run_rate >= _CHASE_RRR[fmt])
+
+    mask = collapse.astype(np.uint8) * COLLAPSE
+    mask |= chase.astype(np.uint8) * CHASE
+    mask |= frame.knockout.astype(np.uint8) * KNOCKOUT
+    mask |= (frame.tier == TIER_CODES["A"]).astype(np.uint8) * QUALITY
+    return mask
+
+
+# -----------------------------
+# 🏏 Batting pressure-score buckets
+# -----------------------------
+# The buckets behind compute_total_pressure_score (collapse / chase / knockout / quality)
+# share the tag bits but NOT the FORMAT_RULES thresholds: raw SMAT rows carry the team's
+# final runs / wickets (not the state at entry) and no required run rate, so the
+# exported scores use collapse = 3+ wickets down, chase = any chase.
+BUCKETS = {
+    "collapse": COLLAPSE,
+    "chase": CHASE,
+    "knockout": KNOCKOUT,
+    "quality": QUALITY,
+}
+BUCKET_COLLAPSE_WICKETS = 3
+
+
+def bucket_mask(innings: Innings) -> int:
+    """Pressure-score bucket bits for ONE innings."""
+    mask = 0
+    if innings.wickets_at_entry >= BUCKET_COLLAPSE_WICKETS:
+        mask |= COLLAPSE
+    if innings.chasing:
+        mask |= CHASE
+    if innings.knockout:
+        mask |= KNOCKOUT
+    if innings.opposition_tier == "A":
+        mask |= QUALITY
+    return mask
+
+
+def bucket_mask_batch(frame: InningsFrame) -> np.ndarray:
+    """Pressure-score bucket bits for every innings of the frame (uint8, row order)."""
+    mask = (frame.wickets_at_entry >= BUCKET_COLLAPSE_WICKETS).astype(np.uint8) * COLLAPSE
+    mask |= frame.chasing.astype(np.uint8) * CHASE
+    mask |= frame.knockout.astype(np.uint8) * KNOCKOUT
+    mask |= (frame.tier == TIER_CODES["A"]).astype(np.uint8) * QUALITY
+    return mask
+
+
+# -----------------------------
+# 🎯 Bowling bits
+# -----------------------------
+MATCH = 1 << 0
+POWERPLAY = 1 << 1
+DEATH = 1 << 2
+DEFENDING = 1 << 3
+QUALITY_OPPOSITION = 1 << 4
+BOWLING_KNOCKOUT = 1 << 5
+
+BOWLING_TAGS = {
+    "match_pressure": MATCH,
+    "powerplay_pressure": POWERPLAY,
+    "death_pressure": DEATH,
+    "defending_pressure": DEFENDING,
+    "quality_opposition_pressure": QUALITY_OPPOSITION,
+    "knockout_pressure": BOWLING_KNOCKOUT,
+}
+
+
+def bowling_pressure_mask(innings: BowlingInnings) -> int:
+    """Bowling pressure bits for ONE spell."""
+    mask = 0
+    if innings.is_pressure_spell:
+        mask |= MATCH
+    if innings.bowled_in_powerplay:
+        mask |= POWERPLAY
+    if innings.bowled_in_death:
+        mask |= DEATH
+    if innings.defending_target:
+        mask |= DEFENDING
+    if innings.opposition_tier == "A":
+        mask |= QUALITY_OPPOSITION
+    if innings.knockout:
+        mask |= BOWLING_KNOCKOUT
+    return mask
+
+
+def tag_bowling_pressure_batch(frame: BowlingFrame) -> np.ndarray:
+    """Bowling pressure bits for every spell of the frame (uint8, row order)."""
+    mask = frame.match_pressure.astype(np.uint8) * MATCH
+    mask |= frame.powerplay.astype(np.uint8) * POWERPLAY
+    mask |= frame.death.astype(np.uint8) * DEATH
+    mask |= frame.defending.astype(np.uint8) * DEFENDING
+    mask |= (frame.tier == TIER_CODES["A"]).astype(np.uint8) * QUALITY_OPPOSITION
+    mask |= frame.knockout.astype(np.uint8) * BOWLING_KNOCKOUT
+    return mask
+
+
+# -----------------------------
+# Helpers
+# -----------------------------
+def has(mask, bit):
+    """Bit test for an int mask or a mask array (→ bool array)."""
+    if isinstance(mask, np.ndarray):
+        return (mask & bit) != 0
+    return bool(mask & bit)
+
+
+def tags_from_mask(mask: int, tags: Dict[str, int]) -> Dict[str, bool]:
+    return {name: bool(mask & bit) for name, bit in tags.items()}
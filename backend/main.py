@@ -1,11 +1,82 @@
 from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, PlainTextResponse, StreamingResponse
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from contextlib import asynccontextmanager, contextmanager
+from collections import deque, OrderedDict
+from typing import Optional, Union
+from typing_extensions import Annotated, TypedDict
+from pydantic import ConfigDict, Discriminator, Tag, TypeAdapter, ValidationError
+import asyncio
+import bisect
+import json
+import logging
+import os
+import random
+import threading
+import time
+import warnings
 import joblib
+import orjson
 import pandas as pd
 import numpy as np
+from tree_compiler import UnsupportedModel, compiled_for, max_abs_error
+from query_service import router as scores_router, score_store
+
+
+# orjson serializes responses several times faster than the stdlib encoder
+def dumps_json(obj) -> bytes:
+    return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse encoded with orjson (FastAPI's ORJSONResponse is deprecated)."""
+
+    def render(self, content) -> bytes:
+        return dumps_json(content)
+
+# ---------------------------------------------------------
+# 📝 Logging (leveled; per-request detail is sampled)
+# ---------------------------------------------------------
+logger = logging.getLogger("cricscout")
+if not logger.handlers:
+    _handler = logging.StreamHandler()
+    _handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s"))
+    logger.addHandler(_handler)
+logger.setLevel(os.getenv("CRICSCOUT_LOG_LEVEL", "INFO").upper())
+
+# Fraction of requests whose body / result is logged at DEBUG
+LOG_SAMPLE_RATE = float(os.getenv("CRICSCOUT_LOG_SAMPLE_RATE", "0.01"))
+
+
+def log_sampled() -> bool:
+    """True when this request's DEBUG detail should be logged."""
+    return logger.isEnabledFor(logging.DEBUG) and random.random() < LOG_SAMPLE_RATE
+
+
+# The fast path hands estimators plain NumPy rows in the exact training column order,
+# so sklearn's "fitted with feature names" warning is expected and would only add overhead.
+warnings.filterwarnings("ignore", message="X does not have valid feature names")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    warmup = asyncio.create_task(registry.warm_up()) if WARMUP_ON_STARTUP else None
+    yield
+    if warmup is not None:
+        warmup.cancel()
+    # Stop micro-batch collectors, then release inference pools so worker threads / processes exit
+    for batcher in batchers.values():
+        batcher.stop()
+    for executor in executors.values():
+        executor.shutdown()
+
 
 # Initialize FastAPI app
-app = FastAPI(title="CricScout AI - Player & Fitness Analysis API")
+app = FastAPI(
+    title="CricScout AI - Player & Fitness Analysis API",
+    lifespan=lifespan,
+    default_response_class=FastJSONResponse,
+)
 
 # ---------------------------------------------------------
 # ✅ Allow frontend (Next.js) to access backend API
@@ -19,31 +90,419 @@ app.add_middleware(
 )
 
 # ---------------------------------------------------------
-# ✅ Load all models and feature sets
+# 📇 Player score queries (selector-ready files, see query_service.py)
 # ---------------------------------------------------------
-models = {}
-feature_sets = {}
+app.include_router(scores_router)
 
-try:
+# ---------------------------------------------------------
+# 📈 Request totals for /metrics
+# ---------------------------------------------------------
+@app.middleware("http")
+async def record_request_metrics(request: Request, call_next):
+    started = time.perf_counter()
+    status = 500
+    try:
+        response = await call_next(request)
+        status = response.status_code
+        return response
+    finally:
+        # The router fills in endpoint + path params on the shared scope
+        endpoint = request.scope.get("endpoint")
+        model = request.scope.get("path_params", {}).get("model_name", "")
+        if model and model not in registry:
+            model = "unknown"   # keep label cardinality bounded
+        if endpoint is not None:
+            metrics.count_request(model, endpoint.__name__, status)
+            if model and model != "unknown":
+                metrics.observe(model, "total", time.perf_counter() - started)
+
+# ---------------------------------------------------------
+# ✅ Model artifacts and loader settings
+# ---------------------------------------------------------
+MODEL_ARTIFACTS = {
     # 🏏 Player Performance Model (Assuming Regression Model)
-    models["performance"] = joblib.load("player_performance_model.pkl")
-    feature_sets["performance"] = joblib.load("model_features.pkl")
+    "performance": ("player_performance_model.pkl", "model_features.pkl"),
 
     # 🏋️‍♂️ Fitness Model (Assuming Classification Model, e.g., RandomForestClassifier)
     # NOTE: You may need to rename 'fitness_model.pkl' to 'fitness_model_v2.pkl'
     # if you ran the re-training script and saved the new version.
-    models["fitness"] = joblib.load("fitness_regressor_model_v2.pkl")
-    feature_sets["fitness"] = joblib.load("fitness_regressor_features.pkl")
+    "fitness": ("fitness_regressor_model_v2.pkl", "fitness_regressor_features.pkl"),
+}
+
+# Set CRICSCOUT_FAST_PATH=0 to fall back to the DataFrame + reindex path.
+FAST_PATH_ENABLED = os.getenv("CRICSCOUT_FAST_PATH", "1") != "0"
+
+# joblib mmap_mode for model artifacts ("r" shares NumPy arrays between forked workers);
+# set CRICSCOUT_MODEL_MMAP=none to load fully into memory.
+MODEL_MMAP_MODE = os.getenv("CRICSCOUT_MODEL_MMAP", "r")
+MODEL_MMAP_MODE = None if MODEL_MMAP_MODE.lower() in ("", "none", "0") else MODEL_MMAP_MODE
+
+# Load every model in the background at startup; with 0, each model loads on its first request.
+WARMUP_ON_STARTUP = os.getenv("CRICSCOUT_WARMUP", "1") != "0"
+
+# Reloads may only read artifacts from this directory; the last MODEL_HISTORY versions stay loaded.
+MODEL_DIR = os.path.realpath(os.getenv("CRICSCOUT_MODEL_DIR", "."))
+MODEL_HISTORY = int(os.getenv("CRICSCOUT_MODEL_HISTORY", "3"))
+
+# Serve tree ensembles through the flattened evaluator in tree_compiler.py (CRICSCOUT_COMPILED_TREES=0
+# to disable). It wins on small inputs; calls with more rows than COMPILED_MAX_ROWS use the estimator.
+COMPILED_TREES_ENABLED = os.getenv("CRICSCOUT_COMPILED_TREES", "1") != "0"
+COMPILED_MAX_ROWS = int(os.getenv("CRICSCOUT_COMPILED_MAX_ROWS", "256"))
+COMPILED_TOLERANCE = float(os.getenv("CRICSCOUT_COMPILED_TOLERANCE", "1e-9"))
+
+
+def artifact_version(path: str) -> str:
+    """Cheap version tag for a model artifact: size + mtime, changes whenever the file is replaced."""
+    stat = os.stat(path)
+    return f"{stat.st_size:x}-{stat.st_mtime_ns:x}"
+
+
+def _rss_bytes() -> int:
+    """Current resident set size of this process (peak RSS where /proc is unavailable)."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        import resource
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+def _load_artifact(path: str):
+    """joblib.load with mmap_mode when the artifact supports it → (object, memory_mapped)."""
+    if MODEL_MMAP_MODE is None:
+        return joblib.load(path), False
+
+    # joblib silently ignores mmap_mode for compressed pickles (with a warning); detect that.
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always")
+        obj = joblib.load(path, mmap_mode=MODEL_MMAP_MODE)
+    for w in caught:
+        if "mmap_mode" not in str(w.message):
+            warnings.warn_explicit(w.message, w.category, w.filename, w.lineno)
+    return obj, not any("mmap_mode" in str(w.message) for w in caught)
+
+
+# ---------------------------------------------------------
+# ⚡ Precompiled feature layouts (pandas-free fast path)
+# ---------------------------------------------------------
+class FeatureLayout:
+    """
+    Precompiled feature order for one model, built once at load time:
+    a name → column-index map and a preallocated float64 row template.
+    Unknown keys are ignored and missing keys stay 0, exactly like reindex(fill_value=0).
+    """
+
+    def __init__(self, feature_list):
+        self.features = list(feature_list)
+        self.index = {name: i for i, name in enumerate(self.features)}
+        self.template = np.zeros((1, len(self.features)), dtype=np.float64)
+
+    def row(self, features: dict) -> np.ndarray:
+        """Fill a copy of the template with one request's features → shape (1, n_features)."""
+        row = self.template.copy()
+        values = row[0]
+        index = self.index
+        for name, value in features.items():
+            i = index.get(name)
+            if i is not None:
+                values[i] = np.nan if value is None else value
+        return row
+
+    def rows(self, rows: list) -> np.ndarray:
+        """Same as row(), for many feature dicts at once → shape (n_rows, n_features)."""
+        matrix = np.zeros((len(rows), len(self.features)), dtype=np.float64)
+        index = self.index
+        for r, features in enumerate(rows):
+            values = matrix[r]
+            for name, value in features.items():
+                i = index.get(name)
+                if i is not None:
+                    values[i] = np.nan if value is None else value
+        return matrix
+
+
+# ---------------------------------------------------------
+# 🧾 Request schemas (compiled per model from its feature list)
+# ---------------------------------------------------------
+# strict: unknown keys and non-numeric values are rejected with 422
+# coerce: numeric strings / booleans are converted and unknown keys dropped (per request: ?coerce=true)
+# off:    legacy parsing — unknown keys ignored, bad values fail inside the estimator
+VALIDATION_MODE = os.getenv("CRICSCOUT_VALIDATION", "strict").lower()
+if VALIDATION_MODE not in ("strict", "coerce", "off"):
+    raise ValueError(f"CRICSCOUT_VALIDATION must be strict, coerce or off, got '{VALIDATION_MODE}'")
+
+
+def _body_kind(body) -> str:
+    return "value_dict" if isinstance(body, dict) and "value_dict" in body else "features"
+
+
+def request_schema(model_name: str, features: list, coerce: bool = False) -> TypeAdapter:
+    """
+    Validator for one model's /predict body: either {value_dict: {...}} or the bare feature dict.
+    Every feature is optional (missing → 0, null → NaN, as before) and must be a number.
+    validate_json parses and validates the raw body in one pass inside pydantic-core.
+    """
+    config = ConfigDict(extra="ignore", strict=False) if coerce else ConfigDict(extra="forbid", strict=True)
+    # Functional TypedDict syntax: feature names such as "Sit_&_Reach_cm" are not identifiers
+    Features = TypedDict(f"{model_name}_features", {name: Optional[float] for name in features}, total=False)
+    Features.__pydantic_config__ = config
+    Wrapped = TypedDict(f"{model_name}_request", {"value_dict": Features})
+    Wrapped.__pydantic_config__ = config
+    return TypeAdapter(Annotated[
+        Union[Annotated[Wrapped, Tag("value_dict")], Annotated[Features, Tag("features")]],
+        Discriminator(_body_kind),
+    ])
+
+
+def coerce_requested(request: Request) -> bool:
+    return VALIDATION_MODE == "coerce" or request.query_params.get("coerce", "").lower() in ("1", "true", "yes")
+
+
+def schema_errors(e: ValidationError, loc: tuple = ("body",)) -> list:
+    """ValidationError → 422 detail entries, located under `loc`."""
+    errors = e.errors(include_url=False, include_context=False)
+    for error in errors:
+        error["loc"] = loc + tuple(error["loc"][1:])   # drop the union tag
+        if isinstance(error.get("input"), bytes):
+            del error["input"]   # invalid JSON: don't echo the raw body
+    return errors
+
+
+def parse_features(entry, body: bytes, coerce: bool) -> dict:
+    """Raw /predict body → validated feature dict, or HTTP 422 listing every bad field."""
+    try:
+        parsed = (entry.lenient_schema if coerce else entry.schema).validate_json(body)
+    except ValidationError as e:
+        raise HTTPException(status_code=422, detail=schema_errors(e))
+    return parsed.get("value_dict", parsed)
+
+
+def validate_rows(entry, rows: list, coerce: bool) -> list:
+    """
+    Batch rows → validated feature dicts, each checked like a /predict body.
+    Any bad row fails the whole batch with HTTP 422; errors are located at ("body", row index, ...).
+    """
+    schema = entry.lenient_schema if coerce else entry.schema
+    features, errors = [], []
+    for i, row in enumerate(rows):
+        try:
+            parsed = schema.validate_python(row)
+        except ValidationError as e:
+            errors.extend(schema_errors(e, ("body", i)))
+            continue
+        features.append(parsed.get("value_dict", parsed))
+    if errors:
+        raise HTTPException(status_code=422, detail=errors)
+    return features
+
+
+# ---------------------------------------------------------
+# ✅ Model registry (lazy, memory-mapped loading)
+# ---------------------------------------------------------
+class LoadedModel:
+    """One loaded version of a model artifact plus everything precompiled from it."""
+
+    def __init__(self, name: str, model, features: list, version: str, model_path: str,
+                 load_seconds: float, rss_delta_bytes: int, memory_mapped: bool):
+        self.name = name
+        self.model = model
+        self.features = list(features)
+        self.version = version
+        self.model_path = model_path
+        self.layout = FeatureLayout(self.features)
+        self.schema = request_schema(name, self.features)
+        self.lenient_schema = request_schema(name, self.features, coerce=True)
+        self.fast_path = False
+        self.compiled = None    # CompiledForest, set once it matched the estimator at load
+        self.loaded_at = time.time()
+        self.load_seconds = load_seconds
+        self.rss_delta_bytes = rss_delta_bytes
+        self.memory_mapped = memory_mapped
+
+    def report(self) -> dict:
+        return {
+            "status": "loaded",
+            "version": self.version,
+            "artifact": self.model_path,
+            "type": type(self.model).__name__,
+            "loaded_at": round(self.loaded_at, 3),
+            "load_seconds": round(self.load_seconds, 4),
+            "rss_delta_mb": round(self.rss_delta_bytes / 2**20, 2),
+            "memory_mapped": self.memory_mapped,
+            "fast_path": self.fast_path,
+            "compiled": self.compiled.report() if self.compiled is not None else None,
+        }
+
+    def predictor(self, n_rows: int):
+        """Object whose predict / predict_proba scores n_rows rows: compiled forest or the estimator."""
+        if self.compiled is not None and n_rows <= COMPILED_MAX_ROWS:
+            return self.compiled
+        return self.model
+
+
+class ModelRegistry:
+    """
+    Versioned model registry.
+
+    - Each model loads on first use (or from the startup warm-up task) instead of at import,
+      so cold start does not wait for models a worker never serves.
+    - reload() loads a new version off the request path, warms it with a test prediction and
+      only then swaps it in. Requests hold the LoadedModel they resolved, so anything already
+      running finishes on the version it started with.
+    - The last MODEL_HISTORY versions stay loaded for rollback().
+    """
+
+    def __init__(self, artifacts: dict, history: int):
+        self.artifacts = artifacts
+        self.history = history
+        self._active = {}
+        self._versions = {name: OrderedDict() for name in artifacts}   # version → LoadedModel, oldest first
+        self._errors = {}
+        self._reloading = set()
+        self._lock = threading.Lock()
+        self._swap_listeners = []
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.artifacts
+
+    def names(self) -> list:
+        return list(self.artifacts)
+
+    def active(self) -> dict:
+        return dict(self._active)
+
+    def on_swap(self, callback):
+        """callback(model_name) runs after every activation (first load, reload, rollback)."""
+        self._swap_listeners.append(callback)
+
+    def get(self, name: str) -> LoadedModel:
+        """Return the active version, loading the configured artifact now if needed (blocking)."""
+        entry = self._active.get(name)
+        if entry is not None:
+            return entry
+        with self._lock:
+            entry = self._active.get(name)
+            if entry is None:
+                entry = self._load(name, *self.artifacts[name])
+                self._activate(entry)
+            return entry
+
+    async def aget(self, name: str) -> LoadedModel:
+        """Like get(), but a first-use load runs on a worker thread instead of the event loop."""
+        entry = self._active.get(name)
+        if entry is not None:
+            return entry
+        return await asyncio.to_thread(self.get, name)
+
+    def _load(self, name: str, model_path: str, features_path: str) -> LoadedModel:
+        rss_before = _rss_bytes()
+        started = time.perf_counter()
+        try:
+            model, memory_mapped = _load_artifact(model_path)
+            features = joblib.load(features_path)
+            if not features:
+                raise RuntimeError(f"Feature list is empty or missing for model '{name}'.")
+            entry = LoadedModel(
+                name, model, features, artifact_version(model_path), model_path,
+                load_seconds=time.perf_counter() - started,
+                rss_delta_bytes=_rss_bytes() - rss_before,
+                memory_mapped=memory_mapped,
+            )
+            # Warm-up: one real prediction before this version can serve traffic
+            predict_raw(name, model, entry.layout.template)
+        except Exception as e:
+            self._errors[name] = str(e)
+            logger.error("❌ Error loading '%s' model or features: %s", name, e)
+            raise
+
+        self._errors.pop(name, None)
+        if FAST_PATH_ENABLED:
+            entry.fast_path = check_fast_path(entry)
+        if COMPILED_TREES_ENABLED:
+            entry.compiled = check_compiled(entry)
+
+        logger.info(
+            "✅ %s model %s loaded (%s) in %.2fs, +%.1f MB RSS, mmap=%s",
+            name, entry.version, type(model).__name__, entry.load_seconds,
+            entry.rss_delta_bytes / 2**20, memory_mapped,
+        )
+        return entry
+
+    def _activate(self, entry: LoadedModel):
+        versions = self._versions[entry.name]
+        versions[entry.version] = entry
+        versions.move_to_end(entry.version)
+        while len(versions) > max(1, self.history):
+            versions.popitem(last=False)
+
+        # Single reference swap: new requests see the new version, running ones keep theirs
+        self._active[entry.name] = entry
+        for callback in self._swap_listeners:
+            callback(entry.name)
+
+    async def reload(self, name: str, model_path: str = None, features_path: str = None) -> LoadedModel:
+        """Load + warm a new version in the background, then swap it in atomically."""
+        default_model_path, default_features_path = self.artifacts[name]
+        model_path = model_path or default_model_path
+        features_path = features_path or default_features_path
 
-    print("✅ All models loaded successfully!")
-    for name in models:
-        print(f"  - {name} model loaded ({type(models[name])})")
+        if name in self._reloading:
+            raise RuntimeError(f"A reload of '{name}' is already in progress")
+        self._reloading.add(name)
+        try:
+            entry = await asyncio.to_thread(self._load, name, model_path, features_path)
+        finally:
+            self._reloading.discard(name)
 
-except Exception as e:
-    print(f"❌ Error loading models or features: {e}")
-    models, feature_sets = {}, {}
-    # Optionally, you can raise the error to halt the application if models are critical
-    # raise e
+        with self._lock:
+            current = self._active.get(name)
+            if current is not None and current.version == entry.version:
+                return current   # artifact unchanged, keep serving the existing version
+            self._activate(entry)
+        logger.info("🔁 %s model swapped to %s", name, entry.version)
+        return entry
+
+    def rollback(self, name: str, version: str = None) -> LoadedModel:
+        """Re-activate `version`, or the version that was active before the current one."""
+        with self._lock:
+            versions = self._versions[name]
+            current = self._active.get(name)
+            if version is None:
+                previous = [v for v in versions if current is None or v != current.version]
+                if not previous:
+                    raise LookupError(f"No earlier version of '{name}' is loaded")
+                version = previous[-1]
+            if version not in versions:
+                raise LookupError(f"Version '{version}' of '{name}' is not loaded. Loaded: {list(versions)}")
+            self._activate(versions[version])
+        logger.info("⏪ %s model rolled back to %s", name, version)
+        return self._active[name]
+
+    async def warm_up(self):
+        """Background task: load every configured model without blocking requests."""
+        for name in self.artifacts:
+            try:
+                await self.aget(name)
+            except Exception:
+                pass   # already reported; the model retries on its next request
+
+    def report(self) -> dict:
+        report = {}
+        for name, (model_path, _) in self.artifacts.items():
+            if name in self._active:
+                report[name] = self._active[name].report()
+            elif name in self._errors:
+                report[name] = {"status": "failed"}
+            else:
+                report[name] = {"status": "not_loaded", "artifact_present": os.path.exists(model_path)}
+            report[name]["versions"] = list(self._versions[name])
+            report[name]["reloading"] = name in self._reloading
+            if name in self._errors:
+                report[name]["error"] = self._errors[name]
+        return report
+
+
+registry = ModelRegistry(MODEL_ARTIFACTS, history=MODEL_HISTORY)
 
 # ---------------------------------------------------------
 # ✅ Root endpoint (API status check)
@@ -53,103 +512,1074 @@ def home():
     """Root endpoint to verify API is running"""
     return {
         "message": "🏏 CricScout AI API is running successfully!",
-        "available_models": list(models.keys())
+        "available_models": [
+            name for name, (model_path, _) in MODEL_ARTIFACTS.items()
+            if name in registry.active() or os.path.exists(model_path)
+        ],
+        "active_versions": {name: entry.version for name, entry in registry.active().items()},
+        "fast_path": sorted(name for name, entry in registry.active().items() if entry.fast_path),
+        "compiled": sorted(name for name, entry in registry.active().items() if entry.compiled is not None),
+        "models": registry.report(),
     }
 
 # ---------------------------------------------------------
-# ✅ Unified Prediction Endpoint
+# ✅ Shared scoring helpers (single + batch)
 # ---------------------------------------------------------
-@app.post("/predict/{model_name}")
-async def predict(model_name: str, request: Request):
-    """
-    Predict using the selected model.
-    Example: /predict/fitness  or  /predict/performance
-    """
-    if model_name not in models:
+async def resolve_model(model_name: str) -> LoadedModel:
+    """Look up (and lazily load) a model, mapping failures to HTTP errors."""
+    if model_name not in registry:
         raise HTTPException(
             status_code=404,
-            detail=f"Model '{model_name}' not found. Available: {list(models.keys())}"
+            detail=f"Model '{model_name}' not found. Available: {registry.names()}"
         )
-        
     try:
-        # 2️⃣ Parse request body
-        body = await request.json()
-        print(f"\n📩 Received features for '{model_name}' model:", body)
-
-        # Handle Next.js format: { value_dict: {...} } or direct {...}
-        features = body.get("value_dict", body)
-
-        # 3️⃣ Convert JSON → DataFrame (align features)
-        input_df = pd.DataFrame([features])
-        feature_list = feature_sets.get(model_name)
-        
-        # Check if feature list exists and use it to reindex
-        if not feature_list:
-             raise RuntimeError(f"Feature list is empty or missing for model '{model_name}'.")
-
-        input_df = input_df.reindex(columns=feature_list, fill_value=0)
-        print("🧩 Aligned columns:", input_df.columns.tolist())
-
-        model = models[model_name]
-
-        # 4️⃣ --- Prediction Logic ---
-        
-        # 🏋️‍♂️ Fitness Model (Classification: Returns a Probability Score)
-        if model_name == "fitness":
-            
-            if hasattr(model, 'predict_proba'):
-                # Get the probability array, e.g., [Prob_Class_0, Prob_Class_1]
-                proba = model.predict_proba(input_df)[0]
-                # The score is the probability of being Fit (Class 1), converted to a percentage (0 to 100)
-                score_percentage = proba[1] * 100
-                
-                # Determine the hard class prediction (0 or 1)
-                hard_prediction = np.argmax(proba)
-            else:
-                 # Fallback for models without predict_proba, use .predict() but scale it
-                 hard_prediction = model.predict(input_df)[0]
-                 score_percentage = float(hard_prediction) 
-                 
-            # 5️⃣ Fitness Model Response Logic (Using Percentage)
-            score = score_percentage # Use percentage for logic and output
-            
-            if score >= 90:
-                 status = "Qualified"
-                 commentary = "Excellent fitness level! You’re ready for professional play."
-            elif score >= 50:
-                 # If prediction is class 0 but score is high, this might be a soft failure
-                 status = "Needs Improvement" 
-                 commentary = "Average fitness — improve endurance and agility."
-            else:
-                 status = "Not Fit"
-                 commentary = "Below standard — focus on strength and consistency."
-                 
-            print(f"✅ Prediction successful for '{model_name}': Class {hard_prediction} ({score_percentage:.2f}%)")
-                 
-            return {
+        return await registry.aget(model_name)
+    except Exception as e:
+        raise HTTPException(status_code=503, detail=f"Model '{model_name}' failed to load: {e}")
+
+
+def align_features(entry: LoadedModel, rows: list) -> pd.DataFrame:
+    """Build one DataFrame for all rows and align it to the model's features in a single reindex."""
+    # reindex only fills columns that no row has; keys missing from *some* rows come back as NaN,
+    # so zero those too to keep the single-row "missing feature → 0" behaviour for batches.
+    return pd.DataFrame(rows).reindex(columns=entry.features, fill_value=0).fillna(0)
+
+
+def fitness_verdict(score: float):
+    """Map a fitness percentage to (status, commentary)."""
+    if score >= 90:
+        return "Qualified", "Excellent fitness level! You’re ready for professional play."
+    elif score >= 50:
+        # If prediction is class 0 but score is high, this might be a soft failure
+        return "Needs Improvement", "Average fitness — improve endurance and agility."
+    return "Not Fit", "Below standard — focus on strength and consistency."
+
+
+def predict_raw(model_name: str, model, X):
+    """
+    The single estimator call behind every response.
+    X is either an aligned DataFrame (pandas path) or a float64 matrix (fast path).
+    """
+    if model_name == "fitness" and hasattr(model, 'predict_proba'):
+        return model.predict_proba(X)
+    return model.predict(X)
+
+
+def build_responses(model_name: str, model, raw) -> list:
+    """
+    Turn the raw output of ONE vectorized estimator call
+    into the per-row response dicts.
+    """
+    # 🏋️‍♂️ Fitness Model (Classification: Returns a Probability Score)
+    if model_name == "fitness":
+        if hasattr(model, 'predict_proba'):
+            # Probability matrix, one [Prob_Class_0, Prob_Class_1] row per player
+            proba = raw
+            # The score is the probability of being Fit (Class 1), converted to a percentage (0 to 100)
+            scores = proba[:, 1] * 100
+            # Determine the hard class prediction (0 or 1)
+            hard_predictions = np.argmax(proba, axis=1)
+        else:
+            # Fallback for models without predict_proba, use .predict() but scale it
+            hard_predictions = raw
+            scores = hard_predictions.astype(float)
+
+        results = []
+        for score, hard_prediction in zip(scores, hard_predictions):
+            score = float(score)
+            status, commentary = fitness_verdict(score)
+            results.append({
                 "model_used": "fitness",
                 "score": round(score, 2), # Floating point percentage
                 "predicted_class": int(hard_prediction),
                 "status": status,
                 "commentary": commentary,
-            }
+            })
+        return results
 
-        # 🎯 Performance Model (Regression: Returns a Direct Score)
-        elif model_name == "performance":
-            # Use predict() for the final predicted score (e.g., 77.5)
-            prediction = model.predict(input_df)[0]
-            score = float(prediction)
-            
-            print(f"✅ Prediction successful for '{model_name}': {score:.2f}")
-            
-            # 5️⃣ Performance Model Response
-            return {
+    # 🎯 Performance Model (Regression: Returns a Direct Score)
+    elif model_name == "performance":
+        # Use predict() for the final predicted score (e.g., 77.5)
+        predictions = raw
+        return [
+            {
                 "model_used": "performance",
-                "predicted_score": round(score, 2), # Floating point score, e.g., 77.50
+                "predicted_score": round(float(prediction), 2), # Floating point score, e.g., 77.50
                 "commentary": "Player performance prediction successful.",
             }
+            for prediction in predictions
+        ]
+
+    return [None] * len(raw)
+
+
+def verify_fast_path(entry: LoadedModel) -> bool:
+    """
+    Score the same probe rows through the pandas path and the fast path
+    and require bit-identical estimator output.
+    """
+    layout = entry.layout
+    rng = np.random.default_rng(0)
+    probe = [dict(zip(layout.features, rng.random(len(layout.features)) * 100)) for _ in range(8)]
+    probe.append({})  # all-defaults row
+
+    slow = predict_raw(entry.name, entry.model, align_features(entry, probe))
+    fast = predict_raw(entry.name, entry.model, layout.rows(probe))
+    return np.array_equal(np.asarray(slow), np.asarray(fast))
+
+
+def check_fast_path(entry: LoadedModel) -> bool:
+    """verify_fast_path at load time; models that fail it are served through pandas."""
+    try:
+        if verify_fast_path(entry):
+            return True
+        logger.warning("⚠️ Fast path mismatch for '%s' — using pandas path", entry.name)
+    except Exception as e:
+        logger.warning("⚠️ Fast path check failed for '%s': %s — using pandas path", entry.name, e)
+    return False
+
+
+def check_compiled(entry: LoadedModel):
+    """
+    Compile (or load the offline-compiled) tree ensemble for this version and accept it only
+    if it reproduces the estimator within COMPILED_TOLERANCE on probe rows; else None.
+    """
+    try:
+        compiled = compiled_for(entry.model, entry.model_path, entry.version)
+        rng = np.random.default_rng(0)
+        probe = rng.random((256, len(entry.features))) * 100
+        probe[::17, rng.integers(len(entry.features))] = np.nan   # None → NaN in FeatureLayout
+        probe = np.vstack([entry.layout.template, probe])
+        error = max_abs_error(entry.model, compiled, probe)
+        if error <= COMPILED_TOLERANCE:
+            return compiled
+        logger.warning("⚠️ Compiled '%s' differs by %.3g — serving the estimator", entry.name, error)
+    except UnsupportedModel as e:
+        logger.info("ℹ️ '%s' not compiled: %s", entry.name, e)
+    except Exception as e:
+        logger.warning("⚠️ Compiling '%s' failed: %s — serving the estimator", entry.name, e)
+    return None
+
+
+def build_input(entry: LoadedModel, rows: list):
+    """Aligned model input for rows: float64 matrix on the fast path, DataFrame otherwise."""
+    if entry.fast_path:
+        return entry.layout.row(rows[0]) if len(rows) == 1 else entry.layout.rows(rows)
+    return align_features(entry, rows)
+
+
+# ---------------------------------------------------------
+# 📈 Metrics (latency histograms + counters, Prometheus text format)
+# ---------------------------------------------------------
+LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+
+class Histogram:
+    """Fixed-bucket latency histogram (seconds)."""
+
+    def __init__(self, buckets=LATENCY_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)   # last slot is +Inf
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, seconds: float):
+        self.counts[bisect.bisect_left(self.buckets, seconds)] += 1
+        self.sum += seconds
+        self.count += 1
+
+
+def _escape_label(value) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(**labels) -> str:
+    return "{" + ",".join(f'{key}="{_escape_label(value)}"' for key, value in sorted(labels.items())) + "}"
+
+
+class Metrics:
+    """
+    Per-model, per-stage latency histograms plus request and error counters.
+    Stages: parse → align → cache → predict (queue + batching + estimator) → respond,
+    plus estimator (time inside the worker) and total (whole HTTP request).
+    All updates happen on the event loop thread.
+    """
+
+    def __init__(self):
+        self.latency = {}    # (model, stage) → Histogram
+        self.requests = {}   # (model, endpoint, status) → count
+        self.errors = {}     # (model, endpoint) → count
+
+    def observe(self, model: str, stage: str, seconds: float):
+        histogram = self.latency.get((model, stage))
+        if histogram is None:
+            histogram = self.latency[(model, stage)] = Histogram()
+        histogram.observe(seconds)
+
+    def count_request(self, model: str, endpoint: str, status: int):
+        key = (model, endpoint, str(status))
+        self.requests[key] = self.requests.get(key, 0) + 1
+        if status >= 400:
+            self.errors[(model, endpoint)] = self.errors.get((model, endpoint), 0) + 1
+
+    def stage_timer(self, model: str) -> "StageTimer":
+        return StageTimer(self, model)
+
+    def render(self) -> str:
+        lines = [
+            "# HELP cricscout_stage_latency_seconds Request latency per model and processing stage.",
+            "# TYPE cricscout_stage_latency_seconds histogram",
+        ]
+        for (model, stage), histogram in sorted(self.latency.items()):
+            cumulative = 0
+            for bound, count in zip(histogram.buckets + (float("inf"),), histogram.counts):
+                cumulative += count
+                le = "+Inf" if bound == float("inf") else repr(bound)
+                lines.append(f"cricscout_stage_latency_seconds_bucket{_labels(model=model, stage=stage, le=le)} {cumulative}")
+            lines.append(f"cricscout_stage_latency_seconds_sum{_labels(model=model, stage=stage)} {histogram.sum}")
+            lines.append(f"cricscout_stage_latency_seconds_count{_labels(model=model, stage=stage)} {histogram.count}")
+
+        lines += [
+            "# HELP cricscout_requests_total HTTP requests by model, endpoint and status.",
+            "# TYPE cricscout_requests_total counter",
+        ]
+        for (model, endpoint, status), count in sorted(self.requests.items()):
+            lines.append(f"cricscout_requests_total{_labels(model=model, endpoint=endpoint, status=status)} {count}")
+
+        lines += [
+            "# HELP cricscout_errors_total HTTP requests that ended with a 4xx/5xx status.",
+            "# TYPE cricscout_errors_total counter",
+        ]
+        for (model, endpoint), count in sorted(self.errors.items()):
+            lines.append(f"cricscout_errors_total{_labels(model=model, endpoint=endpoint)} {count}")
+
+        return "\n".join(lines) + "\n"
+
+
+class StageTimer:
+    """`with timer.stage("align"): ...` records that block's wall time under (model, stage)."""
+
+    def __init__(self, metrics: Metrics, model: str):
+        self.metrics = metrics
+        self.model = model
+
+    @contextmanager
+    def stage(self, name: str):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.metrics.observe(self.model, name, time.perf_counter() - started)
+
+
+metrics = Metrics()
+
+
+# ---------------------------------------------------------
+# ⚙️ Inference executors (estimator calls run off the event loop)
+# ---------------------------------------------------------
+# Per-model pool settings. Override with e.g. CRICSCOUT_EXECUTOR_FITNESS="process:4"
+# and cap queued + running calls with CRICSCOUT_EXECUTOR_MAX_PENDING.
+EXECUTOR_DEFAULTS = {"kind": "thread", "workers": 2, "max_pending": 64}
+EXECUTOR_CONFIG = {
+    "performance": {"kind": "thread", "workers": 2},
+    "fitness": {"kind": "thread", "workers": 2},
+}
+
+
+def executor_config(model_name: str) -> dict:
+    config = {**EXECUTOR_DEFAULTS, **EXECUTOR_CONFIG.get(model_name, {})}
+
+    override = os.getenv(f"CRICSCOUT_EXECUTOR_{model_name.upper()}")
+    if override:
+        kind, _, workers = override.partition(":")
+        config["kind"] = kind or config["kind"]
+        config["workers"] = int(workers) if workers else config["workers"]
+
+    max_pending = os.getenv("CRICSCOUT_EXECUTOR_MAX_PENDING")
+    if max_pending:
+        config["max_pending"] = int(max_pending)
+
+    if config["kind"] not in ("thread", "process"):
+        raise ValueError(f"Executor kind must be 'thread' or 'process', got '{config['kind']}'")
+    return config
+
+
+def _timed_predict_raw(model_name: str, model, X):
+    """Runs inside a thread pool; reports when it started and finished so the caller can split queue wait from compute."""
+    started = time.time()
+    raw = predict_raw(model_name, model, X)
+    return raw, started, time.time()
+
 
+# Process-pool workers: (model name, version) → [estimator, compiled forest or None], loaded on first use inside the worker
+_worker_models = {}
+
+
+def _process_predict_raw(model_name: str, version: str, model_path: str, X, use_compiled: bool = False):
+    """
+    Process-pool variant of _timed_predict_raw: the model travels as (name, version, path), not pickled.
+    use_compiled is only passed for versions whose compiled forest the parent already verified.
+    """
+    started = time.time()
+    cached = _worker_models.get((model_name, version))
+    if cached is None:
+        if artifact_version(model_path) != version:
+            raise RuntimeError(f"'{model_name}' version {version} is no longer on disk at {model_path}")
+        cached = [_load_artifact(model_path)[0], None]
+        # Keep only the newest MODEL_HISTORY versions per worker
+        stale = [key for key in _worker_models if key[0] == model_name]
+        for key in stale[:max(0, len(stale) - MODEL_HISTORY + 1)]:
+            del _worker_models[key]
+        _worker_models[(model_name, version)] = cached
+    model = cached[0]
+    if use_compiled:
+        if cached[1] is None:
+            cached[1] = compiled_for(cached[0], model_path, version)
+        model = cached[1]
+    raw = predict_raw(model_name, model, X)
+    return raw, started, time.time()
+
+
+class ExecutorOverloaded(Exception):
+    """Raised when a model's pool already holds max_pending calls."""
+
+
+class ModelExecutor:
+    """
+    Bounded thread or process pool for one model's estimator calls.
+    Every call is pinned to the LoadedModel the request resolved. Process workers load that
+    version from its artifact on first use; with mmap_mode the artifact's NumPy arrays are
+    shared through the page cache instead of copied.
+    """
+
+    def __init__(self, model_name: str, kind: str, workers: int, max_pending: int):
+        self.model_name = model_name
+        self.kind = kind
+        self.workers = workers
+        self.max_pending = max_pending
+
+        if kind == "process":
+            self.pool = ProcessPoolExecutor(max_workers=workers)
+        else:
+            self.pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix=f"predict-{model_name}")
+
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.completed = 0
+        self.rejected = 0
+        self.wait_times = deque(maxlen=2048)   # seconds spent queued before a worker picked the call up
+
+    async def run(self, entry: LoadedModel, X):
+        if self.in_flight >= self.max_pending:
+            self.rejected += 1
+            raise ExecutorOverloaded(
+                f"'{self.model_name}' inference queue is full ({self.max_pending} pending)"
+            )
+
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        submitted = time.time()
+        try:
+            loop = asyncio.get_running_loop()
+            if self.kind == "process":
+                use_compiled = entry.predictor(len(X)) is entry.compiled
+                call = (_process_predict_raw, entry.name, entry.version, entry.model_path, X, use_compiled)
+            else:
+                call = (_timed_predict_raw, entry.name, entry.predictor(len(X)), X)
+            raw, started, finished = await loop.run_in_executor(self.pool, *call)
+            self.wait_times.append(max(0.0, started - submitted))
+            metrics.observe(self.model_name, "estimator", finished - started)
+            self.completed += 1
+            return raw
+        finally:
+            self.in_flight -= 1
+
+    def stats(self) -> dict:
+        waits = np.fromiter(self.wait_times, dtype=np.float64)
+        p50, p95, p99 = np.percentile(waits, [50, 95, 99]) * 1000 if waits.size else (0.0, 0.0, 0.0)
+        return {
+            "kind": self.kind,
+            "workers": self.workers,
+            "max_pending": self.max_pending,
+            "in_flight": self.in_flight,
+            "queue_depth": max(0, self.in_flight - self.workers),
+            "peak_in_flight": self.peak_in_flight,
+            "completed": self.completed,
+            "rejected": self.rejected,
+            "wait_ms": {
+                "p50": round(float(p50), 3),
+                "p95": round(float(p95), 3),
+                "p99": round(float(p99), 3),
+                "max": round(float(waits.max()) * 1000, 3) if waits.size else 0.0,
+            },
+        }
+
+    def shutdown(self):
+        self.pool.shutdown(wait=False, cancel_futures=True)
+
+
+executors = {name: ModelExecutor(name, **executor_config(name)) for name in MODEL_ARTIFACTS}
+
+
+async def predict_rows(entry: LoadedModel, X):
+    """Raw estimator output for aligned input X, computed on the model's executor."""
+    try:
+        return await executors[entry.name].run(entry, X)
+    except ExecutorOverloaded as e:
+        raise HTTPException(status_code=503, detail=str(e))
+
+
+# ---------------------------------------------------------
+# 📦 Adaptive micro-batching (concurrent single-row requests → one estimator call)
+# ---------------------------------------------------------
+# Override with CRICSCOUT_BATCH_WINDOW_MS / CRICSCOUT_BATCH_MAX, or disable with CRICSCOUT_MICROBATCH=0.
+BATCHING_DEFAULTS = {"window_ms": 2.0, "max_batch": 32}
+BATCHING_CONFIG = {
+    "performance": {"window_ms": 2.0, "max_batch": 64},
+    "fitness": {"window_ms": 2.0, "max_batch": 32},
+}
+MICROBATCH_ENABLED = os.getenv("CRICSCOUT_MICROBATCH", "1") != "0"
+
+
+def batching_config(model_name: str) -> dict:
+    config = {**BATCHING_DEFAULTS, **BATCHING_CONFIG.get(model_name, {})}
+    if os.getenv("CRICSCOUT_BATCH_WINDOW_MS"):
+        config["window_ms"] = float(os.getenv("CRICSCOUT_BATCH_WINDOW_MS"))
+    if os.getenv("CRICSCOUT_BATCH_MAX"):
+        config["max_batch"] = int(os.getenv("CRICSCOUT_BATCH_MAX"))
+    return config
+
+
+class MicroBatcher:
+    """
+    Collects fast-path rows for one model and scores them with one vectorized call.
+
+    - A batch closes at max_batch rows or window_ms after its first row, whichever comes first.
+    - The window is only held open while recent batches show concurrent traffic, so a lone
+      request is dispatched immediately and pays no added latency.
+    - At most `executor.workers` batches run at once; rows arriving while every worker is busy
+      are folded into the next batch instead of queuing one call each.
+    """
+
+    def __init__(self, model_name: str, executor: ModelExecutor, window_ms: float, max_batch: int):
+        self.model_name = model_name
+        self.executor = executor
+        self.window = window_ms / 1000
+        self.max_batch = max_batch
+
+        self._loop = None
+        self._queue = None
+        self._slots = None
+        self._task = None
+        self._load = 1.0   # EWMA of recent batch sizes
+
+        self.batches = 0
+        self.rows = 0
+        self.max_seen = 0
+        self.batch_sizes = deque(maxlen=2048)
+        self.wait_times = deque(maxlen=2048)   # seconds from submit to dispatch
+
+    def _ensure_running(self):
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop or self._task is None or self._task.done():
+            self._loop = loop
+            self._queue = asyncio.Queue()
+            self._slots = asyncio.Semaphore(self.executor.workers)
+            self._task = loop.create_task(self._collect())
+
+    async def submit(self, entry: LoadedModel, row: np.ndarray):
+        """Queue one (1, n_features) row; resolves to that row's slice of the raw estimator output."""
+        self._ensure_running()
+        future = self._loop.create_future()
+        self._queue.put_nowait((entry, row, future, time.perf_counter()))
+        return await future
+
+    async def _collect(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+
+            # Hold the window open only when traffic is concurrent
+            if self._load > 1.5:
+                deadline = loop.time() + self.window
+                while len(batch) < self.max_batch:
+                    remaining = deadline - loop.time()
+                    if remaining <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+                    except asyncio.TimeoutError:
+                        break
+
+            await self._slots.acquire()
+
+            # Fold in everything that arrived while we waited for a free worker
+            while len(batch) < self.max_batch and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+
+            self._load = 0.8 * self._load + 0.2 * len(batch)
+            loop.create_task(self._dispatch(batch))
+
+    async def _dispatch(self, batch: list):
+        try:
+            dispatched = time.perf_counter()
+            self.batches += 1
+            self.rows += len(batch)
+            self.max_seen = max(self.max_seen, len(batch))
+            self.batch_sizes.append(len(batch))
+            self.wait_times.extend(dispatched - submitted for _, _, _, submitted in batch)
+
+            # A hot swap can land mid-batch: each row is scored by the version it resolved
+            groups = {}
+            for item in batch:
+                groups.setdefault(id(item[0]), []).append(item)
+            for group in groups.values():
+                await self._run_group(group)
+
+        except Exception as e:
+            for _, _, future, _ in batch:
+                if not future.done():
+                    future.set_exception(e)
+        finally:
+            self._slots.release()
+
+    async def _run_group(self, group: list):
+        entry = group[0][0]
+        try:
+            raw = await self.executor.run(entry, np.vstack([row for _, row, _, _ in group]))
+        except ExecutorOverloaded as e:
+            for _, _, future, _ in group:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        except Exception:
+            if len(group) == 1:
+                raise
+            # One bad row must not fail its neighbours: rescore individually
+            for _, row, future, _ in group:
+                try:
+                    result = await self.executor.run(entry, row)
+                except Exception as e:
+                    if not future.done():
+                        future.set_exception(e)
+                else:
+                    if not future.done():
+                        future.set_result(result)
+            return
+
+        for i, (_, _, future, _) in enumerate(group):
+            if not future.done():
+                future.set_result(raw[i:i + 1])
+
+    def stats(self) -> dict:
+        sizes = np.fromiter(self.batch_sizes, dtype=np.float64)
+        waits = np.fromiter(self.wait_times, dtype=np.float64)
+        size_p50, size_p95 = np.percentile(sizes, [50, 95]) if sizes.size else (0.0, 0.0)
+        wait_p50, wait_p95, wait_p99 = np.percentile(waits, [50, 95, 99]) * 1000 if waits.size else (0.0, 0.0, 0.0)
+        return {
+            "window_ms": self.window * 1000,
+            "max_batch": self.max_batch,
+            "batches": self.batches,
+            "rows": self.rows,
+            "batch_size": {
+                "mean": round(self.rows / self.batches, 2) if self.batches else 0.0,
+                "p50": round(float(size_p50), 2),
+                "p95": round(float(size_p95), 2),
+                "max": self.max_seen,
+            },
+            "wait_ms": {
+                "p50": round(float(wait_p50), 3),
+                "p95": round(float(wait_p95), 3),
+                "p99": round(float(wait_p99), 3),
+            },
+        }
+
+    def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+
+
+batchers = (
+    {name: MicroBatcher(name, executors[name], **batching_config(name)) for name in MODEL_ARTIFACTS}
+    if MICROBATCH_ENABLED else {}
+)
+
+
+async def predict_row(entry: LoadedModel, row: np.ndarray):
+    """Raw estimator output for one fast-path row, through the model's micro-batcher when enabled."""
+    batcher = batchers.get(entry.name)
+    if batcher is None:
+        return await predict_rows(entry, row)
+    try:
+        return await batcher.submit(entry, row)
+    except ExecutorOverloaded as e:
+        raise HTTPException(status_code=503, detail=str(e))
+
+
+# ---------------------------------------------------------
+# 🗃️ Prediction cache (same aligned features → same response)
+# ---------------------------------------------------------
+# CRICSCOUT_CACHE_SIZE=0 disables the cache.
+CACHE_MAX_ENTRIES = int(os.getenv("CRICSCOUT_CACHE_SIZE", "4096"))
+CACHE_TTL_SECONDS = float(os.getenv("CRICSCOUT_CACHE_TTL_S", "300"))
+
+
+class PredictionCache:
+    """
+    LRU + TTL cache of single-row responses.
+    Key: (model name, model version, aligned float64 feature vector), so payloads that differ
+    only in key order, unknown keys or explicit default values share an entry.
+    """
+
+    def __init__(self, max_entries: int, ttl_seconds: float):
+        self.max_entries = max_entries
+        self.ttl = ttl_seconds
+        self._entries = OrderedDict()   # key → (expires_at, response)
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    @staticmethod
+    def key(entry: LoadedModel, row: np.ndarray) -> tuple:
+        # + 0.0 folds -0.0 into 0.0 so both hash the same
+        return entry.name, entry.version, (row + 0.0).tobytes()
+
+    def get(self, key: tuple):
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        expires_at, response = entry
+        if expires_at < time.monotonic():
+            del self._entries[key]
+            self.expirations += 1
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return dict(response)
+
+    def put(self, key: tuple, response: dict):
+        if self.max_entries <= 0:
+            return
+        self._entries[key] = (time.monotonic() + self.ttl, dict(response))
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def invalidate(self, model_name: str = None):
+        """Drop every entry for model_name (or everything). Call whenever a model is reloaded."""
+        if model_name is None:
+            self._entries.clear()
+            return
+        for key in [key for key in self._entries if key[0] == model_name]:
+            del self._entries[key]
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "ttl_seconds": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+        }
+
+
+prediction_cache = PredictionCache(CACHE_MAX_ENTRIES, CACHE_TTL_SECONDS)
+registry.on_swap(prediction_cache.invalidate)
+
+
+def rows_from_batch_body(body) -> list:
+    """
+    Accepts any of:
+      [ {...}, {...} ]                       -> list of feature dicts
+      { "rows": [ {...}, {...} ] }           -> list of feature dicts
+      { "columns": { "feat": [..], ... } }   -> columnar payload
+    """
+    if isinstance(body, list):
+        return body
+
+    if not isinstance(body, dict):
+        raise ValueError("Batch body must be a list of feature dicts or an object with 'rows' / 'columns'.")
+
+    if "rows" in body:
+        rows = body["rows"]
+        if not isinstance(rows, list):
+            raise ValueError("'rows' must be a list of feature dicts.")
+        # Accept the single-request { value_dict: {...} } wrapper per row as well
+        return [row.get("value_dict", row) if isinstance(row, dict) else row for row in rows]
+
+    if "columns" in body:
+        columns = body["columns"]
+        if not isinstance(columns, dict):
+            raise ValueError("'columns' must map feature names to equal-length lists.")
+        lengths = {len(values) for values in columns.values()}
+        if len(lengths) > 1:
+            raise ValueError(f"All columns must have the same length, got lengths {sorted(lengths)}.")
+        n_rows = lengths.pop() if lengths else 0
+        return [{name: values[i] for name, values in columns.items()} for i in range(n_rows)]
+
+    raise ValueError("Batch body must contain 'rows' or 'columns'.")
+
+
+# ---------------------------------------------------------
+# ✅ Unified Prediction Endpoint
+# ---------------------------------------------------------
+@app.post("/predict/{model_name}")
+async def predict(model_name: str, request: Request):
+    """
+    Predict using the selected model.
+    Example: /predict/fitness  or  /predict/performance
+    """
+    entry = await resolve_model(model_name)
+    timer = metrics.stage_timer(model_name)
+
+    try:
+        # 2️⃣ Parse request body
+        with timer.stage("parse"):
+            if VALIDATION_MODE == "off":
+                body = await request.json()
+                # Handle Next.js format: { value_dict: {...} } or direct {...}
+                features = body.get("value_dict", body)
+            else:
+                # Same two shapes, validated against this model's schema in one pass
+                body = await request.body()
+                features = parse_features(entry, body, coerce_requested(request))
+
+        sampled = log_sampled()
+        if sampled:
+            logger.debug("📩 Received features for '%s' model: %s", model_name, body)
+
+        # 3️⃣ Align features
+        with timer.stage("align"):
+            if entry.fast_path:
+                row = entry.layout.row(features)
+            else:
+                model_input = align_features(entry, [features])
+                try:
+                    row = model_input.to_numpy(dtype=np.float64)
+                except (TypeError, ValueError):
+                    row = None   # non-numeric payload: let the estimator report it, skip the cache
+
+        with timer.stage("cache"):
+            cache_key = PredictionCache.key(entry, row) if row is not None else None
+            result = prediction_cache.get(cache_key) if cache_key is not None else None
+
+        if result is None:
+            # 4️⃣ Predict
+            with timer.stage("predict"):
+                if entry.fast_path:
+                    # NumPy row → micro-batched with concurrent requests for this model
+                    raw = await predict_row(entry, row)
+                else:
+                    raw = await predict_rows(entry, model_input)
+
+            # 5️⃣ Response
+            with timer.stage("respond"):
+                result = build_responses(model_name, entry.model, raw)[0]
+                result["model_version"] = entry.version
+                if cache_key is not None:
+                    prediction_cache.put(cache_key, result)
+
+        if sampled:
+            logger.debug("✅ Prediction successful for '%s': %s", model_name, result)
+
+        # Rendered here (skipping FastAPI's jsonable_encoder pass) so the time shows up per stage
+        with timer.stage("serialize"):
+            return FastJSONResponse(result)
+
+    except HTTPException:
+        raise
     except Exception as e:
-        print("❌ Prediction error:", str(e))
+        logger.warning("❌ Prediction error for '%s': %s", model_name, e)
         # Return HTTP 400 with the error detail
-        raise HTTPException(status_code=400, detail=f"Prediction failed: {str(e)}")
\ No newline at end of file
+        raise HTTPException(status_code=400, detail=f"Prediction failed: {str(e)}")
+
+
+# ---------------------------------------------------------
+# ✅ Batch Prediction Endpoint
+# ---------------------------------------------------------
+@app.post("/predict/{model_name}/batch")
+async def predict_batch(model_name: str, request: Request):
+    """
+    Score many players in one call: one reindex + one vectorized predict.
+    Example: /predict/fitness/batch  with  {"rows": [{...}, {...}]}
+    """
+    entry = await resolve_model(model_name)
+    timer = metrics.stage_timer(model_name)
+
+    try:
+        with timer.stage("parse"):
+            rows = rows_from_batch_body(await request.json())
+            if VALIDATION_MODE != "off":
+                rows = validate_rows(entry, rows, coerce_requested(request))
+
+        if not rows:
+            return {"model_used": model_name, "model_version": entry.version, "count": 0, "results": []}
+
+        with timer.stage("align"):
+            model_input = build_input(entry, rows)
+        with timer.stage("predict"):
+            raw = await predict_rows(entry, model_input)
+        with timer.stage("respond"):
+            results = build_responses(model_name, entry.model, raw)
+
+        if log_sampled():
+            logger.debug("✅ Batch prediction successful for '%s': %d rows", model_name, len(results))
+
+        with timer.stage("serialize"):
+            return FastJSONResponse(
+                {"model_used": model_name, "model_version": entry.version, "count": len(results), "results": results}
+            )
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.warning("❌ Batch prediction error for '%s': %s", model_name, e)
+        raise HTTPException(status_code=400, detail=f"Batch prediction failed: {str(e)}")
+
+
+# ---------------------------------------------------------
+# 🌊 Streaming NDJSON bulk scoring
+# ---------------------------------------------------------
+# Rows scored per vectorized call, and the longest single input line accepted.
+STREAM_CHUNK_ROWS = int(os.getenv("CRICSCOUT_STREAM_CHUNK_ROWS", "512"))
+STREAM_MAX_LINE_BYTES = int(os.getenv("CRICSCOUT_STREAM_MAX_LINE_BYTES", str(1 << 20)))
+
+
+class DuplexStreamingResponse(StreamingResponse):
+    """
+    StreamingResponse whose body generator reads the request stream itself.
+    On ASGI < 2.4 the stock class also polls `receive` for disconnects, which would steal
+    upload chunks from request.stream(); a disconnect still surfaces there as ClientDisconnect.
+    """
+
+    async def __call__(self, scope, receive, send):
+        await self.stream_response(send)
+        if self.background is not None:
+            await self.background()
+
+
+def _ndjson(objects) -> bytes:
+    return b"".join(dumps_json(obj) + b"\n" for obj in objects)
+
+
+async def score_stream_chunk(entry: LoadedModel, chunk: list, timer: StageTimer) -> bytes:
+    """Score one chunk of (line_no, features, line_error) with one vectorized call → NDJSON bytes."""
+    out = {}
+    valid_lines, valid_features, valid_rows = [], [], []
+
+    with timer.stage("align"):
+        for line_no, features, line_error in chunk:
+            if line_error is not None:
+                out[line_no] = {"line": line_no, **line_error}
+                continue
+            try:
+                if not isinstance(features, dict):
+                    raise ValueError("each line must be a JSON object of features")
+                valid_rows.append(entry.layout.row(features))
+                valid_lines.append(line_no)
+                valid_features.append(features)
+            except (TypeError, ValueError) as e:
+                out[line_no] = {"line": line_no, "error": str(e)}
+        if valid_rows:
+            model_input = np.vstack(valid_rows) if entry.fast_path else align_features(entry, valid_features)
+
+    if valid_rows:
+        try:
+            with timer.stage("predict"):
+                raw = await predict_rows(entry, model_input)
+            with timer.stage("respond"):
+                for line_no, result in zip(valid_lines, build_responses(entry.name, entry.model, raw)):
+                    out[line_no] = {"line": line_no, **result, "model_version": entry.version}
+        except Exception as e:
+            detail = e.detail if isinstance(e, HTTPException) else str(e)
+            for line_no in valid_lines:
+                out[line_no] = {"line": line_no, "error": f"Prediction failed: {detail}"}
+
+    return _ndjson(out[line_no] for line_no, _, _ in chunk)
+
+
+@app.post("/predict/{model_name}/stream")
+async def predict_stream(model_name: str, request: Request):
+    """
+    Bulk scoring over newline-delimited JSON: one feature object per input line,
+    one result object per output line (same order, tagged with "line").
+    Each line is validated like a /predict body; a bad line gets an error line, the rest are still scored.
+    Rows are scored in chunks of ?chunk_size= (default STREAM_CHUNK_ROWS) while the upload is
+    still arriving, so memory stays bounded by one chunk + one partial line however large the input.
+    """
+    entry = await resolve_model(model_name)
+    timer = metrics.stage_timer(model_name)
+    chunk_size = max(1, int(request.query_params.get("chunk_size", STREAM_CHUNK_ROWS)))
+    schema = None
+    if VALIDATION_MODE != "off":
+        schema = entry.lenient_schema if coerce_requested(request) else entry.schema
+
+    async def results():
+        chunk = []
+        pending = b""
+        line_no = 0
+
+        def take(line: bytes):
+            nonlocal line_no
+            line_no += 1
+            if not line.strip():
+                return
+            with timer.stage("parse"):
+                if schema is not None:
+                    try:
+                        features = schema.validate_json(line)
+                    except ValidationError as e:
+                        # Kept in the chunk so output order still follows input order
+                        chunk.append((line_no, None, {"error": "Invalid features", "detail": schema_errors(e)}))
+                        return
+                    chunk.append((line_no, features.get("value_dict", features), None))
+                    return
+                try:
+                    features = json.loads(line)
+                except ValueError as e:
+                    chunk.append((line_no, None, {"error": f"Invalid JSON: {e}"}))
+                    return
+                if isinstance(features, dict):
+                    # Same { value_dict: {...} } wrapper as /predict
+                    features = features.get("value_dict", features)
+            chunk.append((line_no, features, None))
+
+        async for piece in request.stream():
+            pending += piece
+            *lines, pending = pending.split(b"\n")
+            for line in lines:
+                take(line)
+                if len(chunk) >= chunk_size:
+                    yield await score_stream_chunk(entry, chunk, timer)
+                    chunk = []
+            if len(pending) > STREAM_MAX_LINE_BYTES:
+                if chunk:
+                    yield await score_stream_chunk(entry, chunk, timer)
+                yield _ndjson([{"line": line_no + 1, "error": f"Line exceeds {STREAM_MAX_LINE_BYTES} bytes; stream aborted"}])
+                return
+
+        take(pending)
+        if chunk:
+            yield await score_stream_chunk(entry, chunk, timer)
+
+    return DuplexStreamingResponse(results(), media_type="application/x-ndjson")
+
+
+# ---------------------------------------------------------
+# 🔁 Model versions: hot reload + rollback
+# ---------------------------------------------------------
+def artifact_path(path: str) -> str:
+    """Resolve a reload path, refusing anything outside MODEL_DIR (loading a pickle runs code)."""
+    resolved = os.path.realpath(os.path.join(MODEL_DIR, path))
+    if os.path.commonpath([resolved, MODEL_DIR]) != MODEL_DIR:
+        raise HTTPException(status_code=400, detail=f"Artifact path must be inside {MODEL_DIR}")
+    if not os.path.isfile(resolved):
+        raise HTTPException(status_code=400, detail=f"Artifact not found: {path}")
+    return resolved
+
+
+# Strong references to fire-and-forget reloads (the event loop only keeps weak ones)
+_background_tasks = set()
+
+
+async def optional_json(request: Request) -> dict:
+    body = await request.body()
+    return (await request.json()) if body.strip() else {}
+
+
+@app.get("/models")
+def list_models():
+    """Active version, loaded versions and load stats per model."""
+    return registry.report()
+
+
+@app.post("/models/{model_name}/reload")
+async def reload_model(model_name: str, request: Request):
+    """
+    Load a new version in the background, warm it, then swap it in.
+    Body (optional): {"model_path": ..., "features_path": ..., "wait": true}
+    Without "wait" the call returns 202 immediately; poll GET /models for the result.
+    """
+    if model_name not in registry:
+        raise HTTPException(status_code=404, detail=f"Model '{model_name}' not found. Available: {registry.names()}")
+
+    body = await optional_json(request)
+    model_path = artifact_path(body["model_path"]) if body.get("model_path") else None
+    features_path = artifact_path(body["features_path"]) if body.get("features_path") else None
+
+    if not body.get("wait"):
+        task = asyncio.create_task(registry.reload(model_name, model_path, features_path))
+        _background_tasks.add(task)
+        # Errors land in the registry report; retrieve them so asyncio does not log them again
+        task.add_done_callback(lambda t: _background_tasks.discard(t) or t.cancelled() or t.exception())
+        return JSONResponse(status_code=202, content={"model": model_name, "status": "reloading"})
+
+    try:
+        entry = await registry.reload(model_name, model_path, features_path)
+    except Exception as e:
+        raise HTTPException(status_code=409, detail=f"Reload failed, keeping the active version: {e}")
+    return {"model": model_name, "active_version": entry.version, "versions": registry.report()[model_name]["versions"]}
+
+
+@app.post("/models/{model_name}/rollback")
+async def rollback_model(model_name: str, request: Request):
+    """Re-activate the previous version, or {"version": ...} if given."""
+    if model_name not in registry:
+        raise HTTPException(status_code=404, detail=f"Model '{model_name}' not found. Available: {registry.names()}")
+
+    body = await optional_json(request)
+    try:
+        entry = registry.rollback(model_name, body.get("version"))
+    except LookupError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    return {"model": model_name, "active_version": entry.version}
+
+
+# ---------------------------------------------------------
+# 📊 Runtime stats + Prometheus metrics
+# ---------------------------------------------------------
+@app.get("/metrics")
+def prometheus_metrics():
+    """Latency histograms and request / error counters in Prometheus text format."""
+    lines = [metrics.render().rstrip("\n")]
+
+    lines.append("# TYPE cricscout_executor_in_flight gauge")
+    lines += [f"cricscout_executor_in_flight{_labels(model=name)} {ex.in_flight}" for name, ex in executors.items()]
+    lines.append("# TYPE cricscout_executor_rejected_total counter")
+    lines += [f"cricscout_executor_rejected_total{_labels(model=name)} {ex.rejected}" for name, ex in executors.items()]
+    lines.append("# TYPE cricscout_microbatch_batches_total counter")
+    lines += [f"cricscout_microbatch_batches_total{_labels(model=name)} {b.batches}" for name, b in batchers.items()]
+    lines.append("# TYPE cricscout_microbatch_rows_total counter")
+    lines += [f"cricscout_microbatch_rows_total{_labels(model=name)} {b.rows}" for name, b in batchers.items()]
+    for counter in ("hits", "misses", "evictions"):
+        lines.append(f"# TYPE cricscout_cache_{counter}_total counter")
+        lines.append(f"cricscout_cache_{counter}_total {getattr(prediction_cache, counter)}")
+
+    return PlainTextResponse("\n".join(lines) + "\n", media_type="text/plain; version=0.0.4")
+
+
+# ---------------------------------------------------------
+# 📊 Runtime stats
+# ---------------------------------------------------------
+@app.get("/stats")
+def stats():
+    """Per-model load time / memory, pool queue depth, wait times, micro-batch sizes, cache and score-store counters."""
+    return {
+        "models": registry.report(),
+        "executors": {name: executor.stats() for name, executor in executors.items()},
+        "batching": {name: batcher.stats() for name, batcher in batchers.items()},
+        "cache": prediction_cache.stats(),
+        "scores": score_store.stats(),
+    }
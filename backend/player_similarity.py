@@ -0,0 +1,323 @@
+"""
+Nearest-neighbour search over per-player score vectors.
+
+Each selector-ready record becomes one row of a float32 matrix: its stats fields
+(ROLE_FEATURES) rescaled by fixed ranges (FEATURE_RANGES) to roughly 0–1. Because the
+scale does not depend on the other players, rows are independent. The matrix is stored
+as blocks of BLOCK_ROWS rows; updated() takes only the players that changed, were added
+or were removed, and copies just the blocks holding their rows, sharing every other
+block with the previous index. Removed players leave a tombstone row (infinite norm)
+that the next added player reuses.
+
+Queries use blocked brute force: squared Euclidean distances are computed block by
+block as |x|² − 2·x·q + |q|², with row norms precomputed, and each block keeps its
+argpartition top k. At six dimensions this beats a KD-tree and has no tree to rebalance
+when rows change.
+
+Batters and bowlers get separate indexes. The bowling exports carry only the four
+scores, no average / strike rate.
+
+Benchmark (run from backend/):
+    python player_similarity.py --players 100000
+"""
+
+import argparse
+import time
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+# stats field → (low, high) mapped to 0 / 1; same average / strike-rate bands as pressure_batting.py
+FEATURE_RANGES = {
+    "pressureScore": (0.0, 100.0),
+    "baseSkillScore": (0.0, 100.0),
+    "consistencyScore": (0.0, 100.0),
+    "oppositionQualityScore": (0.0, 100.0),
+    "average": (20.0, 60.0),
+    "strikeRate": (80.0, 150.0),
+}
+
+ROLE_FEATURES = {
+    "Batter": ("pressureScore", "baseSkillScore", "consistencyScore", "oppositionQualityScore",
+               "average", "strikeRate"),
+    "Bowler": ("pressureScore", "baseSkillScore", "consistencyScore", "oppositionQualityScore"),
+}
+
+BLOCK_ROWS = 8192
+_NUMBER_TYPES = frozenset((int, float))
+
+
+def player_id(record: dict) -> str:
+    """The record's id, or the exporters' slug of its name (bowler records have no id)."""
+    return record.get("id") or record["name"].lower().replace(" ", "-")
+
+
+class SimilarityIndex:
+    """
+    Normalised score matrix for one role. Never mutated once built: updated()
+    returns a new index, so readers of the old one are never disturbed.
+
+    ids[row] is the player in that row, or None for a free (tombstone) row. Every block
+    but the last holds exactly BLOCK_ROWS rows; free rows have an infinite norm, so they
+    are never among the nearest.
+    """
+
+    def __init__(self, features: Tuple[str, ...], ids: List[Optional[str]] = None,
+                 blocks: List[np.ndarray] = None, norms: List[np.ndarray] = None, free: List[int] = None,
+                 rows: Dict[str, int] = None):
+        self.features = tuple(features)
+        self.ids = ids or []
+        self.rows = rows if rows is not None else {pid: row for row, pid in enumerate(self.ids) if pid is not None}
+        self.blocks = blocks or []
+        self.norms = norms or []
+        self.free = free or []
+
+        ranges = np.array([FEATURE_RANGES[f] for f in self.features], dtype=np.float64).reshape(-1, 2)
+        self._low = ranges[:, 0]
+        self._span = ranges[:, 1] - ranges[:, 0]
+
+        self.last_update = {"reused": 0, "changed": 0, "removed": 0}
+
+    @classmethod
+    def build(cls, features: Tuple[str, ...], players: Iterable[Tuple[str, dict]]) -> "SimilarityIndex":
+        """
+        Index over (player id, stats) in the given order. Players missing a feature are
+        left out; a repeated id raises ValueError.
+        """
+        index = cls(features)
+        ids, values = [], []
+        seen = set()
+        for pid, stats in players:
+            if pid in seen:
+                raise ValueError(f"duplicate player id {pid!r}")
+            seen.add(pid)
+            vector = index.vector(stats)
+            if vector is not None:
+                ids.append(pid)
+                values.append(vector)
+
+        matrix = index.normalize(np.array(values, dtype=np.float64).reshape(len(ids), len(index.features)))
+        norms = np.einsum("ij,ij->i", matrix, matrix)
+        blocks = [matrix[start:start + BLOCK_ROWS] for start in range(0, len(ids), BLOCK_ROWS)]
+        block_norms = [norms[start:start + BLOCK_ROWS] for start in range(0, len(ids), BLOCK_ROWS)]
+        built = cls(features, ids, blocks, block_norms)
+        built.last_update = {"reused": 0, "changed": len(ids), "removed": 0}
+        return built
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def vector(self, stats: dict) -> Optional[list]:
+        """The stats' feature values, or None if any is missing or not a JSON number (bools excluded)."""
+        vector = [stats.get(f) for f in self.features]
+        return vector if _NUMBER_TYPES.issuperset(map(type, vector)) else None
+
+    def normalize(self, raw: np.ndarray) -> np.ndarray:
+        return ((raw - self._low) / self._span).astype(np.float32)
+
+    def row_vector(self, row: int) -> np.ndarray:
+        return self.blocks[row // BLOCK_ROWS][row % BLOCK_ROWS]
+
+    def updated(self, changes: Iterable[Tuple[str, dict]], removed: Iterable[str] = ()) -> "SimilarityIndex":
+        """
+        New index with `changes` (player id, stats) written and `removed` ids dropped.
+        Only the blocks holding those rows are copied; the id list and row map are
+        shallow copies. Changed players missing a feature are dropped; an id given twice
+        (in changes, or in both arguments) raises ValueError.
+        """
+        ids = list(self.ids)
+        rows = dict(self.rows)
+        free = list(self.free)
+        writes: Dict[int, List[Tuple[int, Optional[list]]]] = {}   # block → [(offset, vector or None)]
+
+        def write(row: int, vector: Optional[list]):
+            writes.setdefault(row // BLOCK_ROWS, []).append((row % BLOCK_ROWS, vector))
+
+        seen = set()
+        tombstones = []
+        changed = 0
+        for pid, stats in changes:
+            if pid in seen:
+                raise ValueError(f"duplicate player id {pid!r}")
+            seen.add(pid)
+            vector = self.vector(stats)
+            row = self.rows.get(pid)
+            if vector is None:
+                if row is not None:
+                    ids[row] = None
+                    del rows[pid]
+                    write(row, None)
+                    tombstones.append(row)
+                continue
+            if row is None:
+                row = free.pop() if free else len(ids)
+                if row == len(ids):
+                    ids.append(pid)
+                else:
+                    ids[row] = pid
+                rows[pid] = row
+            write(row, vector)
+            changed += 1
+
+        for pid in removed:
+            if pid in seen:
+                raise ValueError(f"duplicate player id {pid!r}")
+            seen.add(pid)
+            row = self.rows.get(pid)
+            if row is not None:
+                ids[row] = None
+                del rows[pid]
+                write(row, None)
+                tombstones.append(row)
+
+        # Rows freed here are reused from the next update on, so no row is written twice
+        free.extend(tombstones)
+        blocks, norms = list(self.blocks), list(self.norms)
+        for b, entries in writes.items():
+            size = min(BLOCK_ROWS, len(ids) - b * BLOCK_ROWS)
+            block = np.zeros((size, len(self.features)), dtype=np.float32)
+            block_norms = np.full(size, np.inf, dtype=np.float32)
+            if b < len(blocks):
+                block[:len(blocks[b])] = blocks[b]
+                block_norms[:len(norms[b])] = norms[b]
+            else:
+                blocks.append(block)
+                norms.append(block_norms)
+
+            kept = [(offset, vector) for offset, vector in entries if vector is not None]
+            if kept:
+                offsets = np.array([offset for offset, _ in kept], dtype=np.int64)
+                block[offsets] = self.normalize(np.array([vector for _, vector in kept], dtype=np.float64))
+                block_norms[offsets] = np.einsum("ij,ij->i", block[offsets], block[offsets])
+            block_norms[[offset for offset, vector in entries if vector is None]] = np.inf
+            blocks[b], norms[b] = block, block_norms
+
+        index = SimilarityIndex(self.features, ids, blocks, norms, free, rows)
+        index.last_update = {"reused": len(index) - changed, "changed": changed, "removed": len(tombstones)}
+        return index
+
+    def neighbours(self, pid: str, k: int) -> List[Tuple[str, float]]:
+        """The k players closest to pid (pid itself excluded), nearest first."""
+        row = self.rows.get(pid)
+        if row is None:
+            raise KeyError(pid)
+        return [(self.ids[r], d) for r, d in self.nearest(self.row_vector(row), k, exclude=row)]
+
+    def nearest(self, query: np.ndarray, k: int, exclude: Optional[int] = None) -> List[Tuple[int, float]]:
+        """(row, Euclidean distance) of the k rows closest to a normalised query vector."""
+        query = np.asarray(query, dtype=np.float32)
+        query_norm = float(query @ query)
+        wanted = k + (exclude is not None)
+
+        best_rows, best_dist = [], []
+        for b, (block, block_norms) in enumerate(zip(self.blocks, self.norms)):
+            dist = block_norms - 2 * (block @ query) + query_norm
+            if len(dist) > wanted:
+                top = np.argpartition(dist, wanted - 1)[:wanted]
+            else:
+                top = np.arange(len(dist))
+            best_rows.append(top + b * BLOCK_ROWS)
+            best_dist.append(dist[top])
+
+        if not best_rows:
+            return []
+        rows = np.concatenate(best_rows)
+        dist = np.concatenate(best_dist)
+        keep = np.isfinite(dist)   # free rows
+        if exclude is not None:
+            keep &= rows != exclude
+        rows = rows[keep]
+        # The matmul shortlist depends on where a row sits in its block; re-rank the few
+        # candidates exactly so a delta-updated index answers like a fresh build
+        candidates = np.array([self.blocks[r // BLOCK_ROWS][r % BLOCK_ROWS] for r in rows.tolist()],
+                              dtype=np.float64).reshape(len(rows), len(self.features))
+        exact = np.sqrt(((candidates - query.astype(np.float64)) ** 2).sum(axis=1))
+        # Distance first, then player id for ties (rows are reused, so row order is not load order)
+        ranked = sorted(zip(exact.tolist(), (self.ids[r] for r in rows.tolist()), rows.tolist()))[:k]
+        return [(row, d) for d, _, row in ranked]
+
+    def stats(self) -> dict:
+        return {"players": len(self), "rows": len(self.ids), "blocks": len(self.blocks),
+                "features": list(self.features), "last_update": self.last_update}
+
+
+def build_indexes(records: Iterable[dict]) -> Dict[str, SimilarityIndex]:
+    """{role: SimilarityIndex} over ready records. A player id repeated within a role raises ValueError."""
+    by_role = {role: [] for role in ROLE_FEATURES}
+    for record in records:
+        if record.get("role") in by_role:
+            by_role[record["role"]].append((player_id(record), record.get("stats", {})))
+    return {role: SimilarityIndex.build(features, by_role[role]) for role, features in ROLE_FEATURES.items()}
+
+
+# ---------------------------------------------------------
+# ⏱️ Benchmark
+# ---------------------------------------------------------
+def main():
+    parser = argparse.ArgumentParser(description="k-NN latency and incremental update on synthetic batters")
+    parser.add_argument("--players", type=int, default=100000)
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--queries", type=int, default=1000)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    features = ROLE_FEATURES["Batter"]
+    values = np.column_stack([
+        rng.uniform(*FEATURE_RANGES[f], size=args.players) for f in features
+    ]).round(2)
+    players = [(f"player-{i}", dict(zip(features, row))) for i, row in enumerate(values.tolist())]
+
+    started = time.perf_counter()
+    index = SimilarityIndex.build(features, players)
+    build_s = time.perf_counter() - started
+
+    # Brute-force reference for a few queries
+    matrix = np.concatenate(index.blocks).astype(np.float64)
+    for pid in ("player-0", f"player-{args.players // 2}"):
+        row = index.rows[pid]
+        dist = np.sqrt(((matrix - matrix[row]) ** 2).sum(axis=1))
+        dist[row] = np.inf
+        expected = set(np.argsort(dist, kind="stable")[:args.k].tolist())
+        got = {index.rows[p] for p, _ in index.neighbours(pid, args.k)}
+        assert got == expected, (pid, got ^ expected)
+
+    queries = rng.integers(args.players, size=args.queries)
+    started = time.perf_counter()
+    for q in queries:
+        index.neighbours(f"player-{q}", args.k)
+    query_ms = (time.perf_counter() - started) / args.queries * 1000
+
+    # 1% of the players re-scored: only they are passed to updated()
+    changed = rng.choice(args.players, size=max(args.players // 100, 1), replace=False)
+    changes = []
+    for i in changed.tolist():
+        players[i][1]["pressureScore"] = round(players[i][1]["pressureScore"] / 2, 2)
+        changes.append(players[i])
+    started = time.perf_counter()
+    updated = index.updated(changes)
+    update_s = time.perf_counter() - started
+    fresh = SimilarityIndex.build(features, players)
+    assert np.array_equal(np.concatenate(updated.blocks), np.concatenate(fresh.blocks))
+
+    # Removals leave tombstones that later additions reuse; neighbours match a fresh build
+    gone = {f"player-{i}" for i in rng.choice(args.players, size=max(args.players // 200, 1), replace=False).tolist()}
+    added = [(f"new-{i}", dict(zip(features, row))) for i, row in enumerate(values[:len(gone)].tolist())]
+    churned = updated.updated([], gone).updated(added)
+    fresh = SimilarityIndex.build(features, [p for p in players if p[0] not in gone] + added)
+    assert len(churned) == len(fresh) and len(churned.ids) == len(index.ids)
+    for pid in ("new-0", f"player-{args.players - 1}"):
+        assert churned.neighbours(pid, args.k) == fresh.neighbours(pid, args.k), pid
+
+    try:
+        SimilarityIndex.build(features, players[:2] + players[:1])
+        raise AssertionError("duplicate id accepted")
+    except ValueError:
+        pass
+
+    print(f"{args.players} players × {len(features)} features, {matrix.nbytes / 2 / 2**20:.1f} MB")
+    print(f"build {build_s * 1000:.1f} ms | k={args.k} query {query_ms:.3f} ms | "
+          f"update ({updated.last_update['changed']} changed, {updated.last_update['reused']} reused) "
+          f"{update_s * 1000:.1f} ms")
+
+if __name__ == "__main__":
+    main()
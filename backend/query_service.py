@@ -0,0 +1,443 @@
+"""
+In-memory query service for the selector-ready score files (*_ready.json).
+
+The Express server re-reads and re-parses every ready file on each request. Here the
+files are loaded once into a ScoreSnapshot: one record list, each record pre-encoded
+as JSON, secondary indexes by dataset / team / role and a pre-sorted order per score
+field. Requests stat the files at most every SCORES_CHECK_SECONDS and swap in a new
+snapshot when one changed, so a re-export shows up without a restart.
+
+Every response carries an ETag derived from the snapshot version and the query, and
+the encoded body is kept in a small LRU. A dashboard poll with a matching
+If-None-Match gets a 304 without touching the indexes.
+
+Routes (mounted by main.py):
+    GET /api/v1/players/all                  every dataset (same order as server.js)
+    GET /api/v1/players/top?k=10&sort=...    top-k by a score field
+    GET /api/v1/players/{dataset}            one ready file, e.g. tn-smat-batters
+    GET /api/v1/players/{id}/similar?k=5     nearest players by score vector (player_similarity.py)
+Filters on the first three: team, role, dataset; sort + order (desc|asc); offset + limit.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional, Tuple
+
+from fastapi import APIRouter, HTTPException, Query, Request, Response
+
+from player_similarity import ROLE_FEATURES, SimilarityIndex, build_indexes, player_id
+
+logger = logging.getLogger("cricscout")
+
+SCORES_DIR = os.getenv(
+    "CRICSCOUT_SCORES_DIR",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "cricket-api", "data"),
+)
+
+# URL slug → ready file, same routes and order as cricket-api/server.js
+SCORE_FILES = {
+    "tn-smat-batters": "tn_smat_batters_ready.json",
+    "ker-smat-batters": "kl_smat_batters_ready.json",
+    "tn-smat-bowlers": "tn_smat_bowlers_ready.json",
+    "ker-smat-bowlers": "kl_smat_bowlers_ready.json",
+}
+
+# Stat the files at most this often; polls in between reuse the current snapshot
+SCORES_CHECK_SECONDS = float(os.getenv("CRICSCOUT_SCORES_CHECK_S", "1.0"))
+SCORES_RESPONSE_CACHE = int(os.getenv("CRICSCOUT_SCORES_RESPONSE_CACHE", "256"))
+MAX_PAGE_SIZE = 500
+
+
+def file_version(path: str) -> str:
+    """size + mtime, like artifact_version in main.py; "missing" when the file is absent."""
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return "missing"
+    return f"{stat.st_size:x}-{stat.st_mtime_ns:x}"
+
+
+def read_ready(path: str) -> list:
+    """A ready file as a list (older batter exports were wrapped as {"players": [...]})."""
+    if not os.path.exists(path):
+        return []
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    return data["players"] if isinstance(data, dict) else data
+
+
+def _is_number(value) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _encode(obj) -> bytes:
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+# ---------------------------------------------------------
+# 📇 Snapshot + indexes
+# ---------------------------------------------------------
+class ScoreSnapshot:
+    """
+    Every ready file at one version. Immutable once built; reloads build a new one.
+
+    records[i] / encoded[i] / datasets[i] describe the same player; the indexes hold
+    positions into those lists.
+    """
+
+    def __init__(self, version: str, files: Dict[str, list], previous: Optional["ScoreSnapshot"] = None):
+        self.version = version
+        self.records: List[dict] = []
+        self.datasets: List[str] = []
+        for dataset, records in files.items():
+            self.records.extend(records)
+            self.datasets.extend([dataset] * len(records))
+        self.encoded = [_encode(record) for record in self.records]
+
+        self.by_dataset = self._group(self.datasets)
+        self.by_team = self._group(str(r.get("team", "")).lower() for r in self.records)
+        self.by_role = self._group(str(r.get("role", "")).lower() for r in self.records)
+
+        # Per numeric stats field and order: positions by value (ties keep load order),
+        # players without the field last, in load order
+        self.sorted: Dict[str, Dict[str, Tuple[int, ...]]] = {}
+        fields = {
+            key for r in self.records for key, value in r.get("stats", {}).items()
+            if _is_number(value)
+        }
+        for field in fields:
+            values = [r.get("stats", {}).get(field) for r in self.records]
+            present = [i for i, v in enumerate(values) if _is_number(v)]
+            missing = tuple(i for i, v in enumerate(values) if not _is_number(v))
+            self.sorted[field] = {
+                "desc": tuple(sorted(present, key=lambda i: -values[i])) + missing,
+                "asc": tuple(sorted(present, key=lambda i: values[i])) + missing,
+            }
+
+        # Player id → position per role; ids must be unique within a role
+        self.by_id: Dict[str, Dict[str, int]] = {role: {} for role in ROLE_FEATURES}
+        for position, record in enumerate(self.records):
+            if record.get("role") in self.by_id:
+                ids = self.by_id[record["role"]]
+                pid = player_id(record)
+                if pid in ids:
+                    raise ValueError(f"duplicate {record['role'].lower()} id {pid!r}")
+                ids[pid] = position
+
+        self.similarity = self._similarity(previous)
+
+    def _similarity(self, previous: Optional["ScoreSnapshot"]) -> Dict[str, SimilarityIndex]:
+        """
+        k-NN per role. A reload only passes the players whose encoded record changed (or who
+        were added / removed) to the previous snapshot's indexes; the first load builds them.
+        """
+        if previous is None:
+            return build_indexes(self.records)
+
+        indexes = {}
+        for role, positions in self.by_id.items():
+            before = previous.by_id[role]
+            changes = [
+                (pid, self.records[position].get("stats", {}))
+                for pid, position in positions.items()
+                if pid not in before or previous.encoded[before[pid]] != self.encoded[position]
+            ]
+            indexes[role] = previous.similarity[role].updated(changes, before.keys() - positions.keys())
+        return indexes
+
+    @staticmethod
+    def _group(keys) -> Dict[str, frozenset]:
+        groups = {}
+        for position, key in enumerate(keys):
+            groups.setdefault(key, []).append(position)
+        return {key: frozenset(positions) for key, positions in groups.items()}
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def query(self, dataset: Optional[str] = None, team: Optional[str] = None, role: Optional[str] = None,
+              sort: Optional[str] = None, order: str = "desc", offset: int = 0,
+              limit: Optional[int] = None) -> Tuple[int, List[int]]:
+        """(number of matches, positions of the requested page)."""
+        candidates = None
+        for index, key in ((self.by_dataset, dataset), (self.by_team, team), (self.by_role, role)):
+            if key is None:
+                continue
+            matches = index.get(key.lower(), frozenset())
+            candidates = matches if candidates is None else candidates & matches
+
+        if sort is None:
+            ordered = range(len(self.records))
+        else:
+            if sort not in self.sorted:
+                raise KeyError(sort)
+            ordered = self.sorted[sort][order]
+
+        total = len(self.records) if candidates is None else len(candidates)
+        end = total if limit is None else offset + limit
+
+        # Walk the pre-sorted order and stop once the page is full
+        page = []
+        seen = 0
+        for position in ordered:
+            if candidates is not None and position not in candidates:
+                continue
+            if seen >= end:
+                break
+            if seen >= offset:
+                page.append(position)
+            seen += 1
+        return total, page
+
+    def body(self, total: int, page: List[int], offset: int, limit: Optional[int]) -> bytes:
+        """{"players": [...], "total", "offset", "limit"}, stitched from the pre-encoded records."""
+        players = b",".join(self.encoded[i] for i in page)
+        meta = _encode({"total": total, "offset": offset, "limit": limit})
+        return b'{"players":[' + players + b"]," + meta[1:]
+
+    def similar_body(self, pid: str, k: int, role: Optional[str] = None) -> bytes:
+        """{"player": {...}, "similar": [{"distance", "player"}, ...]} for the k nearest players."""
+        roles = [role] if role else list(ROLE_FEATURES)
+        for role_name in roles:
+            index = self.similarity.get(role_name)
+            if index is not None and pid in index.rows:
+                positions = self.by_id[role_name]
+                similar = b",".join(
+                    b'{"distance":%s,"player":%s}' % (_encode(round(distance, 4)), self.encoded[positions[other]])
+                    for other, distance in index.neighbours(pid, k)
+                )
+                return b'{"player":' + self.encoded[positions[pid]] + b',"similar":[' + similar + b"]}"
+        raise KeyError(pid)
+
+
+class ScoreStore:
+    """Current ScoreSnapshot of SCORE_FILES, reloaded when any file's size / mtime changes."""
+
+    def __init__(self, directory: str = SCORES_DIR, files: Dict[str, str] = SCORE_FILES,
+                 check_seconds: float = SCORES_CHECK_SECONDS, cache_entries: int = SCORES_RESPONSE_CACHE):
+        self.directory = directory
+        self.files = files
+        self.check_seconds = check_seconds
+        self.cache_entries = cache_entries
+
+        self._lock = threading.Lock()
+        self._snapshot: Optional[ScoreSnapshot] = None
+        self._file_versions: Optional[Tuple[str, ...]] = None
+        self._checked_at = float("-inf")
+        self._responses = OrderedDict()   # (version, query) → encoded body
+
+        self.reloads = 0
+        self.reload_errors = 0
+        self.not_modified = 0
+        self.hits = 0
+        self.misses = 0
+
+    def _paths(self) -> List[str]:
+        return [os.path.join(self.directory, name) for name in self.files.values()]
+
+    def snapshot(self) -> ScoreSnapshot:
+        """The current snapshot, after (at most every check_seconds) a size / mtime check."""
+        now = time.monotonic()
+        if self._snapshot is not None and now - self._checked_at < self.check_seconds:
+            return self._snapshot
+
+        with self._lock:
+            if self._snapshot is not None and now - self._checked_at < self.check_seconds:
+                return self._snapshot
+            versions = tuple(file_version(path) for path in self._paths())
+            if versions != self._file_versions:
+                self._reload(versions)
+            self._checked_at = time.monotonic()
+            return self._snapshot
+
+    def _reload(self, versions: Tuple[str, ...]):
+        started = time.perf_counter()
+        version = hashlib.sha1("|".join(versions).encode()).hexdigest()[:16]
+        try:
+            files = {dataset: read_ready(path) for dataset, path in zip(self.files, self._paths())}
+            snapshot = ScoreSnapshot(version, files, self._snapshot)
+        except (OSError, ValueError) as e:
+            # A file caught mid-write (or a duplicate player id): keep serving the previous
+            # snapshot and retry on the next check
+            self.reload_errors += 1
+            logger.warning("score files not reloaded, keeping version %s: %s",
+                           self._snapshot.version if self._snapshot else None, e)
+            if self._snapshot is None:
+                self._snapshot = ScoreSnapshot("empty", {dataset: [] for dataset in self.files})
+            return
+
+        self._snapshot = snapshot
+        self._file_versions = versions
+        self._responses.clear()
+        self.reloads += 1
+        logger.info("loaded %d players from %d score files (version %s) in %.1f ms",
+                    len(self._snapshot), len(self.files), version, (time.perf_counter() - started) * 1000)
+
+    def respond(self, request: Request, query: dict, build: Callable[[ScoreSnapshot], bytes]) -> Response:
+        """
+        200 with build(snapshot) (cached per snapshot version + query), or 304 on a matching
+        If-None-Match. `query` must identify the response completely (route included).
+        The routes are sync, so this runs on many threadpool threads at once: the cache and
+        counters are only touched under the lock, and build() runs outside it.
+        """
+        snapshot = self.snapshot()
+        query_key = tuple(sorted(query.items()))
+        etag = '"%s-%s"' % (snapshot.version, hashlib.sha1(repr(query_key).encode()).hexdigest()[:12])
+        headers = {"ETag": etag, "Cache-Control": "no-cache"}
+
+        if etag_matches(request.headers.get("if-none-match"), etag):
+            with self._lock:
+                self.not_modified += 1
+            return Response(status_code=304, headers=headers)
+
+        key = (snapshot.version, query_key)
+        with self._lock:
+            body = self._responses.get(key)
+            if body is not None:
+                self._responses.move_to_end(key)
+                self.hits += 1
+            else:
+                self.misses += 1
+
+        if body is None:
+            body = build(snapshot)
+            if self.cache_entries > 0:
+                with self._lock:
+                    # Skip bodies of a snapshot replaced while building (the reload cleared the cache)
+                    if snapshot is self._snapshot:
+                        self._responses[key] = body
+                        self._responses.move_to_end(key)
+                        while len(self._responses) > self.cache_entries:
+                            self._responses.popitem(last=False)
+
+        return Response(content=body, media_type="application/json", headers=headers)
+
+    def stats(self) -> dict:
+        with self._lock:
+            snapshot = self._snapshot
+            entries = len(self._responses)
+            hits, misses, not_modified = self.hits, self.misses, self.not_modified
+        lookups = hits + misses
+        return {
+            "version": snapshot.version if snapshot else None,
+            "players": len(snapshot) if snapshot else 0,
+            "files": dict(zip(self.files, self._file_versions or ())),
+            "reloads": self.reloads,
+            "reload_errors": self.reload_errors,
+            "not_modified": not_modified,
+            "similarity": {role: index.stats() for role, index in snapshot.similarity.items()} if snapshot else {},
+            "response_cache": {
+                "entries": entries,
+                "hits": hits,
+                "misses": misses,
+                "hit_rate": round(hits / lookups, 4) if lookups else 0.0,
+            },
+        }
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match uses weak comparison: W/ prefixes are ignored, "*" matches anything."""
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == etag:
+            return True
+    return False
+
+
+# ---------------------------------------------------------
+# 🌐 Routes
+# ---------------------------------------------------------
+score_store = ScoreStore()
+router = APIRouter(prefix="/api/v1/players", tags=["scores"])
+
+
+def _page(request: Request, dataset, team, role, sort, order, offset, limit) -> Response:
+    if dataset is not None and dataset not in score_store.files:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Dataset '{dataset}' not found. Available: {list(score_store.files)}"
+        )
+    query = {"dataset": dataset, "team": team, "role": role, "sort": sort,
+             "order": order, "offset": offset, "limit": limit}
+
+    def build(snapshot: ScoreSnapshot) -> bytes:
+        try:
+            total, page = snapshot.query(**query)
+        except KeyError as e:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Unknown sort field {e.args[0]!r}. Available: {sorted(snapshot.sorted)}"
+            )
+        return snapshot.body(total, page, offset, limit)
+
+    return score_store.respond(request, {"route": "page", **query}, build)
+
+
+@router.get("/all")
+def all_players(
+    request: Request,
+    dataset: Optional[str] = None,
+    team: Optional[str] = None,
+    role: Optional[str] = None,
+    sort: Optional[str] = None,
+    order: str = Query("desc", pattern="^(asc|desc)$"),
+    offset: int = Query(0, ge=0),
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE),
+):
+    """Every ready file, filtered / sorted / paginated."""
+    return _page(request, dataset, team, role, sort, order, offset, limit)
+
+
+@router.get("/top")
+def top_players(
+    request: Request,
+    k: int = Query(10, ge=1, le=MAX_PAGE_SIZE),
+    sort: str = "finalScore",
+    dataset: Optional[str] = None,
+    team: Optional[str] = None,
+    role: Optional[str] = None,
+):
+    """The k best players by one score field (default finalScore)."""
+    return _page(request, dataset, team, role, sort, "desc", 0, k)
+
+
+@router.get("/{pid}/similar")
+def similar_players(
+    request: Request,
+    pid: str,
+    k: int = Query(5, ge=1, le=MAX_PAGE_SIZE),
+    role: Optional[str] = Query(None, pattern="^(Batter|Bowler)$"),
+):
+    """
+    The k players with the closest score vectors, within the player's role.
+    pid is the record id (bowlers: their name slug, e.g. km-asif); role picks between a
+    batter and a bowler sharing an id.
+    """
+    def build(snapshot: ScoreSnapshot) -> bytes:
+        try:
+            return snapshot.similar_body(pid, k, role)
+        except KeyError:
+            raise HTTPException(status_code=404, detail=f"Player '{pid}' not found")
+
+    return score_store.respond(request, {"route": "similar", "pid": pid, "k": k, "role": role}, build)
+
+
+@router.get("/{dataset}")
+def dataset_players(
+    request: Request,
+    dataset: str,
+    team: Optional[str] = None,
+    sort: Optional[str] = None,
+    order: str = Query("desc", pattern="^(asc|desc)$"),
+    offset: int = Query(0, ge=0),
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE),
+):
+    """One ready file (same slugs as server.js), filtered / sorted / paginated."""
+    return _page(request, dataset, team, None, sort, order, offset, limit)
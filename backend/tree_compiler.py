@@ -0,0 +1,262 @@
+"""
+Offline compiler for the tree-ensemble models served by main.py.
+
+A fitted scikit-learn forest is a list of Python tree objects; predicting one row walks
+every tree through the estimator's per-call validation and joblib dispatch. compile_forest()
+flattens all trees once into contiguous NumPy arrays (feature index, threshold, left/right
+child, leaf value, per-tree root offset) and CompiledForest evaluates every tree for every
+row together, one tree level per step.
+
+Semantics match sklearn: inputs are cast to float32 before comparing against the float64
+thresholds, NaNs follow each split's missing-value direction, classifier leaves are
+normalised to probabilities and the forest output is the mean over trees.
+
+Usage (run from backend/, next to the .pkl files):
+    python tree_compiler.py fitness_regressor_model_v2.pkl [more.pkl ...]
+writes fitness_regressor_model_v2.trees.npz, which main.py picks up while its
+source_version still matches the .pkl; otherwise the server compiles in memory at load.
+"""
+
+import os
+import sys
+import numpy as np
+
+# Rows evaluated per traversal step; bounds the (rows × trees) node-index matrix
+CHUNK_ROWS = 1024
+
+
+class UnsupportedModel(Exception):
+    """The estimator is not a forest / single decision tree this compiler understands."""
+
+
+def artifact_version(path: str) -> str:
+    """Same size + mtime tag main.py uses, so a stale .trees.npz is detected."""
+    stat = os.stat(path)
+    return f"{stat.st_size:x}-{stat.st_mtime_ns:x}"
+
+
+def compiled_path(model_path: str) -> str:
+    return os.path.splitext(model_path)[0] + ".trees.npz"
+
+
+class CompiledForest:
+    """
+    Flattened tree ensemble. Node arrays are concatenated across trees and child indices
+    are global; leaves point to themselves so every row can take exactly max_depth steps.
+    left/right are also interleaved into one children table so each step is a single gather.
+    """
+
+    is_classifier = False
+
+    def __init__(self, feature, threshold, left, right, missing_left, value, roots,
+                 max_depth: int, n_features: int, classes=None, source_version: str = ""):
+        self.feature = feature
+        self.threshold = threshold
+        self.left = left
+        self.right = right
+        self.missing_left = missing_left
+        self.children = np.stack([left, right], axis=1).ravel()   # [2n] = left, [2n + 1] = right
+        self.value = value              # (n_nodes, n_outputs); class probabilities for classifiers
+        self.roots = roots
+        self.max_depth = int(max_depth)
+        self.n_features = int(n_features)
+        self.n_features_in_ = self.n_features
+        self.classes_ = classes
+        self.source_version = source_version
+
+    @property
+    def n_trees(self) -> int:
+        return len(self.roots)
+
+    @property
+    def n_nodes(self) -> int:
+        return len(self.feature)
+
+    def _leaves(self, X: np.ndarray) -> np.ndarray:
+        """Leaf node index of every (row, tree) pair → shape (n_rows, n_trees)."""
+        flat = X.ravel()
+        row_base = (np.arange(len(X)) * X.shape[1])[:, None]
+        nodes = np.broadcast_to(self.roots, (len(X), self.n_trees))
+        has_nan = np.isnan(flat).any()
+        for _ in range(self.max_depth):
+            x = flat[row_base + self.feature[nodes]]
+            go_right = ~(x <= self.threshold[nodes])
+            if has_nan:
+                go_right &= ~(np.isnan(x) & self.missing_left[nodes])
+            nodes = self.children[2 * nodes + go_right]
+        return nodes
+
+    def _mean_value(self, X) -> np.ndarray:
+        X = np.asarray(X, dtype=np.float64)
+        if X.ndim != 2 or X.shape[1] != self.n_features:
+            raise ValueError(
+                f"X has {X.shape[-1] if X.ndim else 0} features, but the compiled forest expects {self.n_features}"
+            )
+        # sklearn validates forest input as float32 and compares it against float64 thresholds
+        X = X.astype(np.float32).astype(np.float64)
+
+        out = np.empty((len(X), self.value.shape[1]), dtype=np.float64)
+        for start in range(0, len(X), CHUNK_ROWS):
+            leaves = self._leaves(X[start:start + CHUNK_ROWS])
+            # Accumulate tree by tree, in the same order as sklearn's forest averaging
+            acc = np.zeros((len(leaves), self.value.shape[1]), dtype=np.float64)
+            for t in range(self.n_trees):
+                acc += self.value[leaves[:, t]]
+            out[start:start + CHUNK_ROWS] = acc / self.n_trees
+        return out
+
+    def save(self, path: str):
+        np.savez(
+            path,
+            kind=np.array("classifier" if self.is_classifier else "regressor"),
+            feature=self.feature, threshold=self.threshold, left=self.left, right=self.right,
+            missing_left=self.missing_left, value=self.value, roots=self.roots,
+            max_depth=self.max_depth, n_features=self.n_features,
+            classes=self.classes_ if self.classes_ is not None else np.array([]),
+            source_version=np.array(self.source_version),
+        )
+
+    def report(self) -> dict:
+        return {
+            "trees": self.n_trees,
+            "nodes": self.n_nodes,
+            "max_depth": self.max_depth,
+            "bytes": sum(a.nbytes for a in (self.feature, self.threshold, self.left, self.right,
+                                            self.missing_left, self.value, self.roots)),
+        }
+
+
+class CompiledForestRegressor(CompiledForest):
+
+    def predict(self, X) -> np.ndarray:
+        out = self._mean_value(X)
+        return out[:, 0] if out.shape[1] == 1 else out
+
+
+class CompiledForestClassifier(CompiledForest):
+    """Single-output classifiers only (what main.py serves)."""
+
+    is_classifier = True
+
+    def predict_proba(self, X) -> np.ndarray:
+        return self._mean_value(X)
+
+    def predict(self, X) -> np.ndarray:
+        return self.classes_.take(np.argmax(self.predict_proba(X), axis=1))
+
+
+def _trees_of(model) -> list:
+    """The fitted sklearn trees of a forest or a bare decision tree."""
+    if hasattr(model, "tree_"):
+        return [model]
+    trees = getattr(model, "estimators_", None)
+    if not isinstance(trees, list) or not trees or not all(hasattr(t, "tree_") for t in trees):
+        # GradientBoosting stores a 2-D array of trees and sums (not averages) them
+        raise UnsupportedModel(f"{type(model).__name__} is not a forest of decision trees")
+    return trees
+
+
+def compile_forest(model, source_version: str = "") -> CompiledForest:
+    """Flatten a fitted sklearn forest / decision tree into a CompiledForest."""
+    trees = _trees_of(model)
+    is_classifier = hasattr(model, "predict_proba")
+    if is_classifier and getattr(model, "n_outputs_", 1) != 1:
+        raise UnsupportedModel("Multi-output classifiers are not supported")
+
+    feature, threshold, left, right, missing_left, value, roots = [], [], [], [], [], [], []
+    offset = 0
+    for tree in trees:
+        t = tree.tree_
+        nodes = t.__getstate__()["nodes"]
+        n = t.node_count
+        ids = np.arange(n)
+        leaf = t.children_left == -1
+
+        roots.append(offset)
+        feature.append(np.where(leaf, 0, t.feature))
+        threshold.append(np.where(leaf, np.inf, t.threshold))
+        left.append(np.where(leaf, ids, t.children_left) + offset)
+        right.append(np.where(leaf, ids, t.children_right) + offset)
+        if "missing_go_to_left" in nodes.dtype.names:
+            missing_left.append(nodes["missing_go_to_left"].astype(bool))
+        else:
+            missing_left.append(np.zeros(n, dtype=bool))
+
+        if is_classifier:
+            counts = t.value[:, 0, :]
+            totals = counts.sum(axis=1, keepdims=True)
+            value.append(counts / np.where(totals == 0, 1, totals))
+        else:
+            value.append(t.value[:, :, 0])
+        offset += n
+
+    cls = CompiledForestClassifier if is_classifier else CompiledForestRegressor
+    return cls(
+        feature=np.concatenate(feature).astype(np.intp),
+        threshold=np.concatenate(threshold).astype(np.float64),
+        left=np.concatenate(left).astype(np.intp),
+        right=np.concatenate(right).astype(np.intp),
+        missing_left=np.concatenate(missing_left),
+        value=np.ascontiguousarray(np.concatenate(value), dtype=np.float64),
+        roots=np.asarray(roots, dtype=np.intp),
+        max_depth=max(tree.tree_.max_depth for tree in trees),
+        n_features=model.n_features_in_,
+        classes=getattr(model, "classes_", None),
+        source_version=source_version,
+    )
+
+
+def load_compiled(path: str) -> CompiledForest:
+    with np.load(path, allow_pickle=False) as data:
+        is_classifier = str(data["kind"]) == "classifier"
+        cls = CompiledForestClassifier if is_classifier else CompiledForestRegressor
+        return cls(
+            feature=data["feature"], threshold=data["threshold"], left=data["left"],
+            right=data["right"], missing_left=data["missing_left"], value=data["value"],
+            roots=data["roots"], max_depth=int(data["max_depth"]), n_features=int(data["n_features"]),
+            classes=data["classes"] if is_classifier else None,
+            source_version=str(data["source_version"]),
+        )
+
+
+def compiled_for(model, model_path: str, version: str) -> CompiledForest:
+    """The .trees.npz next to model_path if it was compiled from this version, else compile now."""
+    path = compiled_path(model_path)
+    if os.path.exists(path):
+        try:
+            compiled = load_compiled(path)
+            if compiled.source_version == version:
+                return compiled
+        except (OSError, ValueError, KeyError):
+            pass
+    return compile_forest(model, source_version=version)
+
+
+def max_abs_error(model, compiled: CompiledForest, X) -> float:
+    """Largest |estimator − compiled| over X (probabilities for classifiers)."""
+    if compiled.is_classifier:
+        expected, actual = model.predict_proba(X), compiled.predict_proba(X)
+    else:
+        expected, actual = model.predict(X), compiled.predict(X)
+    return float(np.max(np.abs(np.asarray(expected, dtype=np.float64) - actual)))
+
+
+def main(paths: list):
+    import joblib
+
+    for model_path in paths:
+        model = joblib.load(model_path)
+        compiled = compile_forest(model, source_version=artifact_version(model_path))
+        X = np.random.default_rng(0).random((256, compiled.n_features)) * 100
+        error = max_abs_error(model, compiled, X)
+        out = compiled_path(model_path)
+        compiled.save(out)
+        info = compiled.report()
+        print(f"{model_path} → {out}: {info['trees']} trees, {info['nodes']} nodes, "
+              f"depth {info['max_depth']}, {info['bytes'] / 2**20:.2f} MB, max |error| {error:.3g}")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        sys.exit("usage: python tree_compiler.py MODEL.pkl [MODEL.pkl ...]")
+    main(sys.argv[1:])
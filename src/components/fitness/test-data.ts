@@ -26,6 +26,8 @@ export type FitnessTestKey =
 
 export type FitnessTest = {
   key: FitnessTestKey;
+  /** Column name the fitness model was trained on */
+  feature: string;
   name: string;
   quality: string;
   unit: string;
@@ -38,6 +40,7 @@ export type FitnessTest = {
 export const FITNESS_TESTS: FitnessTest[] = [
   {
     key: "height_cm",
+    feature: "Height_cm",
     name: "Height",
     quality: "Anthropometric",
     unit: "cm",
@@ -48,6 +51,7 @@ export const FITNESS_TESTS: FitnessTest[] = [
   },
   {
     key: "weight_kg",
+    feature: "Weight_kg",
     name: "Weight",
     quality: "Anthropometric",
     unit: "kg",
@@ -58,6 +62,7 @@ export const FITNESS_TESTS: FitnessTest[] = [
   },
   {
     key: "sit_reach_cm",
+    feature: "Sit_&_Reach_cm",
     name: "Sit & Reach",
     quality: "Flexibility",
     unit: "cm",
@@ -68,6 +73,7 @@ export const FITNESS_TESTS: FitnessTest[] = [
   },
   {
     key: "vertical_jump_cm",
+    feature: "Standing_Vertical_Jump_cm",
     name: "Standing Vertical Jump",
     quality: "Lower Body Strength",
     unit: "cm",
@@ -78,6 +84,7 @@ export const FITNESS_TESTS: FitnessTest[] = [
   },
   {
     key: "broad_jump_m",
+    feature: "Standing_Broad_Jump_m",
     name: "Standing Broad Jump",
     quality: "Lower Body Strength",
     unit: "m",
@@ -88,6 +95,7 @@ export const FITNESS_TESTS: FitnessTest[] = [
   },
   {
     key: "medicine_throw_m",
+    feature: "Medicine_Ball_Throw_m",
     name: "Medicine Ball Throw",
     quality: "Upper Body Strength",
     unit: "m",
@@ -98,6 +106,7 @@ export const FITNESS_TESTS: FitnessTest[] = [
   },
   {
     key: "sprint_30m_sec",
+    feature: "30m_Standing_Start_sec",
     name: "30m Standing Start",
     quality: "Speed",
     unit: "sec",
@@ -108,6 +117,7 @@ export const FITNESS_TESTS: FitnessTest[] = [
   },
   {
     key: "shuttle_4x10_sec",
+    feature: "4x10m_Shuttle_Run_sec",
     name: "4×10m Shuttle Run",
     quality: "Agility",
     unit: "sec",
@@ -118,6 +128,7 @@ export const FITNESS_TESTS: FitnessTest[] = [
   },
   {
     key: "situps_count",
+    feature: "Sit_Ups_count",
     name: "Sit Ups",
     quality: "Core Strength",
     unit: "count",
@@ -128,6 +139,7 @@ export const FITNESS_TESTS: FitnessTest[] = [
   },
   {
     key: "endurance_min",
+    feature: "800m_Run_min",
     name: "800m / 1.6km Run",
     quality: "Endurance",
     unit: "min",
@@ -36,10 +36,14 @@ export default function PlayerFitnessAssessmentPage() {
     try {
       setLoading(true);
       setResult(null);
+      // Send the model's own column names so the body passes strict validation
+      const valueDict = Object.fromEntries(
+        FITNESS_TESTS.map((t) => [t.feature, values[t.key]])
+      );
       const res = await fetch("http://127.0.0.1:8000/predict/fitness", {
         method: "POST",
         headers: { "Content-Type": "application/json" },
-        body: JSON.stringify({ value_dict: values }),
+        body: JSON.stringify({ value_dict: valueDict }),
       });
       if (!res.ok) throw new Error("Failed to evaluate");
       const data = await res.json();
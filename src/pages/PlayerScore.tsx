@@ -2,6 +2,39 @@ import { motion } from "framer-motion";
 import { BarChart3, CloudSun, Sparkles, Trophy } from "lucide-react";
 import { useState } from "react";
 
+// One-hot columns of the performance model; the first category of each field
+// (All-Rounder, ODI, Dry, Away, Cloudy) is the all-zero baseline.
+const ONE_HOT_COLUMNS = new Set([
+  "role_Batsman",
+  "role_Bowler",
+  "role_Wicket-Keeper",
+  "match_format_T10",
+  "match_format_T20",
+  "pitch_type_Dusty",
+  "pitch_type_Flat",
+  "pitch_type_Grassy",
+  "pitch_type_Green",
+  "pitch_type_Hard",
+  "pitch_type_Spinning",
+  "venue_type_Home",
+  "venue_type_Neutral",
+  "weather_condition_Humid",
+  "weather_condition_Overcast",
+  "weather_condition_Sunny",
+]);
+
+// Form state → the model's numeric feature columns (strict validation rejects
+// strings, booleans and unknown keys)
+const toModelFeatures = (data: Record<string, string | number | boolean>) => {
+  const features: Record<string, number> = {};
+  for (const [key, value] of Object.entries(data)) {
+    if (typeof value === "boolean") features[key] = value ? 1 : 0;
+    else if (typeof value === "number") features[key] = value;
+    else if (ONE_HOT_COLUMNS.has(`${key}_${value}`)) features[`${key}_${value}`] = 1;
+  }
+  return features;
+};
+
 const PlayerScore = () => {
   const [formData, setFormData] = useState({
     player_name: "",
@@ -54,7 +87,7 @@ const PlayerScore = () => {
         {
           method: "POST",
           headers: { "Content-Type": "application/json" },
-          body: JSON.stringify(formData),
+          body: JSON.stringify(toModelFeatures(formData)),
         }
       );
 